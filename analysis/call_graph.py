@@ -0,0 +1,45 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tree.ast_nodes import *
+
+def call_graph(program):
+    """Function name to the set of function names its body calls, "main" included."""
+    graph = {}
+    for declaration in program.declarations:
+        if isinstance(declaration, FunctionStatement):
+            name = declaration.name
+        elif isinstance(declaration, MainFunctionStatement):
+            name = "main"
+        else:
+            continue
+        callees = graph.setdefault(name, set())
+        pending = [declaration.body]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, list):
+                pending.extend(node)
+            elif hasattr(node, "__dict__"):
+                if isinstance(node, FunctionCall):
+                    callees.add(node.name)
+                pending.extend(value for value in vars(node).values() if isinstance(value, list) or hasattr(value, "__dict__"))
+    return graph
+
+def recursive_functions(graph):
+    """Names of the functions that can reach themselves through `graph`."""
+    recursive = set()
+    for name in graph:
+        seen = set()
+        pending = list(graph[name])
+        while pending:
+            callee = pending.pop()
+            if callee == name:
+                recursive.add(name)
+                break
+            if callee in seen:
+                continue
+            seen.add(callee)
+            pending.extend(graph.get(callee, ()))
+    return recursive
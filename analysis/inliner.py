@@ -0,0 +1,212 @@
+import sys
+import os
+import copy
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tree.ast_nodes import *
+from analysis.call_graph import recursive_functions
+
+# Largest function body, in expression nodes, that is copied into callers
+DEFAULT_INLINE_BUDGET = 16
+
+class Inliner:
+    """
+    Replaces calls to small functions with a copy of the function's body.
+
+    A function can be inlined when its body is a single `f := expression`
+    or `return expression` over scalar parameters, the expression reads
+    nothing but those parameters and fits in the budget, and it cannot
+    reach itself through other inlinable functions. A call is inlined when
+    its arguments have the parameter types and moving them into the body
+    keeps their meaning: arguments must not call functions, and one used
+    more than once must be a literal or a variable.
+
+    The argument of a parameter the body never reads is dropped, it is not
+    evaluated at all. That is only safe because arguments with calls or
+    read builtins are refused above, the only expressions with an effect;
+    the purity analysis of @memo checks each dropped argument again.
+
+    Runs after the checker, on the merged program, so imported functions
+    are inlined like local ones. The resolver bindings and checker types of
+    the copied nodes are filled in, the code generator needs no new pass.
+    """
+    def __init__(self, resolver, expression_types, purity, budget=DEFAULT_INLINE_BUDGET):
+        self.resolver = resolver
+        self.expression_types = expression_types
+        self.purity = purity
+        self.budget = budget
+        self.candidates = {}  # Function name to (function node, body expression, parameter symbols)
+        self.report = []
+        # The replaced calls stay referenced, so their ids are never reused
+        # by new nodes while the tables keyed by id still hold them
+        self.replaced = []
+
+    def inline_program(self, program):
+        for declaration in program.declarations:
+            if isinstance(declaration, FunctionStatement):
+                expression = self.inlinable_body(declaration)
+                if expression is not None:
+                    params = self.resolver.parameters.get(id(declaration), [])
+                    self.candidates[declaration.name] = (declaration, expression, params)
+        self.drop_cycles()
+
+        for declaration in program.declarations:
+            if isinstance(declaration, FunctionStatement):
+                self.inline_calls(declaration.body, declaration.name)
+            elif isinstance(declaration, MainFunctionStatement):
+                self.inline_calls(declaration.body, "main")
+        return self
+
+    def inlinable_body(self, function):
+        body = function.body
+        if function.annotations or function.return_type not in ("int", "float", "double", "bool") or len(body) != 3:
+            return None
+        # The parser wraps every body in `var f := default; ...; return f`
+        statement = body[1]
+        if isinstance(statement, AssignmentStatement) and statement.target == function.name:
+            expression = statement.value
+        elif isinstance(statement, ReturnStatement) and statement.value is not None:
+            expression = statement.value
+        else:
+            return None
+
+        params = self.resolver.parameters.get(id(function), [])
+        if any(isinstance(param.data_type, list) for param in params):
+            return None
+        size = 0
+        for node in self.expression_nodes(expression):
+            size += 1
+            if isinstance(node, (VariableReference, ArrayAccess)):
+                if self.resolver.symbol_for(node) not in params:
+                    return None
+            elif isinstance(node, FunctionCall):
+                if self.resolver.symbol_for(node) is None or node.name == function.name:
+                    return None
+            elif not isinstance(node, (BinaryExpression, UnaryExpression, Literal)):
+                return None
+            if size > self.budget:
+                return None
+        if self.expression_types.get(id(expression)) != function.return_type:
+            return None
+        return expression
+
+    def drop_cycles(self):
+        # Functions that reach themselves through other candidates would
+        # keep expanding, none of them are inlined
+        calls = {
+            name: {node.name for node in self.expression_nodes(expression) if isinstance(node, FunctionCall)}
+            for name, (_, expression, _) in self.candidates.items()
+        }
+        for name in recursive_functions(calls):
+            del self.candidates[name]
+
+    def expression_nodes(self, expression):
+        pending = [expression]
+        while pending:
+            node = pending.pop()
+            yield node
+            if isinstance(node, BinaryExpression):
+                pending.append(node.right)
+                pending.append(node.left)
+            elif isinstance(node, UnaryExpression):
+                pending.append(node.operand)
+            elif isinstance(node, FunctionCall):
+                pending.extend(reversed(node.arguments))
+            elif isinstance(node, ArrayAccess):
+                pending.extend(reversed(node.index))
+
+    def inline_calls(self, body, caller):
+        # Post-order on an explicit stack: arguments are inlined before the
+        # call that receives them, and an inlined copy is walked again
+        pending = [(None, None, body, False)]
+        while pending:
+            parent, key, node, children_done = pending.pop()
+            if children_done:
+                replacement = self.inline_call(node, caller) if isinstance(node, FunctionCall) else None
+                if replacement is not None:
+                    if isinstance(parent, list):
+                        parent[key] = replacement
+                    else:
+                        setattr(parent, key, replacement)
+                    pending.append((parent, key, replacement, False))
+                continue
+            pending.append((parent, key, node, True))
+            if isinstance(node, list):
+                children = enumerate(node)
+            elif hasattr(node, "__dict__"):
+                children = vars(node).items()
+            else:
+                continue
+            for child_key, child in children:
+                if isinstance(child, list) or hasattr(child, "__dict__"):
+                    pending.append((node, child_key, child, False))
+
+    def inline_call(self, call, caller):
+        candidate = self.candidates.get(call.name)
+        if candidate is None or self.resolver.symbol_for(call) is not self.resolver.functions.get(call.name):
+            return None
+        function, expression, params = candidate
+        if len(call.arguments) != len(params):
+            return None
+
+        uses = {param: 0 for param in params}
+        body_calls = False
+        for node in self.expression_nodes(expression):
+            if isinstance(node, VariableReference):
+                uses[self.resolver.symbol_for(node)] += 1
+            elif isinstance(node, FunctionCall):
+                body_calls = True
+
+        for param, argument in zip(params, call.arguments):
+            if self.expression_types.get(id(argument)) != param.data_type:
+                return None
+            for node in self.expression_nodes(argument):
+                # Copies could run these more or less often, or out of order
+                if isinstance(node, (FunctionCall, ReadExpression, ReadIntoExpression)):
+                    return None
+                # A call in the body could change a global before the copy reads it
+                symbol = self.resolver.symbol_for(node)
+                if body_calls and symbol is not None and symbol.storage == "global":
+                    return None
+            if uses[param] > 1 and not isinstance(argument, (Literal, VariableReference)):
+                return None
+            # Unused arguments are dropped, the checks above keep them free of effects
+            assert uses[param] > 0 or self.purity.expression_effect(argument) is None, \
+                f"dropped argument of '{call.name}' {self.purity.expression_effect(argument)}"
+
+        arguments = dict(zip(params, call.arguments))
+        replacement = self.copy_expression(expression, arguments, set())
+        self.replaced.append(call)
+        self.report.append(f"{caller}: inlined call to '{call.name}'")
+        return replacement
+
+    def copy_expression(self, expression, arguments, moved):
+        # The body is within the budget, so this recursion stays shallow
+        if isinstance(expression, VariableReference):
+            # The first use takes the argument itself, later uses a copy
+            param = self.resolver.symbol_for(expression)
+            if param in moved:
+                return self.copy_node(arguments[param])
+            moved.add(param)
+            return arguments[param]
+        node = copy.copy(expression)
+        if isinstance(node, BinaryExpression):
+            node.left = self.copy_expression(expression.left, arguments, moved)
+            node.right = self.copy_expression(expression.right, arguments, moved)
+        elif isinstance(node, UnaryExpression):
+            node.operand = self.copy_expression(expression.operand, arguments, moved)
+        elif isinstance(node, FunctionCall):
+            node.arguments = [self.copy_expression(argument, arguments, moved) for argument in expression.arguments]
+        return self.share_tables(expression, node)
+
+    def copy_node(self, original):
+        # Literals and variables used more than once are copied, each copy
+        # is its own node
+        return self.share_tables(original, copy.copy(original))
+
+    def share_tables(self, original, node):
+        for table in (self.expression_types, self.resolver.bindings):
+            if id(original) in table:
+                table[id(node)] = table[id(original)]
+        return node
@@ -0,0 +1,142 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tree.ast_nodes import *
+
+SCALAR_TYPES = ("int", "float", "double", "bool")
+
+class PurityAnalysis:
+    """
+    Decides which functions always return the same result for the same
+    arguments and have no visible side effects, so a call can be answered
+    from a cache. A function is pure when:
+
+    - its parameters and return value are scalars
+    - it does not print, read input, or write or read a mutable global
+    - every function it calls is pure (externals never are)
+    """
+    def __init__(self, resolver):
+        self.resolver = resolver
+        self.impure = {}  # Function name to the reason it is not pure
+        self.calls = {}  # Function name to the names it calls
+        self.self_calls = {}  # Function name to the ids of its calls to itself
+
+    def analyze(self, program):
+        functions = [d for d in program.declarations if isinstance(d, FunctionStatement)]
+        for declaration in program.declarations:
+            if isinstance(declaration, FunctionDeclaration):
+                self.impure[declaration.name] = "external function"
+        for function in functions:
+            reason = self.local_reason(function)
+            if reason is not None:
+                self.impure[function.name] = reason
+
+        # A call to an impure function makes the caller impure, until nothing changes
+        changed = True
+        while changed:
+            changed = False
+            for function in functions:
+                if function.name in self.impure:
+                    continue
+                for callee in self.calls.get(function.name, ()):
+                    if callee in self.impure or callee not in self.resolver.functions:
+                        self.impure[function.name] = f"calls impure function '{callee}'"
+                        changed = True
+                        break
+        return self
+
+    def is_pure(self, name):
+        return name in self.resolver.functions and name not in self.impure
+
+    def reason(self, name):
+        return self.impure.get(name)
+
+    def is_constant(self, symbol):
+        # val arrays can still have their elements assigned, and an invalid
+        # assignment to a val scalar is still compiled
+        return (symbol.immutable or symbol.var_kind == "val") and not symbol.mutated
+
+    def expression_effect(self, expression):
+        # Why evaluating the expression could be seen, None when dropping it changes nothing
+        pending = [expression]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, (ReadExpression, ReadIntoExpression)):
+                return "reads input"
+            elif isinstance(node, FunctionCall):
+                if not self.is_pure(node.name):
+                    return f"calls impure function '{node.name}'"
+                pending.extend(node.arguments)
+            elif isinstance(node, ArrayAccess):
+                pending.extend(node.index)
+            elif isinstance(node, BinaryExpression):
+                pending.append(node.left)
+                pending.append(node.right)
+            elif isinstance(node, UnaryExpression):
+                pending.append(node.operand)
+        return None
+
+    def local_reason(self, function):
+        if function.return_type not in SCALAR_TYPES:
+            return f"returns {function.return_type}"
+        for param in self.resolver.parameters.get(id(function), []):
+            if param.data_type not in SCALAR_TYPES:
+                return f"parameter '{param.name}' is not a scalar"
+
+        calls = set()
+        self_calls = set()
+        self.calls[function.name] = calls
+        self.self_calls[function.name] = self_calls
+
+        # Statements and expressions share one explicit stack
+        pending = list(function.body)
+        while pending:
+            node = pending.pop()
+            if isinstance(node, list):
+                pending.extend(node)
+            elif isinstance(node, (PrintStatement, PrintfStatement)):
+                return "prints"
+            elif isinstance(node, (ReadExpression, ReadIntoExpression)):
+                return "reads input"
+            elif isinstance(node, MappedArrayDeclaration):
+                return "maps a file"
+            elif isinstance(node, (AssignmentStatement, ArrayAssignmentStatement)):
+                symbol = self.resolver.symbol_for(node)
+                if symbol is not None and symbol.storage == "global":
+                    return f"writes global '{symbol.name}'"
+                pending.append(node.value)
+                if isinstance(node, ArrayAssignmentStatement):
+                    pending.extend(node.index)
+            elif isinstance(node, (VariableReference, ArrayAccess)):
+                symbol = self.resolver.symbol_for(node)
+                if symbol is not None and symbol.storage == "global" and not self.is_constant(symbol):
+                    return f"reads mutable global '{symbol.name}'"
+                if isinstance(node, ArrayAccess):
+                    pending.extend(node.index)
+            elif isinstance(node, FunctionCall):
+                calls.add(node.name)
+                if node.name == function.name:
+                    self_calls.add(id(node))
+                pending.extend(node.arguments)
+            elif isinstance(node, (VariableDeclaration, ReturnStatement)):
+                if node.value is not None:
+                    pending.append(node.value)
+            elif isinstance(node, ArrayDeclaration):
+                pending.append(node.value)
+            elif isinstance(node, ExpressionStatement):
+                pending.append(node.expression)
+            elif isinstance(node, IfStatement):
+                pending.append(node.condition)
+                pending.append(node.then_block or [])
+                pending.append(node.else_block or [])
+            elif isinstance(node, (WhileStatement, DoWhileStatement)):
+                pending.append(node.condition)
+                pending.append(node.body)
+            elif isinstance(node, BinaryExpression):
+                pending.append(node.left)
+                pending.append(node.right)
+            elif isinstance(node, UnaryExpression):
+                pending.append(node.operand)
+        return None
@@ -0,0 +1,71 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tree.ast_nodes import *
+
+def find_self_tail_calls(function_node, resolver):
+    """
+    Returns the ids of the calls in `function_node` that call the function
+    itself as the last thing it does, so they can be lowered to a jump back
+    to its start:
+
+    - `return f(...)` anywhere in the body
+    - `f := f(...)` as the last statement before the implicit `return f`
+    - `f(...)` as the last statement of a void function
+
+    An `if` in last position passes that position on to both of its blocks.
+    """
+    name = function_node.name
+    parameters = resolver.parameters.get(id(function_node), [])
+    if any(isinstance(param.data_type, list) for param in parameters):
+        # Array parameters are SSA pointers, there is no slot to overwrite
+        return set()
+
+    def is_self_call(expression):
+        return (
+            isinstance(expression, FunctionCall)
+            and expression.name == name
+            and resolver.symbol_for(expression) is resolver.functions.get(name)
+            and len(expression.arguments) == len(parameters)
+        )
+
+    tail_calls = set()
+    body = function_node.body
+    returns_value = function_node.return_type != "void"
+    result_symbol = resolver.declarations.get(id(body[0])) if returns_value and body else None
+
+    # Every return statement leaves the function
+    pending = [body]
+    while pending:
+        statements = pending.pop()
+        for statement in statements or []:
+            if isinstance(statement, ReturnStatement) and is_self_call(statement.value):
+                tail_calls.add(id(statement.value))
+            elif isinstance(statement, IfStatement):
+                pending.append(statement.then_block)
+                pending.append(statement.else_block)
+            elif isinstance(statement, (WhileStatement, DoWhileStatement)):
+                pending.append(statement.body)
+
+    # The statement that runs last before falling off the end of the body
+    pending = [body[:-1] if returns_value else body]
+    while pending:
+        statements = pending.pop()
+        if not statements:
+            continue
+        last = statements[-1]
+        if isinstance(last, IfStatement):
+            pending.append(last.then_block)
+            pending.append(last.else_block)
+        elif (
+            returns_value
+            and isinstance(last, AssignmentStatement)
+            and resolver.symbol_for(last) is result_symbol
+            and is_self_call(last.value)
+        ):
+            tail_calls.add(id(last.value))
+        elif not returns_value and isinstance(last, ExpressionStatement) and is_self_call(last.expression):
+            tail_calls.add(id(last.expression))
+    return tail_calls
@@ -0,0 +1,67 @@
+"""
+Measures code generation for table-driven programs: a [[int]] lookup table
+initialised from a literal, read in a loop. Reports codegen time, the total
+IR size, and the number of instructions run on function entry to set the
+table up.
+
+Usage: python benchmarks/bench_array_literals.py [max_entries]
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from grammar.grammar import parser
+from resolver.resolver import Resolver
+from checker.checker import Analyzer
+from gen_llvm_ir.generator import LLVMIRGenerator
+
+def table_program(entries, kind):
+    rows = entries // 10
+    table = ", ".join("[" + ", ".join(str((r * 10 + c) % 97) for c in range(10)) + "]" for r in range(rows))
+    update = "table[0][0] := 1;" if kind == "var" else ""
+    return f"""
+    function main(val args:[string]) {{
+        {kind} table : [[int]] := [{table}];
+        {update}
+        var i : int := 0;
+        var sum : int := 0;
+        while i < {rows} {{
+            sum := sum + table[i][i % 10];
+            i := i + 1;
+        }}
+        print_int(sum);
+    }}
+    """
+
+def entry_instructions(ir):
+    # Instructions in main before the first loop label
+    count = 0
+    in_main = False
+    for line in ir.splitlines():
+        if line.startswith("define") and "@main" in line:
+            in_main = True
+        elif in_main and line.strip().endswith(":"):
+            break
+        elif in_main:
+            count += 1
+    return count
+
+def run(max_entries):
+    print(f"{'entries':>8} {'kind':>5} {'codegen ms':>11} {'IR bytes':>10} {'entry instrs':>13}")
+    entries = 1000
+    while entries <= max_entries:
+        for kind in ("val", "var"):
+            program = parser.parse(table_program(entries, kind))
+            resolver = Resolver().resolve_program(program)
+            analyzer = Analyzer(resolver)
+            analyzer.check_program(program)
+            start = time.perf_counter()
+            ir = LLVMIRGenerator(program, resolver, analyzer.expression_types).generate()
+            elapsed = time.perf_counter() - start
+            print(f"{entries:>8} {kind:>5} {elapsed * 1e3:>11.2f} {len(ir):>10} {entry_instructions(ir):>13}")
+        entries *= 10
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
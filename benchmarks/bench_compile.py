@@ -0,0 +1,60 @@
+"""
+Compiles a large generated program end to end through compile_program and
+captures the compiler profiles: cProfile statistics, written as .pstats
+next to the generated source with the top functions printed, and the
+allocations of each compiler stage.
+
+Usage: python benchmarks/bench_compile.py [functions] [top]
+"""
+import sys
+import os
+import io
+import time
+import tempfile
+from contextlib import redirect_stdout
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from compiler import compile_program, profile_compile_program, alloc_profile_compile_program
+
+def large_program(functions):
+    # Loops, branches and calls, so every stage has work to do
+    bodies = []
+    for i in range(functions):
+        bodies.append(f"""
+    function f{i}(val n : int) : int {{
+        var total : int := 0;
+        var i : int := 0;
+        while i < n {{
+            if i % {i % 5 + 2} == 0 {{
+                total := total + i * {i % 7};
+            }} else {{
+                total := total - {i % 3};
+            }}
+            i := i + 1;
+        }}
+        f{i} := total;
+    }}""")
+    calls = " + ".join(f"f{i}({i % 50})" for i in range(min(functions, 50)))
+    return "".join(bodies) + f"""
+    function main(val args:[string]) {{
+        print_int({calls});
+    }}
+    """
+
+def run(functions, top):
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "large.pl")
+        with open(source, "w") as f:
+            f.write(large_program(functions))
+        # compile_program prints the .ll path, the reports go to stderr
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            compile_program(source)
+            elapsed = time.perf_counter() - start
+            print(f"{functions} functions compiled in {elapsed * 1e3:.1f} ms", file=sys.stderr)
+            profile_compile_program(source, top=top)
+            alloc_profile_compile_program(source, top=top)
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500, int(sys.argv[2]) if len(sys.argv) > 2 else 10)
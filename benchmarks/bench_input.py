@@ -0,0 +1,146 @@
+"""
+Measures how fast PLush programs parse numbers from stdin with the
+readers of runtime/plush_io.c, in MB of input per second. A file of
+random ints and one of random doubles are summed:
+
+- one read_int() or read_double() call per number
+- read_ints_into / read_doubles_into filling a 4096-element chunk
+
+A C program calling scanf per number, and one that only read(2)s the
+input, are timed on the same files for comparison. All programs must
+print the same sum.
+
+Needs `opt` and `llc` (LLVM 14) and a C compiler, `cc` unless given, on the PATH.
+
+Usage: python benchmarks/bench_input.py [numbers] [C compiler]
+"""
+import sys
+import os
+import time
+import random
+import subprocess
+import tempfile
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bench_io import build
+
+CHUNK = 4096
+
+def one_at_a_time(read_type):
+    zero = "0" if read_type == "int" else "0.0"
+    return f"""
+    function main(val args:[string]) {{
+        var total : {read_type} := {zero};
+        var count : int := read_int();
+        var i : int := 0;
+        while i < count {{
+            total := total + read_{read_type}();
+            i := i + 1;
+        }}
+        print_{read_type}(total);
+    }}
+    """
+
+def chunked(read_type):
+    zero = "0" if read_type == "int" else "0.0"
+    return f"""
+    function main(val args:[string]) {{
+        var chunk : [{CHUNK}]{read_type};
+        var total : {read_type} := {zero};
+        var count : int := read_int();
+        var got : int := read_{read_type}s_into(chunk, {CHUNK});
+        while got > 0 {{
+            var i : int := 0;
+            while i < got {{
+                total := total + chunk[i];
+                i := i + 1;
+            }}
+            got := read_{read_type}s_into(chunk, {CHUNK});
+        }}
+        print_{read_type}(total);
+    }}
+    """
+
+def scanf_program(read_type):
+    c_type, conversion, output = ("int", "%d", "%d\\n") if read_type == "int" else ("double", "%lf", "%f\\n")
+    return f"""
+    #include <stdio.h>
+    int main(void) {{
+        int count;
+        {c_type} value, total = 0;
+        if (scanf("%d", &count) != 1) return 1;
+        for (int i = 0; i < count && scanf("{conversion}", &value) == 1; i++)
+            total = ({c_type})(total + value);
+        printf("{output}", total);
+        return 0;
+    }}
+    """
+
+READ_ONLY_PROGRAM = """
+    #include <unistd.h>
+    int main(void) {
+        static char buffer[1 << 16];
+        while (read(0, buffer, sizeof buffer) > 0) {}
+        return 0;
+    }
+"""
+
+def write_input(path, read_type, numbers):
+    random.seed(1)
+    if read_type == "int":
+        values = (str(random.randint(-1000000, 1000000)) for _ in range(numbers))
+    else:
+        values = (f"{random.uniform(-1000, 1000):.6f}" for _ in range(numbers))
+    with open(path, "w") as f:
+        f.write(f"{numbers}\n")
+        f.write("\n".join(values))
+        f.write("\n")
+
+def build_c(source, directory, name, cc):
+    path = os.path.join(directory, f"{name}.c")
+    with open(path, "w") as f:
+        f.write(source)
+    executable = os.path.join(directory, name)
+    subprocess.run([cc, "-O2", path, "-o", executable], check=True)
+    return executable
+
+def timed_run(executable, input_path):
+    """Fastest of a few runs on the input, and what the program printed."""
+    best = None
+    with open(input_path, "rb") as stdin:
+        for _ in range(3):
+            stdin.seek(0)
+            start = time.perf_counter()
+            # main returns void, its exit status is whatever was left in the register
+            output = subprocess.run([executable], stdin=stdin, stdout=subprocess.PIPE).stdout
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    return best, output
+
+def run(numbers, cc):
+    with tempfile.TemporaryDirectory() as directory:
+        read_only = build_c(READ_ONLY_PROGRAM, directory, "read-only", cc)
+        print(f"{numbers} numbers, best of 3 runs")
+        print(f"{'input':>7} {'program':>20} {'time':>9} {'MB/s':>8}")
+        for read_type in ("int", "double"):
+            input_path = os.path.join(directory, f"{read_type}s.txt")
+            write_input(input_path, read_type, numbers)
+            megabytes = os.path.getsize(input_path) / 1e6
+            programs = [
+                (f"read_{read_type}()", build(one_at_a_time(read_type), directory, f"one-{read_type}", cc, False)),
+                (f"read_{read_type}s_into", build(chunked(read_type), directory, f"chunked-{read_type}", cc, False)),
+                ("C scanf", build_c(scanf_program(read_type), directory, f"scanf-{read_type}", cc)),
+                ("C read(2) only", read_only),
+            ]
+            expected = None
+            for label, executable in programs:
+                elapsed, output = timed_run(executable, input_path)
+                if executable != read_only:
+                    if expected is not None and output != expected:
+                        raise Exception(f"{label} printed {output!r}, expected {expected!r}")
+                    expected = output
+                print(f"{read_type + 's':>7} {label:>20} {elapsed * 1e3:7.1f}ms {megabytes / elapsed:8.1f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000000, sys.argv[2] if len(sys.argv) > 2 else "cc")
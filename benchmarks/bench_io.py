@@ -0,0 +1,97 @@
+"""
+Times output-heavy programs built with printf per print and with
+--buffered-io, which prints through runtime/plush_io.c. Each program
+prints ints, doubles, strings or a mix of them in a loop; both builds
+write to a file and their outputs must be identical.
+
+Needs `opt` and `llc` (LLVM 14) and a C compiler, `cc` unless given, on the PATH.
+
+Usage: python benchmarks/bench_io.py [lines] [C compiler]
+"""
+import sys
+import os
+import time
+import subprocess
+import tempfile
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from grammar.grammar import parser
+from resolver.resolver import Resolver
+from checker.checker import Analyzer
+from gen_llvm_ir.generator import LLVMIRGenerator
+
+RUNTIME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "runtime", "plush_io.c")
+RUNS = 5
+
+PRINTS = {
+    "ints": "print_int(i * 7919 - 50000);",
+    "doubles": "print_double(x * i);",
+    "strings": 'print_string("the quick brown fox");',
+    "mixed": 'print_int(i); print_double(x * i); print_string("-");',
+}
+
+def output_program(lines, prints):
+    return f"""
+    function main(val args:[string]) {{
+        var i : int := 0;
+        var x : double := 0.25;
+        while i < {lines} {{
+            {prints}
+            i := i + 1;
+        }}
+    }}
+    """
+
+def build(source, directory, name, cc, buffered_io):
+    program = parser.parse(source)
+    resolver = Resolver().resolve_program(program)
+    analyzer = Analyzer(resolver)
+    analyzer.check_program(program)
+    generator = LLVMIRGenerator(program, resolver, analyzer.expression_types, buffered_io=buffered_io)
+    ir = generator.generate()
+    ir_path = os.path.join(directory, f"{name}.ll")
+    with open(ir_path, "w") as f:
+        f.write(ir)
+    # Optimized like plush's clang -O2 would
+    subprocess.run(["opt", "-O2", "-S", ir_path, "-o", ir_path], check=True)
+    subprocess.run(["llc", "-O2", "-relocation-model=pic", ir_path, "-o", f"{ir_path[:-3]}.s"], check=True)
+    # Linked when the program calls it, like the plush driver does
+    sources = [f"{ir_path[:-3]}.s"] + ([RUNTIME] if generator.uses_io_runtime() else [])
+    executable = os.path.join(directory, name)
+    subprocess.run([cc, "-O2", *sources, "-o", executable, "-lm"], check=True)
+    return executable
+
+def best_time(executable, out_path):
+    # Fastest of a few runs, writing to a file like a redirected program would
+    best = None
+    for _ in range(RUNS):
+        with open(out_path, "wb") as out:
+            start = time.perf_counter()
+            # main returns void, its exit status is whatever was left in the register
+            subprocess.run([executable], stdout=out)
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def run(lines, cc):
+    print(f"{lines} iterations, best of {RUNS} runs")
+    print(f"{'program':>8} {'printf':>10} {'buffered':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, prints in PRINTS.items():
+            source = output_program(lines, prints)
+            times = []
+            outputs = []
+            for buffered_io in (False, True):
+                label = f"{name}-{'buffered' if buffered_io else 'printf'}"
+                executable = build(source, directory, label, cc, buffered_io)
+                out_path = os.path.join(directory, f"{label}.out")
+                times.append(best_time(executable, out_path))
+                with open(out_path, "rb") as f:
+                    outputs.append(f.read())
+            if outputs[0] != outputs[1]:
+                raise Exception(f"{name}: buffered output differs from printf")
+            print(f"{name:>8} {times[0] * 1e3:8.1f}ms {times[1] * 1e3:8.1f}ms {times[0] / times[1]:7.2f}x")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000, sys.argv[2] if len(sys.argv) > 2 else "cc")
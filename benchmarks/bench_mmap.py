@@ -0,0 +1,89 @@
+"""
+Measures how fast a PLush program sums a file of ints mapped with
+mmap_ints, in MB per second. The same numbers are summed as text from
+stdin with read_ints_into, and by a C program that mmaps the file, for
+comparison. All programs must print the same sum.
+
+The file is written once and read from the page cache afterwards, so the
+mapped runs time the access path, not the disk.
+
+Needs `opt` and `llc` (LLVM 14) and a C compiler, `cc` unless given, on the PATH.
+
+Usage: python benchmarks/bench_mmap.py [numbers] [C compiler]
+"""
+import sys
+import os
+import random
+import struct
+import tempfile
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bench_io import build
+from bench_input import chunked, build_c, timed_run
+
+def mapped(path):
+    return f"""
+    function main(val args:[string]) {{
+        val values : [int] := mmap_ints("{path}");
+        var total : int := 0;
+        var i : int := 0;
+        while i < array_length(values) {{
+            total := total + values[i];
+            i := i + 1;
+        }}
+        print_int(total);
+    }}
+    """
+
+def mmap_c_program(path):
+    return f"""
+    #include <fcntl.h>
+    #include <stdint.h>
+    #include <stdio.h>
+    #include <sys/mman.h>
+    #include <sys/stat.h>
+    int main(void) {{
+        int fd = open("{path}", O_RDONLY);
+        struct stat info;
+        if (fd < 0 || fstat(fd, &info) < 0) return 1;
+        const int32_t *values = mmap(NULL, info.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+        if (values == MAP_FAILED) return 1;
+        uint32_t total = 0;
+        for (size_t i = 0; i < info.st_size / sizeof *values; i++)
+            total += (uint32_t)values[i];
+        printf("%d\\n", (int32_t)total);
+        return 0;
+    }}
+    """
+
+def run(numbers, cc):
+    random.seed(1)
+    values = [random.randint(-1000000, 1000000) for _ in range(numbers)]
+    with tempfile.TemporaryDirectory() as directory:
+        binary_path = os.path.join(directory, "ints.bin")
+        with open(binary_path, "wb") as f:
+            f.write(struct.pack(f"<{numbers}i", *values))
+        text_path = os.path.join(directory, "ints.txt")
+        with open(text_path, "w") as f:
+            f.write(f"{numbers}\n")
+            f.write("\n".join(map(str, values)))
+            f.write("\n")
+        megabytes = os.path.getsize(binary_path) / 1e6
+        programs = [
+            ("mmap_ints", build(mapped(binary_path), directory, "mapped", cc, False), os.devnull),
+            ("read_ints_into (text)", build(chunked("int"), directory, "chunked", cc, False), text_path),
+            ("C mmap", build_c(mmap_c_program(binary_path), directory, "mmap-c", cc), os.devnull),
+        ]
+        print(f"{numbers} ints, {megabytes:.1f} MB as binary, best of 3 runs")
+        print(f"{'program':>22} {'time':>9} {'MB/s':>8}")
+        expected = None
+        for label, executable, input_path in programs:
+            elapsed, output = timed_run(executable, input_path)
+            if expected is not None and output != expected:
+                raise Exception(f"{label} printed {output!r}, expected {expected!r}")
+            expected = output
+            print(f"{label:>22} {elapsed * 1e3:7.1f}ms {megabytes / elapsed:8.1f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000000, sys.argv[2] if len(sys.argv) > 2 else "cc")
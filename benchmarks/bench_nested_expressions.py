@@ -0,0 +1,64 @@
+"""
+Times the type checker and the LLVM IR generator on a single expression
+nested to increasing depths. Both should grow linearly with the number of
+nodes; quadratic behaviour shows up as a rising time per node.
+
+Usage: python benchmarks/bench_nested_expressions.py [max_depth]
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from grammar.grammar import parser
+from resolver.resolver import Resolver
+from checker.checker import Analyzer
+from gen_llvm_ir.generator import LLVMIRGenerator
+
+def nested_program(depth):
+    expression = "x"
+    for i in range(depth):
+        expression = f"({expression} + {i % 7})"
+    return f"""
+    function main(val args:[string]) {{
+        var x : int := 1;
+        var y : int := {expression};
+        print_int(y);
+    }}
+    """
+
+def best_of(runs, function):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def run(max_depth):
+    print(f"{'depth':>8} {'check ms':>10} {'check us/node':>14} {'codegen ms':>11} {'codegen us/node':>16}")
+    depth = 100
+    while depth <= max_depth:
+        program = parser.parse(nested_program(depth))
+        resolver = Resolver().resolve_program(program)
+        nodes = 2 * depth + 1
+
+        def check():
+            Analyzer(resolver).check_program(program)
+
+        analyzer = Analyzer(resolver)
+        analyzer.check_program(program)
+
+        def generate():
+            LLVMIRGenerator(program, resolver, analyzer.expression_types).generate()
+
+        check_time = best_of(3, check)
+        codegen_time = best_of(3, generate)
+        print(f"{depth:>8} {check_time * 1e3:>10.2f} {check_time * 1e6 / nodes:>14.2f} "
+              f"{codegen_time * 1e3:>11.2f} {codegen_time * 1e6 / nodes:>16.2f}")
+        depth *= 2
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 3200)
@@ -0,0 +1,113 @@
+"""
+Measures what recording source spans costs per AST node. A large program
+is parsed three ways and the memory the result keeps alive is compared:
+
+- without spans
+- with a SourceMap: one `span` index per node plus its file, start and
+  end in parallel arrays
+- with the offsets as two attributes on every node, for comparison
+
+Parse times are shown as well, spans need PLY's position tracking.
+
+Usage: python benchmarks/bench_source_map.py [statements]
+"""
+import sys
+import os
+import gc
+import time
+import subprocess
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from grammar.grammar import parser, parse
+from tree.source_map import SourceMap
+
+def large_program(statements):
+    body = "\n".join(f"        x := x + {i % 9} * (x - {i % 5});" for i in range(statements))
+    return f"""
+    function main(val args:[string]) {{
+        var x : int := 1;
+{body}
+        print_int(x);
+    }}
+    """
+
+def nodes(program):
+    found = []
+    pending = [program]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, list):
+            pending.extend(node)
+        elif hasattr(node, "__dict__"):
+            found.append(node)
+            pending.extend(value for value in vars(node).values() if isinstance(value, list) or hasattr(value, "__dict__"))
+    return found
+
+def retained(function):
+    """Bytes still allocated after `function` returns, with its result kept, and the result."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = function()
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before, result
+
+def node_offsets(source):
+    """(start, end) of every node in nodes() order, None for nodes without a span."""
+    source_map = SourceMap()
+    return [
+        (source_map.starts[node.span], source_map.ends[node.span]) if hasattr(node, "span") else None
+        for node in nodes(parse(source, source_map))
+    ]
+
+def with_attributes(source, offsets):
+    # The same offsets stored on the nodes themselves
+    program = parser.parse(source)
+    for node, span in zip(nodes(program), offsets):
+        if span is not None:
+            node.start_offset, node.end_offset = span
+    return program
+
+CASES = {
+    "no spans": lambda source, offsets: parser.parse(source),
+    "source map": lambda source, offsets: (lambda source_map: (parse(source, source_map), source_map))(SourceMap()),
+    "two attributes": lambda source, offsets: with_attributes(source, offsets),
+}
+
+def measure(statements, name):
+    source = large_program(statements)
+    # Offsets for the attributes come from a parse of their own, outside the measurement
+    offsets = node_offsets(source) if name == "two attributes" else None
+    function = lambda: CASES[name](source, offsets)
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    size, result = retained(function)
+    program = result[0] if isinstance(result, tuple) else result
+    return elapsed, size, len(nodes(program))
+
+def run(statements):
+    # Each case runs in its own interpreter: attributes added to nodes after
+    # construction change how CPython lays out the instance dicts of a
+    # class, one case would skew the next
+    print(f"{statements} statements")
+    baseline = None
+    for name in CASES:
+        output = subprocess.run([sys.executable, __file__, str(statements), name], capture_output=True, text=True, check=True)
+        elapsed, size, count = output.stdout.split()
+        elapsed, size, count = float(elapsed), int(size), int(count)
+        if baseline is None:
+            baseline = size
+        extra = (size - baseline) / count
+        print(f"{name:>15}: {elapsed * 1e3:8.1f} ms  {size / 2**20:7.2f} MiB  {count} nodes  +{extra:5.1f} bytes/node")
+
+if __name__ == "__main__":
+    statements = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    if len(sys.argv) > 2:
+        print(*measure(statements, sys.argv[2]))
+    else:
+        run(statements)
@@ -0,0 +1,59 @@
+"""
+Compares the peak memory and time of exporting a large AST as JSON by
+building the whole dict copy first (json.dumps of dataclass_to_dict) and by
+streaming it with write_ast_json. Output goes to a null sink so only the
+export itself is measured.
+
+Usage: python benchmarks/bench_tree_export.py [statements]
+"""
+import sys
+import os
+import json
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from grammar.grammar import parser
+from json_converter import dataclass_to_dict, write_ast_json
+
+class NullWriter:
+    def write(self, text):
+        return len(text)
+
+def large_program(statements):
+    body = "\n".join(f"        x := x + {i % 9} * (x - {i % 5});" for i in range(statements))
+    return f"""
+    function main(val args:[string]) {{
+        var x : int := 1;
+{body}
+        print_int(x);
+    }}
+    """
+
+def measure(function):
+    # Tracing slows allocation down, so time and memory come from separate runs
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+def run(statements):
+    program = parser.parse(large_program(statements))
+    sink = NullWriter()
+    cases = [
+        ("dumps indent=2", lambda: sink.write(json.dumps(dataclass_to_dict(program), indent=2))),
+        ("stream indent=2", lambda: write_ast_json(program, sink)),
+        ("stream compact", lambda: write_ast_json(program, sink, compact=True)),
+    ]
+    print(f"{statements} statements")
+    for name, function in cases:
+        elapsed, peak = measure(function)
+        print(f"{name:>16}: {elapsed * 1e3:9.1f} ms  peak {peak / 2**20:8.1f} MiB")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
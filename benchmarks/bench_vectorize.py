@@ -0,0 +1,153 @@
+"""
+Checks that LLVM's loop vectoriser fires on the IR emitted for simple
+array kernels: sums and copies over int and double arrays, both through
+array parameters and on a function's own arrays. Each kernel is compiled
+to IR, run through `opt -O2` with vectoriser remarks on, and the loops it
+vectorised are listed with their vector width.
+
+Needs `opt` (LLVM 14) on the PATH. The IR carries no target, so opt is
+given its own default one; without it the cost model sees no vector
+registers and vectorises nothing.
+
+The kernels are compiled twice, as-is and with --nsw --fast-math=reassoc:
+a double sum only vectorises once LLVM may reorder the additions.
+
+Usage: python benchmarks/bench_vectorize.py [opt binary]
+"""
+import sys
+import os
+import re
+import subprocess
+import tempfile
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from grammar.grammar import parser
+from resolver.resolver import Resolver
+from checker.checker import Analyzer
+from gen_llvm_ir.generator import LLVMIRGenerator
+
+N = 4096
+
+def kernels_program():
+    return f"""
+    function sum_int(val a : [int], val n : int) : int {{
+        var i : int := 0;
+        var total : int := 0;
+        while i < n {{
+            total := total + a[i];
+            i := i + 1;
+        }}
+        sum_int := total;
+    }}
+    function sum_double(val a : [double], val n : int) : double {{
+        var i : int := 0;
+        var total : double := 0.0;
+        while i < n {{
+            total := total + a[i];
+            i := i + 1;
+        }}
+        sum_double := total;
+    }}
+    function copy_double(val dst : [double], val src : [double], val n : int) : void {{
+        var i : int := 0;
+        while i < n {{
+            dst[i] := src[i];
+            i := i + 1;
+        }}
+    }}
+    function scale_double(val a : [double], val n : int, val k : double) : void {{
+        var i : int := 0;
+        while i < n {{
+            a[i] := a[i] * k;
+            i := i + 1;
+        }}
+    }}
+    function local_copy_int(val k : int) : int {{
+        var src : [{N}]int;
+        var dst : [{N}]int;
+        var i : int := 0;
+        while i < {N} {{
+            src[i] := i * k;
+            i := i + 1;
+        }}
+        i := 0;
+        while i < {N} {{
+            dst[i] := src[i];
+            i := i + 1;
+        }}
+        local_copy_int := dst[k];
+    }}
+    function main(val args:[string]) {{
+        var a : [{N}]int;
+        var x : [{N}]double;
+        var y : [{N}]double;
+        copy_double(y, x, {N});
+        scale_double(y, {N}, 2.0);
+        print_int(sum_int(a, {N}) + local_copy_int(7));
+        print_double(sum_double(y, {N}));
+    }}
+    """
+
+def default_target(opt):
+    version = subprocess.run([opt, "--version"], capture_output=True, text=True).stdout
+    match = re.search(r"Default target: (\S+)", version)
+    return match.group(1) if match else None
+
+def vectorized_loops(ir, opt, target):
+    with tempfile.NamedTemporaryFile("w", suffix=".ll", delete=False) as f:
+        f.write(ir)
+        path = f.name
+    try:
+        result = subprocess.run(
+            [opt, "-O2", f"-mtriple={target}", "-pass-remarks=loop-vectorize", "-disable-output", path],
+            capture_output=True, text=True,
+        )
+    finally:
+        os.unlink(path)
+    if result.returncode != 0:
+        raise Exception(result.stderr)
+    # remark: <file>:0:0: vectorized loop (vectorization width: 4, interleaved count: 2)
+    return re.findall(r"vectorized loop \(vectorization width: (\d+), interleaved count: (\d+)\)", result.stderr)
+
+def function_names(ir):
+    return re.findall(r"^define [^@]*@([\w.]+)\(", ir, re.MULTILINE)
+
+def run(opt):
+    program = parser.parse(kernels_program())
+    resolver = Resolver().resolve_program(program)
+    analyzer = Analyzer(resolver)
+    analyzer.check_program(program)
+    target = default_target(opt)
+    print(f"target: {target}")
+    print(f"{'function':>16} {'flags':>25} {'vectorized loops':>17} {'widths':>10}")
+    for label, flags in (("-", {}), ("--nsw --fast-math=reassoc", {"nsw": True, "fast_math": ("reassoc",)})):
+        # Exported, so opt cannot inline the kernels into main and fold them away
+        ir = LLVMIRGenerator(program, resolver, analyzer.expression_types, export_all=True, **flags).generate()
+        for name in function_names(ir):
+            if name == "main":
+                continue
+            # One function at a time, so each remark belongs to a known kernel
+            kernel_ir = keep_function(ir, name)
+            loops = vectorized_loops(kernel_ir, opt, target)
+            widths = ",".join(f"{width}x{count}" for width, count in loops) or "-"
+            print(f"{name:>16} {label:>25} {len(loops):>17} {widths:>10}")
+
+def keep_function(ir, name):
+    # Turn every other definition into a declaration
+    lines = []
+    skipping = False
+    for line in ir.splitlines():
+        match = re.match(r"^define ([^@]*)@([\w.]+)(\(.*\))[^{]*\{", line)
+        if match and match.group(2) != name:
+            linkage_and_type = match.group(1).replace("internal ", "").replace("dso_local ", "")
+            lines.append(f"declare {linkage_and_type}@{match.group(2)}{match.group(3)}")
+            skipping = True
+        elif skipping:
+            skipping = line != "}"
+        else:
+            lines.append(line)
+    return "\n".join(lines) + "\n"
+
+if __name__ == "__main__":
+    run(sys.argv[1] if len(sys.argv) > 1 else "opt")
@@ -0,0 +1,107 @@
+"""
+Runs every compiler phase on programs nested around 50k levels deep, at
+Python's default recursion limit. Each walker keeps its own stack, so the
+run must finish without a RecursionError and in roughly linear time.
+
+Usage: python benchmarks/stress_deep_nesting.py [depth]
+"""
+import sys
+import os
+import io
+import time
+import contextlib
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from grammar.grammar import parser
+from resolver.resolver import Resolver
+from checker.checker import Analyzer
+from gen_llvm_ir.generator import LLVMIRGenerator
+from print_tree import pretty_print
+from json_converter import dataclass_to_dict
+
+def nested_expression(depth):
+    expression = "x"
+    for i in range(depth):
+        expression = f"({expression} + {i % 7})"
+    return f"""
+    function main(val args:[string]) {{
+        var x : int := 1;
+        var y : int := {expression};
+        print_int(y);
+    }}
+    """
+
+def nested_ifs(depth):
+    body = "x := x + 1;"
+    for i in range(depth):
+        body = f"if x < {i} {{ {body} }}"
+    return f"""
+    function main(val args:[string]) {{
+        var x : int := 0;
+        {body}
+        print_int(x);
+    }}
+    """
+
+def else_if_chain(depth):
+    chain = "x := 0;"
+    for i in range(depth):
+        chain = f"if x == {i} {{ x := {i + 1}; }} else {{ {chain} }}"
+    return f"""
+    function main(val args:[string]) {{
+        var x : int := 3;
+        {chain}
+        print_int(x);
+    }}
+    """
+
+def large_array_literal(length):
+    values = ", ".join(str(i % 100) for i in range(length))
+    return f"""
+    function main(val args:[string]) {{
+        val a : [int] := [{values}];
+        print_int(a[2]);
+    }}
+    """
+
+def run_phases(source, pretty_source):
+    timings = []
+
+    def phase(name, function):
+        start = time.perf_counter()
+        result = function()
+        timings.append((name, time.perf_counter() - start))
+        return result
+
+    program = phase("parse", lambda: parser.parse(source))
+    resolver = phase("resolve", lambda: Resolver().resolve_program(program))
+    analyzer = Analyzer(resolver)
+    phase("check", lambda: analyzer.check_program(program))
+    phase("generate", lambda: LLVMIRGenerator(program, resolver, analyzer.expression_types).generate())
+    phase("dict", lambda: dataclass_to_dict(program))
+    if analyzer.errors:
+        raise Exception(f"Unexpected typecheck errors: {analyzer.errors[:3]}")
+
+    # Indentation makes the printed tree grow with depth squared, so it is
+    # printed from a shallower program built the same way
+    shallow = parser.parse(pretty_source)
+    with contextlib.redirect_stdout(io.StringIO()):
+        phase("pretty/10", lambda: pretty_print(shallow))
+    return timings
+
+def run(depth):
+    cases = [
+        ("nested expression", nested_expression),
+        ("nested ifs", nested_ifs),
+        ("else if chain", else_if_chain),
+        ("array literal", large_array_literal),
+    ]
+    print(f"depth {depth}, recursion limit {sys.getrecursionlimit()}")
+    for name, build in cases:
+        timings = run_phases(build(depth), build(depth // 10))
+        columns = "  ".join(f"{phase} {seconds * 1e3:8.1f} ms" for phase, seconds in timings)
+        print(f"{name:>18}: {columns}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
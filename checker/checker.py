@@ -4,281 +4,356 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from tree.ast_nodes import *
+from resolver.resolver import Resolver
+from tree.traversal import trampoline
+from analysis.purity import PurityAnalysis
+from tracing import Tracer
+
 class Analyzer:
-    def __init__(self):
-        self.symbol_table_stack = [{'immutable_vars': []}]  # A stack of dictionaries for scoping
+    def __init__(self, resolver=None, source_map=None, tracer=None):
+        # Name resolution is shared with the code generator; run it here
+        # when the caller did not resolve the program already
+        self.resolver = resolver
         self.functions = {}  # Function name to function return type
         self.current_function = None
         self.errors = []
-        # validation result is a dictionary that maps expressions with their types
-        self.validation_result = {}
+        # expression_types maps id(expression) to its type; each node is typed
+        # once and the table is handed to the code generator
+        self.expression_types = {}
+        self.purity = None
+        self.source_map = source_map  # Node spans, errors then start with file:line:column
+        self.tracer = tracer if tracer is not None else Tracer(enabled=False)
+
+    def report(self, node, message):
+        location = self.source_map.describe(node) if self.source_map is not None else None
+        self.errors.append(message if location is None else f"{location}: {message}")
 
     def check_program(self, program):
-        self.check_global_variables(program.global_variables)
+        if self.resolver is None:
+            self.resolver = Resolver().resolve_program(program)
+        self.errors.extend(self.resolver.errors)
+        self.purity = PurityAnalysis(self.resolver).analyze(program)
+        # The check_* walkers are generators driven on an explicit stack,
+        # so deeply nested programs cannot hit the recursion limit
+        trampoline(self.check_global_variables(program.global_variables))
         for declaration in program.declarations:
-            self.check_declaration(declaration)
+            with self.tracer.span(getattr(declaration, "name", "main"), "declaration"):
+                trampoline(self.check_declaration(declaration))
 
     def check_global_variables(self, globals):
         if globals:
             for var_decl in globals.declarations:
                 if isinstance(var_decl, ArrayDeclaration):
-                    self.check_array_declaration(var_decl)
+                    yield self.check_array_declaration(var_decl)
+                elif isinstance(var_decl, MappedArrayDeclaration):
+                    # The mapping is released when the function returns
+                    self.report(var_decl, f"Files can only be mapped inside functions, '{var_decl.name}' is global")
+                elif isinstance(var_decl, ArrayAllocation):
+                    pass  # Zero-filled, there is nothing to check
                 else:
-                    self.check_global_variable_declaration(var_decl)
+                    yield self.check_global_variable_declaration(var_decl)
     
     def check_global_variable_declaration(self, var_decl):
-        # Check if variable already declared in global scope
-        if var_decl.name in self.symbol_table_stack[0]:
-            self.errors.append(f"Variable '{var_decl.name}' already declared in global scope")
+        # Redeclarations are reported by the resolver
+        if self.resolver.declarations.get(id(var_decl)) is None:
             return
-        # Add variable to global scope
-        self.symbol_table_stack[0][var_decl.name] = var_decl.data_type
         # Check variable initialization kind
         if var_decl.var_kind == "val":
             if not var_decl.value:
-                self.errors.append(f"Constant variable '{var_decl.name}' must be initialized")
+                self.report(var_decl, f"Constant variable '{var_decl.name}' must be initialized")
                 return
-            self.check_expression(var_decl.value)
-            self.symbol_table_stack[0].get("immutable_vars", []).append(var_decl.name)
+            yield self.check_expression(var_decl.value)
         else:
             if var_decl.value:
-                self.check_expression(var_decl.value)
+                yield self.check_expression(var_decl.value)
         
     def check_array_declaration(self, array_decl):
-        # Check if array already declared in global scope
-        if array_decl.name in self.symbol_table_stack[0]:
-            self.errors.append(f"Array '{array_decl.name}' already declared in global scope")
+        # Redeclarations are reported by the resolver
+        if self.resolver.declarations.get(id(array_decl)) is None:
             return
-        # Add array to global scope
-        self.symbol_table_stack[0][array_decl.name] = array_decl.data_type
         for value in array_decl.value:
-            self.check_expression(value)
+            yield self.check_expression(value)
+
+    def check_mapped_array_declaration(self, mapped_decl):
+        name = f"mmap_{mapped_decl.map_type}s"
+        yield self.check_expression(mapped_decl.path)
+        if self.get_expression_type(mapped_decl.path) != "string":
+            self.report(mapped_decl, f"The path given to {name} must be a string")
+        if mapped_decl.data_type != ["array", mapped_decl.map_type]:
+            self.report(mapped_decl, f"{name} maps a one-dimensional array of {mapped_decl.map_type}, '{mapped_decl.name}' is not declared as one")
+
+    def is_mapped(self, symbol):
+        # Mapped files are read-only, writing to one would fault
+        return symbol is not None and isinstance(symbol.declaration, MappedArrayDeclaration)
 
     def check_declaration(self, declaration):
         if isinstance(declaration, FunctionStatement):
-            self.check_function_declaration(declaration)
+            yield self.check_function_declaration(declaration)
         elif isinstance(declaration, MainFunctionStatement):
-            self.check_main_function_declaration(declaration)
+            yield self.check_main_function_declaration(declaration)
         elif isinstance(declaration, VariableDeclaration):
-            self.check_variable_declaration(declaration)
+            yield self.check_variable_declaration(declaration)
         elif isinstance(declaration, ArrayDeclaration):
-            self.check_array_declaration(declaration)
+            yield self.check_array_declaration(declaration)
         else:
-            self.errors.append(f"Unknown declaration type: {type(declaration)}")
+            self.report(declaration, f"Unknown declaration type: {type(declaration)}")
 
     def check_function_declaration(self, function_decl):
-        self.symbol_table_stack.append({'immutable_vars': []})  # New scope for function
         self.current_function = function_decl.name
-        # Add function parameters to symbol table
-        if function_decl.parameters and any(function_decl.parameters):
-            for param_name, param_type in function_decl.parameters:
-                self.symbol_table_stack[-1][param_name] = param_type
-
         # Add function to functions dictionary
         self.functions[function_decl.name] = function_decl.return_type
 
+        # Array parameters are passed as a pointer to their elements
+        for parameter in function_decl.parameters or []:
+            if parameter is None:
+                continue
+            param_name, param_type = parameter
+            if isinstance(param_type, list) and param_type[-1] not in ("int", "float", "double", "bool"):
+                self.report(function_decl, f"Array parameter '{param_name}' of function '{function_decl.name}' has unsupported element type '{param_type[-1]}'")
+
+        for annotation in function_decl.annotations:
+            if annotation != "memo":
+                self.report(function_decl, f"Unknown annotation '@{annotation}' on function '{function_decl.name}'")
+            elif not self.purity.is_pure(function_decl.name):
+                reason = self.purity.reason(function_decl.name)
+                self.report(function_decl, f"Function '{function_decl.name}' is marked @memo but is not pure: {reason}")
+
         # Check function body
-        self.check_statement_block(function_decl.body)
+        yield self.check_statement_block(function_decl.body)
         self.current_function = None
-        self.symbol_table_stack.pop()  # End of function scope
 
     def check_main_function_declaration(self, main_func_decl):
-        self.symbol_table_stack.append({'immutable_vars': []})  # New scope for main function
         self.current_function = "main"
+        if main_func_decl.annotations:
+            annotations = ", ".join("@" + name for name in main_func_decl.annotations)
+            self.report(main_func_decl, f"Annotations {annotations} are not allowed on function 'main'")
         # Main function has no parameters
         # Check function body
-        self.check_statement_block(main_func_decl.body)
+        yield self.check_statement_block(main_func_decl.body)
         self.current_function = None
-        self.symbol_table_stack.pop()  # End of main function scope
 
     def check_variable_declaration(self, var_decl):
-        # Check if variable already declared in global scope
-        global_scope = self.symbol_table_stack[0]
-        if var_decl.name in global_scope:
-            self.errors.append(f"Variable '{var_decl.name}' already declared in global scope")
+        # Redeclarations are reported by the resolver
+        if self.resolver.declarations.get(id(var_decl)) is None:
             return
-        
-        # Check if variable already declared in current scope
-        current_scope = self.symbol_table_stack[-1]
-        if var_decl.name in current_scope:
-            self.errors.append(f"Variable '{var_decl.name}' already declared in current scope")
-            return
-
-        # Add variable to symbol table
-        self.symbol_table_stack[-1][var_decl.name] = var_decl.data_type
 
         # Check variable initialization kind
         if var_decl.var_kind == "val":
             if not var_decl.value:
-                self.errors.append(f"Constant variable '{var_decl.name}' must be initialized")
+                self.report(var_decl, f"Constant variable '{var_decl.name}' must be initialized")
                 return
-            self.check_expression(var_decl.value)
-            self.symbol_table_stack[-1].get("immutable_vars", []).append(var_decl.name)
+            yield self.check_expression(var_decl.value)
         
         # Check variable initialization expression
-        self.check_expression(var_decl.value)
+        yield self.check_expression(var_decl.value)
+        if var_decl.value is not None:
+            self.get_expression_type(var_decl.value)
 
     def check_statement_block(self, statement_block):
         for statement in statement_block:
-            self.check_statement(statement)
+            yield self.check_statement(statement)
 
     def check_statement(self, statement):
         if isinstance(statement, VariableDeclaration):
-            self.check_variable_declaration(statement)
+            yield self.check_variable_declaration(statement)
         elif isinstance(statement, ArrayDeclaration):
-            self.check_array_declaration(statement)
+            yield self.check_array_declaration(statement)
+        elif isinstance(statement, MappedArrayDeclaration):
+            yield self.check_mapped_array_declaration(statement)
         elif isinstance(statement, IfStatement):
-            self.check_if_statement(statement)
+            yield self.check_if_statement(statement)
         elif isinstance(statement, WhileStatement):
-            self.check_while_statement(statement)
+            yield self.check_while_statement(statement)
         elif isinstance(statement, DoWhileStatement):
-            self.check_do_while_statement(statement)
+            yield self.check_do_while_statement(statement)
         elif isinstance(statement, AssignmentStatement):
-            self.check_assignment_statement(statement)
+            yield self.check_assignment_statement(statement)
         elif isinstance(statement, ArrayAssignmentStatement):
-            self.check_array_assignment_statement(statement)
+            yield self.check_array_assignment_statement(statement)
         elif isinstance(statement, ReturnStatement):
-            self.check_return_statement(statement)
+            yield self.check_return_statement(statement)
         elif isinstance(statement, ExpressionStatement):
-            self.check_expression(statement.expression)
+            yield self.check_expression(statement.expression)
         elif isinstance(statement, PrintStatement):
-            self.check_print_statement(statement)
+            yield self.check_print_statement(statement)
         elif isinstance(statement, ArrayAllocation):
             pass
         else:
-            self.errors.append(f"Unknown statement type: {type(statement)}")
+            self.report(statement, f"Unknown statement type: {type(statement)}")
 
-    def check_variable_reference(self, name):
-        # Check variable in the nearest scope
-        for scope in reversed(self.symbol_table_stack):
-            if name in scope:
-                return
-        self.errors.append(f"Variable '{name}' not declared")
+    def check_variable_reference(self, reference):
+        if self.resolver.symbol_for(reference) is None:
+            self.report(reference, f"Variable '{reference.name}' not declared")
     
     def check_if_statement(self, if_stmt):
-        self.check_expression(if_stmt.condition)
-        self.check_statement_block(if_stmt.then_block)
+        yield self.check_expression(if_stmt.condition)
+        yield self.check_statement_block(if_stmt.then_block)
         if if_stmt.else_block:
-            self.check_statement_block(if_stmt.else_block)
+            yield self.check_statement_block(if_stmt.else_block)
 
     def check_while_statement(self, while_stmt):
-        self.check_expression(while_stmt.condition)
-        self.check_statement_block(while_stmt.body)
+        yield self.check_expression(while_stmt.condition)
+        yield self.check_statement_block(while_stmt.body)
 
     def check_do_while_statement(self, do_while_stmt):
-        self.check_statement_block(do_while_stmt.body)
-        self.check_expression(do_while_stmt.condition)
+        yield self.check_statement_block(do_while_stmt.body)
+        yield self.check_expression(do_while_stmt.condition)
 
     def check_assignment_statement(self, assign_stmt):
-        variable_type = None
+        symbol = self.resolver.symbol_for(assign_stmt)
         # Check if variable is declared
-        for scope in reversed(self.symbol_table_stack):
-            if assign_stmt.target in scope:
-                # Check variable kind
-                if assign_stmt.target in scope.get("immutable_vars", []):
-                    self.errors.append(f"Cannot assign to constant variable '{assign_stmt.target}'")
-                    return
-                variable_type = scope[assign_stmt.target]
-                break
-        if not variable_type:
-            self.errors.append(f"Variable '{assign_stmt.target}' not declared")
+        if symbol is None:
+            self.report(assign_stmt, f"Variable '{assign_stmt.target}' not declared")
+            return
+        # Check variable kind
+        if symbol.immutable:
+            self.report(assign_stmt, f"Cannot assign to constant variable '{assign_stmt.target}'")
             return
+        variable_type = symbol.data_type
         
-        self.check_expression(assign_stmt.value)
+        yield self.check_expression(assign_stmt.value)
         # Assume get_expression_type() can determine the expression's type
         actual_type = self.get_expression_type(assign_stmt.value)
         if actual_type == "str":
             actual_type = "string"
         
-        # Store result in validation_result
-        self.validation_result[f"Assignment: {assign_stmt.value}"] = actual_type
         if variable_type != actual_type:
-            self.errors.append(f"Type mismatch in assignment for variable '{assign_stmt.target}'")
+            self.report(assign_stmt, f"Type mismatch in assignment for variable '{assign_stmt.target}'")
 
     def check_array_assignment_statement(self, assign_stmt):
-        array_type = None
+        symbol = self.resolver.symbol_for(assign_stmt)
         # Check if array is declared
-        for scope in reversed(self.symbol_table_stack):
-            if assign_stmt.target in scope:
-                # Check array kind
-                if assign_stmt.target in scope.get("immutable_vars", []):
-                    self.errors.append(f"Cannot assign to constant array '{assign_stmt.target}'")
-                    return
-                array_type = scope[assign_stmt.target]
-                break
-        if not array_type:
-            self.errors.append(f"Array '{assign_stmt.target}' not declared")
+        if symbol is None:
+            self.report(assign_stmt, f"Array '{assign_stmt.target}' not declared")
             return
-        
-        self.check_expression(assign_stmt.index)
-        self.check_expression(assign_stmt.value)
+        # Check array kind
+        if symbol.immutable:
+            self.report(assign_stmt, f"Cannot assign to constant array '{assign_stmt.target}'")
+            return
+        if self.is_mapped(symbol):
+            self.report(assign_stmt, f"'{assign_stmt.target}' is a mapped file and cannot be assigned to")
+            return
+        array_type = symbol.data_type
+
+        for index in assign_stmt.index:
+            yield self.check_expression(index)
+        yield self.check_expression(assign_stmt.value)
         # Assume get_expression_type() can determine the expression's type
         actual_type = self.get_expression_type(assign_stmt.value)
         if actual_type == "str":
             actual_type = "string"
         
-        # Store result in validation_result
-        self.validation_result[f"ArrayAssignment: {assign_stmt.value}"] = actual_type
-        if array_type[0] != actual_type:
-            self.errors.append(f"Type mismatch in array assignment for array '{assign_stmt.target}'")
+        if array_type[-1] != actual_type:
+            self.report(assign_stmt, f"Type mismatch in array assignment for array '{assign_stmt.target}'")
 
     def check_return_statement(self, return_stmt):
         if return_stmt.value:
-            self.check_expression(return_stmt.value)
+            yield self.check_expression(return_stmt.value)
             # Assume get_expression_type() can determine the expression's type
             actual_type = self.get_expression_type(return_stmt.value)
             if actual_type == "str":
                 actual_type = "string"
-            # Store result in validation_result
-            self.validation_result[f"Return: {return_stmt.value}"] = actual_type
             
             if self.current_function:
                 if actual_type != self.functions.get(self.current_function, None):
-                    self.errors.append(f"Return type mismatch in {self.current_function} function")
+                    self.report(return_stmt, f"Return type mismatch in {self.current_function} function")
             else:
-                self.errors.append(f"Return statement outside of function")
+                self.report(return_stmt, f"Return statement outside of function")
 
     def check_expression(self, expression):
         if isinstance(expression, BinaryExpression):
-            self.check_binary_expression(expression)
+            yield self.check_binary_expression(expression)
         elif isinstance(expression, UnaryExpression):
-            self.check_unary_expression(expression)
+            yield self.check_unary_expression(expression)
         elif isinstance(expression, Literal):
             pass  # Literals have correct type
         elif isinstance(expression, FunctionCall):
-            self.check_function_call(expression)
+            yield self.check_function_call(expression)
         elif isinstance(expression, VariableReference):
-            self.check_variable_reference(expression.name)
+            self.check_variable_reference(expression)
         elif isinstance(expression, ArrayAccess):
-            self.check_array_access(expression)
+            yield self.check_array_access(expression)
+        elif isinstance(expression, ReadExpression):
+            pass  # read_int() and read_double() take no arguments
+        elif isinstance(expression, ReadIntoExpression):
+            yield self.check_read_into(expression)
+        elif isinstance(expression, ArrayLength):
+            self.check_array_length(expression)
         else:
-            self.errors.append(f"Unknown expression type: {type(expression)}")
+            self.report(expression, f"Unknown expression type: {type(expression)}")
 
     def check_binary_expression(self, binary_expr):
-        self.check_expression(binary_expr.left)
-        self.check_expression(binary_expr.right)
+        yield self.check_expression(binary_expr.left)
+        yield self.check_expression(binary_expr.right)
 
     def check_unary_expression(self, unary_expr):
-        self.check_expression(unary_expr.operand)
+        yield self.check_expression(unary_expr.operand)
 
     def check_function_call(self, func_call):
         # Check if function exists and if arguments match parameters in type and number
-        if func_call.name not in self.functions:
-            self.errors.append(f"Function '{func_call.name}' not declared")
+        if self.resolver.symbol_for(func_call) is None:
+            self.report(func_call, f"Function '{func_call.name}' not declared")
             return
+        for argument in func_call.arguments:
+            yield self.check_expression(argument)
+
+        declaration = self.resolver.symbol_for(func_call).declaration
+        parameters = [parameter for parameter in declaration.parameters or [] if parameter is not None]
+        for (param_name, param_type), argument in zip(parameters, func_call.arguments):
+            argument_type = self.get_expression_type(argument)
+            if isinstance(param_type, list):
+                if not isinstance(argument, VariableReference) or not isinstance(argument_type, list):
+                    self.report(func_call, f"Argument '{param_name}' of function '{func_call.name}' must be an array variable")
+                elif self.array_shape(argument_type) != self.array_shape(param_type):
+                    rank, element_type = self.array_shape(param_type)
+                    self.report(func_call, f"Type mismatch for argument '{param_name}' of function '{func_call.name}': expected a {rank}-dimensional {element_type} array")
+            elif isinstance(argument_type, list):
+                self.report(func_call, f"Argument '{param_name}' of function '{func_call.name}' cannot be an array")
+        # A mapped file may only go to parameters the callee never writes to
+        parameter_symbols = self.resolver.parameters.get(id(declaration))
+        for index, argument in enumerate(func_call.arguments):
+            if not isinstance(argument, VariableReference) or not self.is_mapped(self.resolver.symbol_for(argument)):
+                continue
+            if parameter_symbols is None or (index < len(parameter_symbols) and parameter_symbols[index].mutated):
+                self.report(func_call, f"'{argument.name}' is a mapped file and cannot be passed to '{func_call.name}', which may write to it")
+
+    def array_shape(self, array_type):
+        # Declared and allocated arrays spell dimensions differently,
+        # ["array", "int"] and [("array", 4), "int"], only rank and element type matter
+        return len(array_type) - 1, array_type[-1]
 
     def check_array_access(self, array_access):
-        for scope in reversed(self.symbol_table_stack):
-            if array_access.name in scope:
-                array_type = scope[array_access.name]
-                self.check_expression(array_access.index)
-                return array_type
-        self.errors.append(f"Array '{array_access.name}' not declared")
+        symbol = self.resolver.symbol_for(array_access)
+        if symbol is None:
+            self.report(array_access, f"Array '{array_access.name}' not declared")
+            return None
+        for index in array_access.index:
+            yield self.check_expression(index)
+        return symbol.data_type
     
+    def check_read_into(self, read_into):
+        name = f"read_{read_into.read_type}s_into"
+        symbol = self.resolver.symbol_for(read_into)
+        if symbol is None:
+            self.report(read_into, f"Array '{read_into.target}' not declared")
+        elif not isinstance(symbol.data_type, list) or symbol.data_type[-1] != read_into.read_type:
+            self.report(read_into, f"{name} needs an array of {read_into.read_type}, '{read_into.target}' is not one")
+        elif self.is_mapped(symbol):
+            self.report(read_into, f"'{read_into.target}' is a mapped file and cannot be read into")
+        yield self.check_expression(read_into.count)
+        if self.get_expression_type(read_into.count) != "int":
+            self.report(read_into, f"The count of {name} must be an int")
+
+    def check_array_length(self, array_length):
+        symbol = self.resolver.symbol_for(array_length)
+        if symbol is None:
+            self.report(array_length, f"Array '{array_length.name}' not declared")
+        elif not isinstance(symbol.data_type, list):
+            self.report(array_length, f"array_length needs an array, '{array_length.name}' is not one")
+
     def check_print_statement(self, print_stmt):
-        self.check_expression(print_stmt.expression)
-        # Store result in validation_result
-        self.validation_result[f"Print: {print_stmt.expression}"] = self.get_expression_type(print_stmt.expression)
+        yield self.check_expression(print_stmt.expression)
+        self.get_expression_type(print_stmt.expression)
 
     def are_types_compatible(self, type1, type2):
         # Implement specific rules based on your language specifications
@@ -291,16 +366,46 @@ class Analyzer:
         return False
         
     def determine_common_type(self, type1, type2):
-        # Implement type coercion or common type determination logic
-        pass
+        # Mixed numeric operands are promoted to the floating point type
+        if "double" in (type1, type2):
+            return "double"
+        if "float" in (type1, type2):
+            return "float"
+        return type1
 
     def get_expression_type(self, expression):
+        # Types are memoized by node identity, so a subtree is typed once no
+        # matter how many enclosing statements ask for it. Operands are typed
+        # first from an explicit post-order worklist instead of recursing.
+        key = id(expression)
+        if key in self.expression_types:
+            return self.expression_types[key]
+        stack = [(expression, False)]
+        while stack:
+            node, operands_typed = stack.pop()
+            if id(node) in self.expression_types:
+                continue
+            if not operands_typed:
+                stack.append((node, True))
+                for operand in reversed(self.expression_operands(node)):
+                    if id(operand) not in self.expression_types:
+                        stack.append((operand, False))
+                continue
+            self.expression_types[id(node)] = self.compute_expression_type(node)
+        return self.expression_types[key]
+
+    def expression_operands(self, expression):
+        if isinstance(expression, BinaryExpression):
+            return [expression.left, expression.right]
+        if isinstance(expression, UnaryExpression):
+            return [expression.operand]
+        return []
+
+    def compute_expression_type(self, expression):
         if isinstance(expression, Literal):
             computed_type = type(expression.value).__name__.lower()
             if computed_type == "str":
                 computed_type = "string"
-            # Store result in validation_result
-            self.validation_result[f"Literal: {expression}"] = computed_type
             return computed_type
         elif isinstance(expression, BinaryExpression):
             left_type = self.get_expression_type(expression.left)
@@ -312,33 +417,39 @@ class Analyzer:
             elif self.are_types_compatible(left_type, right_type):
                 result_type = self.determine_common_type(left_type, right_type)
             else:
-                self.errors.append(f"Type mismatch in binary expression: {left_type} and {right_type}")
-                result_type = None
-            
-            self.validation_result[f"Binary: {expression}"] = result_type
+                self.report(expression, f"Type mismatch in binary expression: {left_type} and {right_type}")
+                return None
+
+            # Comparisons and logical operators produce booleans
+            if expression.operator in ("<", ">", "<=", ">=", "==", "!=", "&&", "||"):
+                return "bool"
             return result_type
         elif isinstance(expression, UnaryExpression):
+            if expression.operator in ("!", "not"):
+                self.get_expression_type(expression.operand)
+                return "bool"
             return self.get_expression_type(expression.operand)
         elif isinstance(expression, FunctionCall):
             # Determine return type of function call
-            computed_type = self.functions.get(expression.name, None)
-            # Store result in validation_result
-            self.validation_result[expression.__str__()] = computed_type
-            return computed_type
+            symbol = self.resolver.symbol_for(expression)
+            return symbol.data_type if symbol else None
         elif isinstance(expression, VariableReference):
-            for scope in reversed(self.symbol_table_stack):
-                if expression.name in scope:
-                    # Store result in validation_result
-                    self.validation_result[expression.__str__()] = scope[expression.name]
-                    return scope[expression.name]
-            
-            # Variable not in symbol table
-            self.errors.append(f"Variable '{expression.name}' not declared, no type found")
-            return None
+            # Unbound names are reported by check_variable_reference
+            symbol = self.resolver.symbol_for(expression)
+            return symbol.data_type if symbol else None
         elif isinstance(expression, ArrayAccess):
-            return self.check_array_access(expression)
+            # Indexing yields the element type
+            symbol = self.resolver.symbol_for(expression)
+            return symbol.data_type[-1] if symbol and isinstance(symbol.data_type, list) else None
+        elif isinstance(expression, ReadExpression):
+            return expression.read_type
+        elif isinstance(expression, ReadIntoExpression):
+            # The number of values read
+            return "int"
+        elif isinstance(expression, ArrayLength):
+            return "int"
         else:
-            self.errors.append(f"Unknown expression type: {type(expression)}, expression: {expression}")
+            self.report(expression, f"Unknown expression type: {type(expression)}, expression: {expression}")
         return None
 
 if __name__ == "__main__":
@@ -364,7 +475,7 @@ if __name__ == "__main__":
     print_tree.pretty_print(result)
     type_checker.check_program(result)
     print("Typecheck errors:\n", type_checker.errors)
-    print("Typecheck results:\n", json.dumps(type_checker.validation_result, indent=4))
+    print("Typecheck results:\n", json.dumps(type_checker.expression_types, indent=4))
 
     print("Type checking test cases")
     print("Test 1")
@@ -382,7 +493,7 @@ if __name__ == "__main__":
     print_tree.pretty_print(result)
     type_checker.check_program(result)
     print("Typecheck errors:\n", type_checker.errors)
-    print("Typecheck results:\n", json.dumps(type_checker.validation_result, indent=4))
+    print("Typecheck results:\n", json.dumps(type_checker.expression_types, indent=4))
 
     print("Test 2")
     type_checker = Analyzer()
@@ -414,7 +525,7 @@ if __name__ == "__main__":
     print_tree.pretty_print(result)
     type_checker.check_program(result)
     print("Typecheck errors:\n", type_checker.errors)
-    print("Typecheck results:\n", json.dumps(type_checker.validation_result, indent=4))
+    print("Typecheck results:\n", json.dumps(type_checker.expression_types, indent=4))
 
 
     print("Test 3")
@@ -435,7 +546,7 @@ if __name__ == "__main__":
     print_tree.pretty_print(result)
     type_checker.check_program(result)
     print("Typecheck errors:\n", type_checker.errors)
-    print("Typecheck results:\n", json.dumps(type_checker.validation_result, indent=4))
+    print("Typecheck results:\n", json.dumps(type_checker.expression_types, indent=4))
 
     print("Error tests:\n")
 
@@ -455,7 +566,7 @@ if __name__ == "__main__":
     type_checker.check_program(result)
     print("Typecheck errors:", type_checker.errors)
     print("Expected errors: ['Variable \'a\' not declared', 'Variable \'b\' not declared']")
-    print(json.dumps(type_checker.validation_result, indent=4))
+    print(json.dumps(type_checker.expression_types, indent=4))
 
     print("Test 5")
     type_checker = Analyzer()
@@ -476,7 +587,7 @@ if __name__ == "__main__":
     print_tree.pretty_print(result)
     type_checker.check_program(result)
     print("Typecheck errors:", type_checker.errors)
-    print(json.dumps(type_checker.validation_result, indent=4))
+    print(json.dumps(type_checker.expression_types, indent=4))
 
     print("Fully Correct Program")
     print("Test 6")
@@ -516,7 +627,7 @@ if __name__ == "__main__":
     print_tree.pretty_print(result)
     type_checker.check_program(result)
     print("Typecheck errors:", type_checker.errors)
-    print("Typecheck results:\n", json.dumps(type_checker.validation_result, indent=4))
+    print("Typecheck results:\n", json.dumps(type_checker.expression_types, indent=4))
 
     print("Test 7")
     type_checker = Analyzer()
@@ -540,7 +651,7 @@ if __name__ == "__main__":
     print_tree.pretty_print(result)
     type_checker.check_program(result)
     print("Typecheck errors:", type_checker.errors)
-    print("Typecheck results:\n", json.dumps(type_checker.validation_result, indent=4))
+    print("Typecheck results:\n", json.dumps(type_checker.expression_types, indent=4))
 
     print("Test 8")
     type_checker = Analyzer()
@@ -568,7 +679,7 @@ if __name__ == "__main__":
     print_tree.pretty_print(result)
     type_checker.check_program(result)
     print("Typecheck errors:", type_checker.errors)
-    print("Typecheck results:\n", json.dumps(type_checker.validation_result, indent=4))
+    print("Typecheck results:\n", json.dumps(type_checker.expression_types, indent=4))
 
 
     print("Test 9")
@@ -614,4 +725,4 @@ if __name__ == "__main__":
     print_tree.pretty_print(result)
     type_checker.check_program(result)
     print("Typecheck errors:", type_checker.errors)
-    print("Typecheck results:\n", json.dumps(type_checker.validation_result, indent=4))
+    print("Typecheck results:\n", json.dumps(type_checker.expression_types, indent=4))
@@ -1,86 +1,244 @@
 import sys
 import os
 import json
-from grammar.grammar import parser
+import argparse
+import cProfile
+import pstats
+import tracemalloc
+from grammar.grammar import parse
 from checker import checker
+from resolver.resolver import Resolver
+from analysis.inliner import Inliner, DEFAULT_INLINE_BUDGET
 from gen_llvm_ir import generator as llvmir_c
 from tree.ast_nodes import MainFunctionStatement
+from tree.source_map import SourceMap
 import json_converter
 import print_tree
+from tracing import Tracer, AllocationTracer
 
-def compile_program(filename, print_tree_flag=False, pretty=False, typecheck_print=False):
+# Functions or allocation sites listed by the compiler profiles
+DEFAULT_PROFILE_TOP = 25
+
+# Input, mapped files, buffered output and heap allocation failures
+IO_RUNTIME = os.path.join(os.path.dirname(__file__), "runtime", "plush_io.c")
+
+def mark_source_file(declarations, filename):
+    # Imported functions keep the name of their own file, so line numbers
+    # recorded on the AST can be traced back to it
+    for declaration in declarations:
+        declaration.source_file = filename
+
+def compile_program(filename, print_tree_flag=False, pretty=False, typecheck_print=False, compact=False, tree_out=None,
+                    stack_array_limit=llvmir_c.DEFAULT_STACK_ARRAY_LIMIT, alloc_report=False,
+                    auto_memo=False, memo_size=llvmir_c.DEFAULT_MEMO_SIZE, memo_policy="replace",
+                    inline=False, inline_budget=DEFAULT_INLINE_BUDGET, inline_report=False, export_all=False,
+                    nsw=False, fast_math=(), instrument=False, count_blocks=False, debug=False, buffered_io=False,
+                    tracer=None):
+    # Stages and declarations are timed when a trace was asked for
+    tracer = tracer if tracer is not None else Tracer(enabled=False)
     with open(filename, "r") as f:
         source_code = f.read()
 
-    # Parse the source code
-    result = parser.parse(source_code)
+    # Parse the source code, node spans of every file go to one map
+    source_map = SourceMap()
+    result = parse(source_code, source_map, filename, tracer)
 
     if result is None:
         print(f"Syntax error in file: {filename}")
         return
+    mark_source_file(result.declarations, filename)
     
     if result.imports:
-        for import_file in result.imports:
-            import_file = import_file.replace('"', '')
-            folder = os.path.dirname(filename)
-            import_file_path = os.path.join(folder, f"{import_file}.pl")
-
-            if os.path.exists(import_file_path):
-                with open(import_file_path, "r") as import_f:
-                    import_source_code = import_f.read()
-                import_result = parser.parse(import_source_code)
+        with tracer.span("imports"):
+            for import_file in result.imports:
+                import_file = import_file.replace('"', '')
+                folder = os.path.dirname(filename)
+                import_file_path = os.path.join(folder, f"{import_file}.pl")
+
+                if os.path.exists(import_file_path):
+                    with open(import_file_path, "r") as import_f:
+                        import_source_code = import_f.read()
+                    import_result = parse(import_source_code, source_map, import_file_path, tracer)
                 
-                if import_result is None:
-                    print(f"Syntax error in import file: {import_file_path}")
-                    return
+                    if import_result is None:
+                        print(f"Syntax error in import file: {import_file_path}")
+                        return
+                    mark_source_file(import_result.declarations, import_file_path)
                 
-                # Remove MainFunctionStatement from import_result.declarations and append to result.declarations
-                not_main_function_statements = [
-                    decl for decl in import_result.declarations if not isinstance(decl, MainFunctionStatement)
-                ]
+                    # Remove MainFunctionStatement from import_result.declarations and append to result.declarations
+                    not_main_function_statements = [
+                        decl for decl in import_result.declarations if not isinstance(decl, MainFunctionStatement)
+                    ]
+
+                    result.declarations = not_main_function_statements + result.declarations
+                else:
+                    print(f"Import file '{import_file_path}' not found.")
+                    return
 
-                result.declarations = not_main_function_statements + result.declarations
-            else:
-                print(f"Import file '{import_file_path}' not found.")
-                return
+    # Bind every name to its declaration once; the checker and the
+    # generator both read these records
+    with tracer.span("resolve"):
+        resolver = Resolver().resolve_program(result)
 
     # Perform semantic checking
-    analyzer = checker.Analyzer()
+    analyzer = checker.Analyzer(resolver, source_map, tracer)
     try:
-        analyzer.check_program(result)
+        with tracer.span("check"):
+            analyzer.check_program(result)
         errors = analyzer.errors
-        #print("Typecheck errors:", errors)
+        if typecheck_print:
+            # Checker errors start with file:line:column
+            for error in errors:
+                print(error)
+            return
     except Exception as e:
         print(f"Semantic error: {str(e)}")
         
 
-    # Generate LLVM IR
-    generator = llvmir_c.LLVMIRGenerator(result)
-    llvm_ir = generator.generate()
-
     if print_tree_flag:
-        # Print the AST as JSON
-        json_ast = json_converter.convert_ast_to_json(result)
-        print(json_ast)
+        # Stream the AST as JSON, nodes are written as they are reached
+        if tree_out:
+            with open(tree_out, "w") as f:
+                json_converter.write_ast_json(result, f, compact)
+                f.write("\n")
+        else:
+            json_converter.write_ast_json(result, sys.stdout, compact)
+            sys.stdout.write("\n")
     elif pretty:
         # Print the AST in a pretty format
         print_tree.pretty_print(result, indent=0)
     else:
-        # Save the LLVM IR to a file and return its path
+        if inline:
+            # Imports are merged by now, so calls across files are inlined too
+            with tracer.span("inline"):
+                inliner = Inliner(resolver, analyzer.expression_types, analyzer.purity, inline_budget).inline_program(result)
+            if inline_report:
+                for line in inliner.report:
+                    print(line, file=sys.stderr)
+
+        # Generate LLVM IR
+        generator = llvmir_c.LLVMIRGenerator(result, resolver, analyzer.expression_types, stack_array_limit,
+                                             memo_size, memo_policy, auto_memo, export_all, nsw, fast_math,
+                                             instrument, count_blocks, debug, source_map, tracer, buffered_io)
+        with tracer.span("generate"):
+            llvm_ir = generator.generate()
+        if alloc_report:
+            # stdout carries the .ll path for plush, the listing goes to stderr
+            print("\n".join(generator.allocation_report()), file=sys.stderr)
+
+        # Save the LLVM IR to a file and return its path, followed by the
+        # runtime plush links in when the program calls it
         output_filename = os.path.splitext(filename)[0] + ".ll"
-        with open(output_filename, "w") as f:
+        with tracer.span("write", file=output_filename), open(output_filename, "w") as f:
             f.write(llvm_ir)
         print(output_filename)
+        if generator.uses_io_runtime():
+            print(IO_RUNTIME)
+
+def profile_compile_program(filename, stats_file=None, top=DEFAULT_PROFILE_TOP, out=sys.stderr, **options):
+    """
+    Run compile_program under cProfile. The statistics are written to
+    stats_file, next to the source by default, and the top functions by
+    cumulative time are printed to out. Returns the pstats.Stats.
+    """
+    stats_file = stats_file or os.path.splitext(filename)[0] + ".pstats"
+    profiler = cProfile.Profile()
+    profiler.runcall(compile_program, filename, **options)
+    profiler.dump_stats(stats_file)
+    print(f"Compiler profile written to {stats_file}", file=out)
+    stats = pstats.Stats(profiler, stream=out)
+    stats.strip_dirs().sort_stats("cumulative").print_stats(top)
+    return stats
+
+def alloc_profile_compile_program(filename, top=DEFAULT_PROFILE_TOP, out=sys.stderr, **options):
+    """
+    Run compile_program under tracemalloc and print to out what each stage
+    left allocated, its peak and its top allocation sites. Returns the
+    AllocationTracer, which also holds the stages as a trace.
+    """
+    tracer = AllocationTracer(top)
+    tracemalloc.start()
+    try:
+        compile_program(filename, tracer=tracer, **options)
+    finally:
+        tracemalloc.stop()
+    print(f"Compiler allocations by stage (top {top} sites):", file=out)
+    for line in tracer.report():
+        print(line, file=out)
+    return tracer
 
 if __name__ == "__main__":
-    if "--tree" in sys.argv:
-        sys.argv.remove("--tree")
-        compile_program(sys.argv[1], print_tree_flag=True)
-    elif "--pretty" in sys.argv:
-        sys.argv.remove("--pretty")
-        compile_program(sys.argv[1], pretty=True)
-    elif "--typecheck_print" in sys.argv:
-        sys.argv.remove("--typecheck_print")
-        compile_program(sys.argv[1], typecheck_print=True)
+    arg_parser = argparse.ArgumentParser(description="Compile a PLush program to LLVM IR.")
+    arg_parser.add_argument("filename")
+    arg_parser.add_argument("--tree", action="store_true", help="print the AST as JSON")
+    arg_parser.add_argument("--compact", action="store_true", help="print the JSON tree without indentation")
+    arg_parser.add_argument("--tree-out", metavar="FILE", help="write the JSON tree to FILE")
+    arg_parser.add_argument("--pretty", action="store_true", help="pretty-print the AST")
+    arg_parser.add_argument("--typecheck_print", action="store_true")
+    arg_parser.add_argument("--stack-array-limit", type=int, default=llvmir_c.DEFAULT_STACK_ARRAY_LIMIT, metavar="BYTES",
+                            help="arrays larger than this are allocated on the heap (default %(default)s)")
+    arg_parser.add_argument("--alloc-report", action="store_true", help="list where each array is allocated on stderr")
+    arg_parser.add_argument("--auto-memo", action="store_true",
+                            help="cache pure functions that recurse outside tail position, as if marked @memo")
+    arg_parser.add_argument("--memo-size", type=int, default=llvmir_c.DEFAULT_MEMO_SIZE, metavar="ENTRIES",
+                            help="entries in each memo table, rounded up to a power of two (default %(default)s)")
+    arg_parser.add_argument("--memo-policy", choices=llvmir_c.MEMO_POLICIES, default="replace",
+                            help="on a collision, replace the cached entry or keep it (default %(default)s)")
+    arg_parser.add_argument("--inline", action="store_true", help="replace calls to small functions with their body")
+    arg_parser.add_argument("--inline-budget", type=int, default=DEFAULT_INLINE_BUDGET, metavar="NODES",
+                            help="largest function body, in expression nodes, to inline (default %(default)s)")
+    arg_parser.add_argument("--inline-report", action="store_true", help="list the inlined calls on stderr")
+    arg_parser.add_argument("--export-all", action="store_true",
+                            help="give every function external linkage, for programs linked with C or other modules")
+    arg_parser.add_argument("--nsw", action="store_true",
+                            help="assume int +, - and * never overflow (overflow becomes undefined behaviour)")
+    arg_parser.add_argument("--fast-math", metavar="FLAGS", default="",
+                            help="comma-separated fast-math flags for double arithmetic: "
+                                 + ", ".join(llvmir_c.FAST_MATH_FLAGS))
+    arg_parser.add_argument("--instrument", action="store_true",
+                            help="count calls and time per function, link with runtime/plush_profile.c")
+    arg_parser.add_argument("--count-blocks", action="store_true",
+                            help="count runs of every if, else and loop block, see heat_report.py")
+    arg_parser.add_argument("-g", "--debug", action="store_true",
+                            help="emit DWARF debug info mapping instructions to PLush lines")
+    arg_parser.add_argument("--buffered-io", action="store_true",
+                            help="print through the output buffer of runtime/plush_io.c instead of printf")
+    arg_parser.add_argument("--trace-out", metavar="FILE",
+                            help="write the time of each compiler stage and declaration to FILE as a Chrome trace")
+    profile_group = arg_parser.add_mutually_exclusive_group()
+    profile_group.add_argument("--profile-compiler", action="store_true",
+                               help="run the compiler under cProfile, write <source>.pstats and list the top functions on stderr")
+    profile_group.add_argument("--profile-alloc", action="store_true",
+                               help="list the top allocation sites of each compiler stage on stderr")
+    arg_parser.add_argument("--profile-top", type=int, default=DEFAULT_PROFILE_TOP, metavar="N",
+                            help="functions or allocation sites listed by the profiles (default %(default)s)")
+    args = arg_parser.parse_args()
+    fast_math = tuple(flag for flag in args.fast_math.split(",") if flag)
+    unknown = [flag for flag in fast_math if flag not in llvmir_c.FAST_MATH_FLAGS]
+    if unknown:
+        arg_parser.error(f"unknown fast-math flag(s): {', '.join(unknown)}")
+
+    if args.tree:
+        compile_program(args.filename, print_tree_flag=True, compact=args.compact, tree_out=args.tree_out)
+    elif args.pretty:
+        compile_program(args.filename, pretty=True)
+    elif args.typecheck_print:
+        compile_program(args.filename, typecheck_print=True)
     else:
-        compile_program(sys.argv[1])
+        options = dict(stack_array_limit=args.stack_array_limit, alloc_report=args.alloc_report,
+                       auto_memo=args.auto_memo, memo_size=args.memo_size, memo_policy=args.memo_policy,
+                       inline=args.inline, inline_budget=args.inline_budget, inline_report=args.inline_report,
+                       export_all=args.export_all, nsw=args.nsw, fast_math=fast_math,
+                       instrument=args.instrument, count_blocks=args.count_blocks, debug=args.debug,
+                       buffered_io=args.buffered_io)
+        if args.profile_alloc:
+            tracer = alloc_profile_compile_program(args.filename, args.profile_top, **options)
+        else:
+            tracer = Tracer(enabled=args.trace_out is not None)
+            with tracer.span("compile", file=args.filename):
+                if args.profile_compiler:
+                    profile_compile_program(args.filename, top=args.profile_top, tracer=tracer, **options)
+                else:
+                    compile_program(args.filename, tracer=tracer, **options)
+        if args.trace_out:
+            tracer.write(args.trace_out)
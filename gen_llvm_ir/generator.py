@@ -1,40 +1,463 @@
 from typing import Dict
+import hashlib
+import re
+import struct
 import sys
 import os
+from types import GeneratorType
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from tree.ast_nodes import *
+from resolver.resolver import Resolver
+from tree.traversal import trampoline
+from tree.source_map import SourceMap
+from tracing import Tracer
+from analysis.tail_calls import find_self_tail_calls
+from analysis.purity import PurityAnalysis
+from analysis.call_graph import call_graph, recursive_functions
+
+# Arrays larger than this many bytes are allocated on the heap
+DEFAULT_STACK_ARRAY_LIMIT = 64 * 1024
+
+# Memoized functions cache results in a direct-mapped table of this many
+# entries. On a collision "replace" evicts the old entry, "keep" leaves it
+DEFAULT_MEMO_SIZE = 4096
+MEMO_POLICIES = ("replace", "keep")
+
+# Fast-math flags that can be put on floating-point instructions, "fast" sets all of them
+FAST_MATH_FLAGS = ("nnan", "ninf", "nsz", "arcp", "contract", "afn", "reassoc", "fast")
+
+# Instructions that write memory, and the function a call targets
+MEMORY_WRITE = re.compile(r"^\s*(%\S+ = )?(store|atomicrmw|cmpxchg)\b")
+CALL_TARGET = re.compile(r"\bcall\b[^@]*@([\w.]+)\(")
+# Library functions LLVM knows to only compute on their arguments
+READNONE_LIBCALLS = ("pow",)
+
+# Debug info name, size in bits and DWARF encoding of the scalar types
+DEBUG_BASIC_TYPES = {
+    "int": ("int", 32, "DW_ATE_signed"),
+    "float": ("double", 64, "DW_ATE_float"),
+    "double": ("double", 64, "DW_ATE_float"),
+    "bool": ("bool", 8, "DW_ATE_boolean"),
+    "string": ("char", 8, "DW_ATE_signed_char"),
+}
+
+# Nodes that take the debug line of the statement they are part of
+EXPRESSION_TYPES = (BinaryExpression, UnaryExpression, Literal, VariableReference, FunctionCall, ArrayAccess,
+                    ReadExpression, ReadIntoExpression, ArrayLength)
 
 class LLVMIRGenerator:
-    def __init__(self, program: Program):
+    def __init__(self, program: Program, resolver: Resolver = None, expression_types: Dict[int, str] = None,
+                 stack_array_limit: int = DEFAULT_STACK_ARRAY_LIMIT, memo_size: int = DEFAULT_MEMO_SIZE,
+                 memo_policy: str = "replace", auto_memo: bool = False, export_all: bool = False,
+                 nsw: bool = False, fast_math=(), instrument: bool = False, count_blocks: bool = False,
+                 debug: bool = False, source_map: SourceMap = None, tracer: Tracer = None,
+                 buffered_io: bool = False):
         self.output = []
+        self.global_lines = []  # Emitted in reverse, they end up above the code
         self.indentation = 0
         self.temp_count = 0
         self.var_count = 0
-        self.symbol_table_stack = []  # Stack of symbol tables
-        self.function_signatures = {}
-        self.declaration_scope = None
+        self.symbol_table_stack = []  # Stack of block bookkeeping (loops, return slot)
         self.program = program
+        # Names are bound once by the resolver; codegen only maps each
+        # symbol to the IR value that stores it
+        self.resolver = resolver if resolver is not None else Resolver().resolve_program(program)
+        self.storage = {}  # Symbol to (type, IR name)
+        # id(expression) to PLush type, as computed once by the checker
+        self.expression_types = expression_types if expression_types is not None else {}
+        # String constants are named after their contents so that the same
+        # text always maps to the same global, whatever emits it first
+        self.string_constants = {}
+        self.array_constants = {}  # (array type, initializer) to global name
+        self.constant_names = set()
+        self.constant_aliases = set()  # Local symbols read straight from a constant global
+        self.memcpy_declared = False
+        self.stack_array_limit = stack_array_limit
+        self.heap_declared = False
+        self.input_declared = False  # The readers of runtime/plush_io.c
+        self.map_declared = False  # plush_map and plush_unmap, also in runtime/plush_io.c
+        self.allocations = []  # (function, array, type, bytes, strategy) for the report
+        self.function_name = None
+        self.entry_lines = []  # Hoisted into the entry block of the current function
+        self.entry_index = 0
+        self.exit_indices = []  # Output positions of the current function's ret lines
+        self.heap_slots = []  # Slots holding the heap arrays of the current function
+        self.mapped_slots = []  # (data slot, length slot, element size) of its mapped files
+        self.array_dimensions = {}  # Array symbol to its fixed dimensions
+        # Arrays only known through a pointer (parameters): symbol to
+        # (element type, element pointer, dimension values)
+        self.array_views = {}
+        self.tail_calls = set()  # ids of the current function's self tail calls
+        if memo_policy not in MEMO_POLICIES:
+            raise Exception(f"Unknown memo policy '{memo_policy}'")
+        self.memo_size = 1 << max(memo_size - 1, 0).bit_length()  # Rounded up to a power of two
+        self.memo_policy = memo_policy
+        self.auto_memo = auto_memo
+        self.memoized = set()  # Names of the functions compiled with a cache
+        self.purity = None  # PurityAnalysis of the program, from generate
+        # Functions other than main are internal unless other object files
+        # may call them
+        self.export_all = export_all
+        self.attributes = {}  # Function name to its function attributes
+        # Opt-in arithmetic flags: nsw makes signed int overflow undefined,
+        # fast-math flags let LLVM treat doubles like real numbers
+        self.nsw = nsw
+        for flag in fast_math:
+            if flag not in FAST_MATH_FLAGS:
+                raise Exception(f"Unknown fast-math flag '{flag}'")
+        self.fast_math = " ".join(fast_math)
+        # With instrument, every function counts its calls and time in a
+        # runtime table, see runtime/plush_profile.c
+        self.instrument = instrument
+        self.profile_entries = []  # Names of the instrumented functions, in table order
+        # With count_blocks, every branch target counts how often it runs
+        self.count_blocks = count_blocks
+        self.block_counters = []  # (file, function, kind, first line, last line) per counter
+        self.source_file = ""
+        # Node spans recorded by the parser, without them every line is 0
+        self.source_map = source_map
+        self.tracer = tracer if tracer is not None else Tracer(enabled=False)
+        # With debug, instructions carry !dbg locations so debuggers and
+        # profilers can map them back to PLush lines
+        self.debug = debug
+        self.debug_metadata = []  # Metadata node bodies, numbered from !0
+        self.debug_unit = None
+        self.debug_files = {}  # Source file to its DIFile
+        self.debug_types = {}  # Type key to its DIType
+        self.debug_locations = {}  # (line, scope) to its DILocation
+        self.debug_scope = None  # DISubprogram of the function being emitted
+        self.debug_line = 0
+        # With buffered_io, prints append to the output buffer of
+        # runtime/plush_io.c instead of calling printf each time
+        self.buffered_io = buffered_io
+        self.tail_params = []
 
     def emit(self, line):
+        # Everything in a function body but labels is an instruction
+        if self.debug_scope is not None and line and not line.endswith(":"):
+            line += self.debug_suffix()
         self.output.append("    " * self.indentation + line)
 
     def emit_global(self, line):
-        self.output.insert(0, line)
+        self.global_lines.append(line)
+
+    def emit_entry(self, line):
+        self.entry_lines.append("    " + line + self.debug_suffix())
+
+    def emit_alloca(self, line):
+        # Allocas all go to the entry block: LLVM only promotes those to
+        # registers, and one inside a loop would grow the stack every iteration
+        if self.function_name is None:
+            self.emit(line)
+        else:
+            self.emit_entry(line)
+
+    def emit_function_exit(self, line):
+        """Emit a `ret`, heap arrays are freed in front of it once the function is done."""
+        self.exit_indices.append(len(self.output))
+        self.emit(line)
+
+    def reset_function_counters(self):
+        # Temporaries, labels and slots are numbered per function, so editing
+        # one function does not rename anything in the others
+        self.temp_count = 0
+        self.var_count = 0
+
+    def constant_name(self, prefix, content):
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        length = 8
+        name = f"{prefix}.{digest[:length]}"
+        while name in self.constant_names:
+            length += 4
+            name = f"{prefix}.{digest[:length]}"
+        self.constant_names.add(name)
+        return name
+
+    def string_constant(self, text):
+        """Return the global holding `text`, emitting it on first use."""
+        if text in self.string_constants:
+            return self.string_constants[text]
+        name = self.constant_name(".str", text)
+        self.string_constants[text] = name
+        self.emit_global(f'@{name} = private unnamed_addr constant [{len(text)+1} x i8] c"{text}\\00"')
+        return name
+
+    def array_constant(self, array_type, initializer):
+        """Return the global holding an array literal, emitting it on first use."""
+        key = (array_type, initializer)
+        if key in self.array_constants:
+            return self.array_constants[key]
+        name = self.constant_name(".arr", f"{array_type} {initializer}")
+        self.array_constants[key] = name
+        self.emit_global(f"@{name} = private unnamed_addr constant {array_type} {initializer}, align 16")
+        return name
 
     def generate(self):
         # self.emit("; ModuleID = 'my_program'")
         self.emit("declare dso_local i32 @printf(i8*, ...)")
         self.emit("declare dso_local i32 @scanf(i8*, ...)")
         self.emit("declare double @pow(double, double)")
+        if self.buffered_io:
+            self.emit("declare void @plush_print_int(i32)")
+            self.emit("declare void @plush_print_double(double)")
+            self.emit("declare void @plush_print_string(i8*)")
+            self.emit("declare void @plush_printf(i8*, ...)")
         self.emit("")
         self.push_symbol_table()  # Global scope
+        if self.debug:
+            self.debug_unit = self.debug_compile_unit()
+        self.purity = PurityAnalysis(self.resolver).analyze(self.program)
+        self.memoized = self.memoized_functions(self.purity)
+        self.attributes = self.function_attributes(self.purity)
         self.process_global_variables(self.program.global_variables)
         for decl in self.program.declarations:
-            self.visit(decl)
+            with self.tracer.span(getattr(decl, "name", "main"), "declaration"):
+                self.visit(decl)
         self.pop_symbol_table()  # End global scope
-        return "\n".join(self.output)
+        if self.instrumented():
+            self.emit_runtime_tables()
+        if self.debug:
+            self.emit_debug_metadata()
+        return "\n".join(list(reversed(self.global_lines)) + self.output)
+
+    def instrumented(self):
+        """
+        Whether the generated code writes counters in globals. Every mode
+        that does must be listed here: it registers its tables through
+        emit_runtime_tables, and no function can then be readnone.
+        """
+        return self.instrument or self.count_blocks
+
+    def uses_io_runtime(self):
+        """Whether the generated code calls runtime/plush_io.c, which must then be linked in."""
+        return self.buffered_io or self.input_declared or self.map_declared or self.heap_declared
+
+    def emit_runtime_tables(self):
+        """Emit the counter tables and a constructor registering them with runtime/plush_profile.c."""
+        registrations = []
+        if self.instrument:
+            registrations.append(self.emit_profile_table())
+        if self.count_blocks:
+            registrations.append(self.emit_block_table())
+        self.emit("@llvm.global_ctors = appending global [1 x { i32, void ()*, i8* }] "
+                  "[{ i32, void ()*, i8* } { i32 65535, void ()* @plush.runtime.register, i8* null }]")
+        self.emit("define internal void @plush.runtime.register() nounwind {")
+        for line in registrations:
+            self.emit(f"    {line}")
+        self.emit("    ret void")
+        self.emit("}")
+
+    def string_pointer(self, text):
+        """A constant i8* to a NUL-terminated copy of `text`."""
+        name = self.string_constant(text)
+        return f"i8* getelementptr inbounds ([{len(text) + 1} x i8], [{len(text) + 1} x i8]* @{name}, i32 0, i32 0)"
+
+    def emit_profile_table(self):
+        """Emit the per-function counters, returns the call registering them."""
+        entry_type = "%plush.profile.entry"
+        table_type = f"[{len(self.profile_entries)} x {entry_type}*]"
+        self.emit_global(f"{entry_type} = type {{ i8*, i64, i64, i64 }}")
+        self.emit_global(f"declare i64 @plush_profile_enter({entry_type}*)")
+        self.emit_global(f"declare void @plush_profile_exit({entry_type}*, i64)")
+        self.emit_global(f"declare void @plush_profile_register({entry_type}**, i32)")
+        for name in self.profile_entries:
+            self.emit(f"@plush.profile.{name} = internal global {entry_type} {{ {self.string_pointer(name)}, i64 0, i64 0, i64 0 }}, align 8")
+        entries = ", ".join(f"{entry_type}* @plush.profile.{name}" for name in self.profile_entries)
+        self.emit(f"@plush.profile.table = internal global {table_type} [{entries}], align 8")
+        return (f"call void @plush_profile_register({entry_type}** getelementptr inbounds ({table_type}, {table_type}* "
+                f"@plush.profile.table, i32 0, i32 0), i32 {len(self.profile_entries)})")
+
+    def emit_block_table(self):
+        """Emit the block counters with their source lines, returns the call registering them."""
+        block_type = "%plush.block"
+        table_type = f"[{len(self.block_counters)} x {block_type}*]"
+        # Count, file, function, block kind, first and last source line
+        self.emit_global(f"{block_type} = type {{ i64, i8*, i8*, i8*, i32, i32 }}")
+        self.emit_global(f"declare void @plush_blocks_register({block_type}**, i32)")
+        for index, (source_file, function_name, kind, first_line, last_line) in enumerate(self.block_counters):
+            fields = ", ".join([
+                "i64 0", self.string_pointer(source_file), self.string_pointer(function_name),
+                self.string_pointer(kind), f"i32 {first_line}", f"i32 {last_line}",
+            ])
+            self.emit(f"@plush.block.{index} = internal global {block_type} {{ {fields} }}, align 8")
+        blocks = ", ".join(f"{block_type}* @plush.block.{index}" for index in range(len(self.block_counters)))
+        self.emit(f"@plush.block.table = internal global {table_type} [{blocks}], align 8")
+        return (f"call void @plush_blocks_register({block_type}** getelementptr inbounds ({table_type}, {table_type}* "
+                f"@plush.block.table, i32 0, i32 0), i32 {len(self.block_counters)})")
+
+    def count_block(self, kind, node, block=None):
+        """With count_blocks, count the runs of the block that was just labelled."""
+        if not self.count_blocks:
+            return
+        first_line, last_line = self.node_lines(node, block)
+        index = len(self.block_counters)
+        self.block_counters.append((self.source_file, self.function_name, kind, first_line, last_line))
+        counter = f"getelementptr inbounds (%plush.block, %plush.block* @plush.block.{index}, i32 0, i32 0)"
+        self.emit(f"%block{index}.count = load i64, i64* {counter}, align 8")
+        self.emit(f"%block{index}.next = add i64 %block{index}.count, 1")
+        self.emit(f"store i64 %block{index}.next, i64* {counter}, align 8")
+
+    def node_lines(self, node, block=None):
+        """First and last source line of a node, or of one of its blocks, 0 when unknown."""
+        if self.source_map is None:
+            return 0, 0
+        span = getattr(node, "block_spans", {}).get(block, self.source_map.span_of(node))
+        return (0, 0) if span is None else self.source_map.lines(span)
+
+    def debug_node(self, body):
+        """Add a metadata node, returns its reference."""
+        self.debug_metadata.append(body)
+        return f"!{len(self.debug_metadata) - 1}"
+
+    def debug_file(self, source_file):
+        if source_file not in self.debug_files:
+            path = os.path.abspath(source_file) if source_file else ""
+            self.debug_files[source_file] = self.debug_node(
+                f'!DIFile(filename: "{os.path.basename(path)}", directory: "{os.path.dirname(path)}")')
+        return self.debug_files[source_file]
+
+    def debug_compile_unit(self):
+        # The unit is named after the file holding main, imports get their own DIFile
+        main_files = [getattr(decl, "source_file", "") for decl in self.program.declarations
+                      if isinstance(decl, MainFunctionStatement)]
+        file = self.debug_file(main_files[0] if main_files else "")
+        return self.debug_node(f'distinct !DICompileUnit(language: DW_LANG_C99, file: {file}, producer: "plush", '
+                               f"isOptimized: false, runtimeVersion: 0, emissionKind: FullDebug)")
+
+    def debug_type(self, plush_type, pointer=False):
+        """The DIType of a scalar type, or of a pointer to it, "null" for void."""
+        if plush_type not in DEBUG_BASIC_TYPES:
+            return "null"
+        key = (plush_type, pointer)
+        if key not in self.debug_types:
+            if pointer:
+                body = f"!DIDerivedType(tag: DW_TAG_pointer_type, baseType: {self.debug_type(plush_type)}, size: 64)"
+            else:
+                name, size, encoding = DEBUG_BASIC_TYPES[plush_type]
+                body = f'!DIBasicType(name: "{name}", size: {size}, encoding: {encoding})'
+            self.debug_types[key] = self.debug_node(body)
+        return self.debug_types[key]
+
+    def debug_subprogram(self, node, function_name, define_name, linkage, params):
+        """Describe the function being defined, returns the DISubprogram its instructions are scoped to."""
+        file = self.debug_file(self.source_file)
+        # Arrays are passed as an element pointer and their dimensions
+        types = [self.debug_type(node.return_type)]
+        for param in params:
+            if isinstance(param.data_type, list):
+                _, *dimension_types = self.parameter_types(param.data_type)
+                types.append(self.debug_type(param.data_type[-1], pointer=True))
+                types.extend(self.debug_type("int") for _ in dimension_types)
+            else:
+                types.append(self.debug_type(param.data_type))
+        subroutine = self.debug_node(f"!DISubroutineType(types: !{{{', '.join(types)}}})")
+        flags = "DISPFlagDefinition" + (" | DISPFlagLocalToUnit" if linkage == "internal" else "")
+        linkage_name = f', linkageName: "{define_name}"' if define_name != function_name else ""
+        line, _ = self.node_lines(node)
+        return self.debug_node(f'distinct !DISubprogram(name: "{function_name}"{linkage_name}, scope: {file}, '
+                               f"file: {file}, line: {line}, type: {subroutine}, scopeLine: {line}, "
+                               f"spFlags: {flags}, unit: {self.debug_unit})")
+
+    def debug_suffix(self):
+        """`, !dbg` and the current line's location, empty outside of debug info."""
+        if self.debug_scope is None:
+            return ""
+        key = (self.debug_line, self.debug_scope)
+        if key not in self.debug_locations:
+            self.debug_locations[key] = self.debug_node(f"!DILocation(line: {self.debug_line}, scope: {self.debug_scope})")
+        return f", !dbg {self.debug_locations[key]}"
+
+    def at_line(self, line, visitor, node):
+        """Visit `node` with its instructions located at `line`, then go back to the enclosing line."""
+        outer = self.debug_line
+        self.debug_line = line
+        result = visitor(node)
+        if isinstance(result, GeneratorType):
+            result = yield from result
+        self.debug_line = outer
+        return result
+
+    def emit_debug_metadata(self):
+        dwarf_version = self.debug_node('!{i32 7, !"Dwarf Version", i32 4}')
+        debug_info_version = self.debug_node('!{i32 2, !"Debug Info Version", i32 3}')
+        self.emit(f"!llvm.dbg.cu = !{{{self.debug_unit}}}")
+        self.emit(f"!llvm.module.flags = !{{{dwarf_version}, {debug_info_version}}}")
+        for number, body in enumerate(self.debug_metadata):
+            self.emit(f"!{number} = {body}")
+
+    def memoized_functions(self, purity):
+        """Pure functions marked @memo, plus, with auto_memo, pure ones that recurse outside tail position."""
+        memoized = set()
+        for decl in self.program.declarations:
+            if not isinstance(decl, FunctionStatement) or not purity.is_pure(decl.name):
+                continue
+            if "memo" in decl.annotations:
+                memoized.add(decl.name)
+            elif self.auto_memo and purity.self_calls.get(decl.name, set()) - find_self_tail_calls(decl, self.resolver):
+                memoized.add(decl.name)
+        return memoized
+
+    def function_attributes(self, purity):
+        """
+        nounwind for every function, norecurse for those that cannot call
+        themselves, readnone for pure ones that only call readnone functions.
+        Pure functions only read the globals purity counts as constant, and
+        those are emitted as LLVM constants, so readnone holds. With
+        --instrument or --count-blocks every function updates counters, so
+        none is readnone; check_readnone catches any other write.
+        """
+        graph = call_graph(self.program)
+        if self.export_all:
+            # External functions may call back into any exported function
+            for decl in self.program.declarations:
+                if isinstance(decl, FunctionDeclaration):
+                    graph[decl.name] = set(graph)
+        recursive = recursive_functions(graph)
+
+        # The memo table, heap arrays, and profile and block counters are
+        # memory the function touches
+        readnone = set() if self.instrumented() else {
+            name for name in graph
+            if name != "main" and purity.is_pure(name) and name not in self.memoized
+            and not self.declares_arrays(self.resolver.functions[name].declaration)
+        }
+        changed = True
+        while changed:
+            changed = False
+            for name in list(readnone):
+                if not graph[name] <= readnone:
+                    readnone.discard(name)
+                    changed = True
+
+        attributes = {}
+        for name in graph:
+            attributes[name] = ["nounwind"]
+            if name not in recursive:
+                attributes[name].append("norecurse")
+            if name in readnone:
+                attributes[name].append("readnone")
+        return attributes
+
+    def declares_arrays(self, function):
+        pending = [function.body]
+        while pending:
+            statements = pending.pop()
+            for statement in statements or []:
+                if isinstance(statement, (ArrayDeclaration, ArrayAllocation)):
+                    return True
+                if isinstance(statement, IfStatement):
+                    pending.append(statement.then_block)
+                    pending.append(statement.else_block)
+                elif isinstance(statement, (WhileStatement, DoWhileStatement)):
+                    pending.append(statement.body)
+        return False
+
+    def linkage(self, function_name):
+        if function_name == "main" or self.export_all:
+            return "dso_local"
+        return "internal"
 
     def push_symbol_table(self):
         self.symbol_table_stack.append({})
@@ -43,16 +466,11 @@ class LLVMIRGenerator:
         if self.symbol_table_stack:
             self.symbol_table_stack.pop()
 
-    def add_to_symbol_table(self, name, var_type, _var_name, _var_type=None):
+    def add_to_symbol_table(self, name, var_type, _var_name):
         if self.symbol_table_stack:
             if name in self.symbol_table_stack[-1]:
                 raise Exception(f"Variable '{name}' already defined")
-            elif _var_type == "parameter":
-                _params = self.symbol_table_stack[-1].get("params", {})
-                _params[name] = (var_type, _var_name)
-                self.symbol_table_stack[-1]["params"] = _params
-            else:
-                self.symbol_table_stack[-1][name] = (var_type, _var_name)
+            self.symbol_table_stack[-1][name] = (var_type, _var_name)
     
     def lookup_symbol(self, name):
         # Search from the top of the stack downwards
@@ -61,6 +479,32 @@ class LLVMIRGenerator:
                 return table[name]
         raise Exception(f"Undefined variable '{name}'")
 
+    def declared_symbol(self, node):
+        symbol = self.resolver.declarations.get(id(node))
+        if symbol is None:
+            raise Exception(f"Variable '{node.name}' already defined")
+        return symbol
+
+    def lookup_storage(self, node, name):
+        """Return the symbol bound to `node` and its (type, IR name)."""
+        symbol = self.resolver.symbol_for(node)
+        if symbol is None or symbol not in self.storage:
+            raise Exception(f"Undefined variable '{name}'")
+        return symbol, self.storage[symbol]
+
+    def typed(self, node, ir_type):
+        """Prefer the checker's type for `node` over the one derived while emitting it."""
+        plush_type = self.expression_types.get(id(node))
+        if plush_type in (None, "string", "void") or isinstance(plush_type, list):
+            return ir_type
+        return self.get_type(plush_type)
+
+    def address_of(self, symbol):
+        _, ir_name = self.storage[symbol]
+        if symbol.storage == "global" or symbol in self.constant_aliases:
+            return f"@{ir_name}"
+        return f"%{ir_name}"
+
     def add_while_blocks_to_symbol_table(self, while_condition, while_body, while_end):
         self.symbol_table_stack[-1]["while_condition"] = while_condition
         self.symbol_table_stack[-1]["while_body"] = while_body
@@ -90,28 +534,44 @@ class LLVMIRGenerator:
         return [0]
 
     def process_global_variables(self, globals):
-        self.declaration_scope = "global"
         for var_decl in globals.declarations:
             self.visit(var_decl)
 
-        self.declaration_scope = None
-
     def visit(self, node):
+        """Visit a node on an explicit stack, see tree.traversal."""
+        return trampoline(node, self.dispatch)
+
+    def dispatch(self, node):
         """Dispatch method to visit nodes."""
         if isinstance(node, list):
-            for item in node:
-                self.visit(item)
-        else:
-            method_name = "visit_" + node.__class__.__name__
-            visitor = getattr(self, method_name, self.generic_visit)
-            return visitor(node)
+            return self.visit_list(node)
+        method_name = "visit_" + node.__class__.__name__
+        visitor = getattr(self, method_name, self.generic_visit)
+        # Statements and functions carry their line. Expressions keep the
+        # line of their statement, inlined copies hold the callee's spans
+        if self.debug and not isinstance(node, EXPRESSION_TYPES):
+            line, _ = self.node_lines(node)
+            if line:
+                return self.at_line(line, visitor, node)
+        return visitor(node)
+
+    def visit_list(self, nodes):
+        for item in nodes:
+            yield item
 
     def generic_visit(self, node):
         """Fallback method."""
         raise Exception(f"No visit_{node.__class__.__name__} method")
     
     def visit_PrintStatement(self, node):
-        expr_type, expr_ir = self.visit(node.expression)
+        expr_type, expr_ir = yield node.expression
+        if node.print_type == "string":
+            expr_type = "i8*"
+            expr_ir = expr_ir.replace("getelementptr inbounds", "getelementptr inbounds (") + ")"
+        if self.buffered_io:
+            # One formatter per type, no format string to parse at run time
+            self.emit(f"call void @plush_print_{node.print_type}({expr_type} {expr_ir})")
+            return
         if node.print_type == "int":
             format_str = "%d\n"
         elif node.print_type == "string":
@@ -119,12 +579,10 @@ class LLVMIRGenerator:
         elif node.print_type == "double":
             format_str = "%f\n"
         
-        self.emit_global(f'@.str{self.var_count} = private unnamed_addr constant [{len(format_str)+1} x i8] c"{format_str}\\00"')
-        format_str_ptr = f'getelementptr inbounds ([{len(format_str)+1} x i8], [{len(format_str)+1} x i8]* @.str{self.var_count}, i32 0, i32 0)'
-        self.var_count += 1
+        str_name = self.string_constant(format_str)
+        format_str_ptr = f'getelementptr inbounds ([{len(format_str)+1} x i8], [{len(format_str)+1} x i8]* @{str_name}, i32 0, i32 0)'
 
         if node.print_type == "string":
-            expr_ir = expr_ir.replace("getelementptr inbounds", "getelementptr inbounds (") + ")"
             self.emit(f"call i32 (i8*, ...) @printf(i8* {format_str_ptr}, i8* {expr_ir})")
         else:
             self.emit(f"call i32 (i8*, ...) @printf(i8* {format_str_ptr}, {expr_type} {expr_ir})")
@@ -132,93 +590,136 @@ class LLVMIRGenerator:
     def visit_PrintfStatement(self, node):
         # Format string
         format_str = node.format_string
-        self.emit_global(f'@.str{self.var_count} = private unnamed_addr constant [{len(format_str)+1} x i8] c"{format_str}\\00"')
-        format_str_ptr = f'getelementptr inbounds ([{len(format_str)+1} x i8], [{len(format_str)+1} x i8]* @.str{self.var_count}, i32 0, i32 0)'
-        self.var_count += 1
+        str_name = self.string_constant(format_str)
+        format_str_ptr = f'getelementptr inbounds ([{len(format_str)+1} x i8], [{len(format_str)+1} x i8]* @{str_name}, i32 0, i32 0)'
         
         # Arguments
-        args = [self.visit(arg) for arg in node.arguments]
+        args = []
+        for arg in node.arguments:
+            args.append((yield arg))
         args_ir = ", ".join(f"{arg_type} {arg_ir}" for arg_type, arg_ir in args)
         
-        self.emit(f"call i32 (i8*, ...) @printf(i8* {format_str_ptr}, {args_ir})")
+        if self.buffered_io:
+            self.emit(f"call void (i8*, ...) @plush_printf(i8* {format_str_ptr}, {args_ir})")
+        else:
+            self.emit(f"call i32 (i8*, ...) @printf(i8* {format_str_ptr}, {args_ir})")
+
+    def declare_input(self):
+        if not self.input_declared:
+            self.emit_global("declare i32 @plush_read_int()")
+            self.emit_global("declare double @plush_read_double()")
+            self.emit_global("declare i32 @plush_read_ints(i32*, i32, i32)")
+            self.emit_global("declare i32 @plush_read_doubles(double*, i32, i32)")
+            self.input_declared = True
+
+    def visit_ReadExpression(self, node):
+        self.declare_input()
+        type_ir = self.get_type(node.read_type)
+        result_var = f"%tmp{self.temp_count}"
+        self.temp_count += 1
+        self.emit(f"{result_var} = call {type_ir} @plush_read_{node.read_type}()")
+        return (type_ir, result_var)
+
+    def visit_ReadIntoExpression(self, node):
+        self.declare_input()
+        symbol = self.resolver.symbol_for(node)
+        if symbol is None or symbol not in self.storage:
+            raise Exception(f"Undefined variable '{node.target}'")
+        # Numbers fill the array in row-major order, never past its last element
+        pointer, *dimensions = self.array_argument(symbol)
+        capacity = 1
+        for dimension in dimensions:
+            value = dimension.split()[1]
+            if isinstance(capacity, int) and value.lstrip("-").isdigit():
+                capacity *= int(value)
+            else:
+                product = f"%tmp{self.temp_count}"
+                self.temp_count += 1
+                self.emit(f"{product} = mul i32 {capacity}, {value}")
+                capacity = product
+        _, count = yield node.count
+        result_var = f"%tmp{self.temp_count}"
+        self.temp_count += 1
+        self.emit(f"{result_var} = call i32 @plush_read_{node.read_type}s({pointer}, i32 {count}, i32 {capacity})")
+        return ("i32", result_var)
 
     def visit_VariableDeclaration(self, node):
+        symbol = self.declared_symbol(node)
         type_ir = self.get_type(node.data_type)
         if isinstance(node.data_type, list):  # Check if it's an array
             element_type_ir = self.get_type(node.data_type[-1])
             dimensions = self.calculate_array_dimensions(node.value)
-            var_name = f"x{self.var_count}"
-            self.var_count += 1
+            var_name = f"x{symbol.slot}"
             array_type = f"[{dimensions[0]} x [{dimensions[1]} x {element_type_ir}]]"
             
-            self.emit(f"%{var_name} = alloca {array_type}, align 16")
+            self.emit_alloca(f"%{var_name} = alloca {array_type}, align 16")
             
             # Initialize the array with values
             for i, row in enumerate(node.value):
                 for j, value in enumerate(row):
                     element_ptr = f"%{var_name}_{i}_{j}_ptr"
                     self.emit(f"{element_ptr} = getelementptr inbounds {array_type}, {array_type}* %{var_name}, i32 0, i32 {i}, i32 {j}")
-                    self.emit(f"store {element_type_ir} {value.value}, {element_type_ir}* {element_ptr}, align 16")
+                    self.emit(f"store {element_type_ir} {value.value}, {element_type_ir}* {element_ptr}, {self.calculate_alignment(element_type_ir)}")
         else:
-            lit_type, value = self.visit(node.value) if node.value else "0"
-            if self.declaration_scope == "global":
-                var_vame = f"g{self.var_count}"
-                self.var_count += 1
+            lit_type, value = (yield node.value) if node.value else "0"
+            if symbol.storage == "global":
+                # Globals are named after the source variable, the ones
+                # never assigned are constants LLVM can fold
+                var_vame = f"g.{node.name}"
+                linkage = "constant" if self.purity.is_constant(symbol) else "global"
                 if type_ir in ("float", "double"):
-                    self.emit(f"@{var_vame} = global {type_ir} {float(value)}, align 8")
+                    self.emit(f"@{var_vame} = {linkage} {type_ir} {float(value)}, align 8")
                 elif type_ir == "i1":
-                    self.emit(f"@{var_vame} = global {type_ir} {int(value)}, align 1")
+                    self.emit(f"@{var_vame} = {linkage} {type_ir} {int(value)}, align 1")
                 else:
-                    self.emit(f"@{var_vame} = global {type_ir} {value}, align 4")
+                    self.emit(f"@{var_vame} = {linkage} {type_ir} {value}, align 4")
             else:
-                var_vame = f"x{self.var_count}"
-                self.var_count += 1
+                var_vame = f"x{symbol.slot}"
                 # Allocate memory for the variable
                 # Store the initial value
                 if node.value:
                     if isinstance(node.value, Literal):
                         if type_ir in ("float", "double"):
-                            self.emit(f"%{var_vame} = alloca {type_ir}, align 8")
+                            self.emit_alloca(f"%{var_vame} = alloca {type_ir}, align 8")
                             self.emit(
                                 f"store {type_ir} {float(value)}, {type_ir}* %{var_vame}, align 8"
                             )
                         elif type_ir == "i1":
-                            self.emit(f"%{var_vame} = alloca {type_ir}, align 1")
+                            self.emit_alloca(f"%{var_vame} = alloca {type_ir}, align 1")
                             self.emit(
                                 f"store {type_ir} {int(value)}, {type_ir}* %{var_vame}, align 1"
                             )
                         elif type_ir == "i8":
                             self.emit(f"%{var_vame} = {value}")
                         else:
-                            self.emit(f"%{var_vame} = alloca {type_ir}, align 4")
+                            self.emit_alloca(f"%{var_vame} = alloca {type_ir}, align 4")
                             self.emit(
                                 f"store {type_ir} {value}, {type_ir}* %{var_vame}, align 4"
                             )
                     else:
                         if lit_type in ("float", "double"):
-                            self.emit(f"%{var_vame} = alloca {lit_type}, align 8")
+                            self.emit_alloca(f"%{var_vame} = alloca {lit_type}, align 8")
                             self.emit(
                                 f"store {lit_type} {value}, {lit_type}* %{var_vame}, align 8"
                             )
                         elif lit_type == "i1":
-                            self.emit(f"%{var_vame} = alloca {lit_type}, align 1")
+                            self.emit_alloca(f"%{var_vame} = alloca {lit_type}, align 1")
                             self.emit(
                                 f"store {lit_type} {value}, {lit_type}* %{var_vame}, align 1"
                             )
                         else:
-                            self.emit(f"%{var_vame} = alloca {lit_type}, align 4")
+                            self.emit_alloca(f"%{var_vame} = alloca {lit_type}, align 4")
                             self.emit(
                                 f"store {type_ir} {value}, {type_ir}* %{var_vame}, align 4"
                             )
 
-        self.add_to_symbol_table(node.name, node.data_type, var_vame)
+        self.storage[symbol] = (node.data_type, var_vame)
     
     def calculate_alignment(self, type_str):
-        if type_str in ("float", "double"):
-            return "align 8"
-        elif type_str == "i1":
-            return "align 1"
-        return "align 4"
+        # Scalars are aligned to their size on the targets PLush supports;
+        # claiming more than that lets LLVM emit aligned vector accesses on
+        # addresses that are not
+        return f"align {self.type_size(type_str)}"
     
     def calculate_array_type(self, element_type, dimensions):
         if dimensions:
@@ -226,14 +727,18 @@ class LLVMIRGenerator:
         return element_type
 
     def process_value(self, value, indices, var_name, array_type, element_type_ir):
-        if isinstance(value, list):
-            for i, subvalue in enumerate(value):
-                self.process_value(subvalue, indices + [i], var_name, array_type, element_type_ir)
-        else:
+        # Elements are stored in row-major order, children pushed in reverse
+        pending = [(value, indices)]
+        while pending:
+            value, indices = pending.pop()
+            if isinstance(value, list):
+                for i in reversed(range(len(value))):
+                    pending.append((value[i], indices + [i]))
+                continue
             element_ptr = f"%{var_name}{''.join(f'_{idx}' for idx in indices)}_ptr"
             indices_str = ", ".join(f"i32 {idx}" for idx in [0] + indices)
             self.emit(f"{element_ptr} = getelementptr inbounds {array_type}, {array_type}* %{var_name}, {indices_str}")
-            self.emit(f"store {element_type_ir} {value.value}, {element_type_ir}* {element_ptr}, align 16")
+            self.emit(f"store {element_type_ir} {value.value}, {element_type_ir}* {element_ptr}, {self.calculate_alignment(element_type_ir)}")
 
     def is_last_line_block_statement(self):
         """Check if the last line of the output is a block statement."""
@@ -243,84 +748,337 @@ class LLVMIRGenerator:
         return last_line.endswith(":")
     
     def visit_ArrayAllocation(self, node: ArrayAllocation):
+        symbol = self.declared_symbol(node)
         element_type_ir = self.get_type(node.data_type[-1])
         dimensions = node.lengths
-        var_name = f"x{self.var_count}"
-        self.var_count += 1
         # dimensions is a list of the array dimensions
         array_type = self.calculate_array_type(element_type_ir, dimensions)
-        
-        self.emit(f"%{var_name} = alloca {array_type}, align 16")
-        
-        self.add_to_symbol_table(node.name, [array_type, node.data_type], var_name)
+
+        self.array_dimensions[symbol] = dimensions
+
+        if symbol.storage == "global":
+            var_name = f"g.{node.name}"
+            linkage = "constant" if self.purity.is_constant(symbol) else "global"
+            self.emit(f"@{var_name} = {linkage} {array_type} zeroinitializer, align 16")
+            self.record_allocation(node.name, array_type, dimensions, element_type_ir, "global")
+        else:
+            var_name = f"x{symbol.slot}"
+            self.allocate_array(node.name, var_name, array_type, dimensions, element_type_ir)
+
+        self.storage[symbol] = ([array_type, node.data_type], var_name)
+
+    def array_size(self, dimensions, element_type_ir):
+        size = self.type_size(element_type_ir)
+        for dimension in dimensions:
+            size *= dimension
+        return size
+
+    def record_allocation(self, name, array_type, dimensions, element_type_ir, strategy):
+        size = self.array_size(dimensions, element_type_ir)
+        self.allocations.append((self.function_name or "<global>", name, array_type, size, strategy))
+
+    def allocate_array(self, name, var_name, array_type, dimensions, element_type_ir):
+        """Give a local array storage at %var_name, on the heap when it is too large for the stack."""
+        size = self.array_size(dimensions, element_type_ir)
+        if size <= self.stack_array_limit:
+            self.emit_alloca(f"%{var_name} = alloca {array_type}, align 16")
+            self.record_allocation(name, array_type, dimensions, element_type_ir, "stack")
+            return
+
+        if not self.heap_declared:
+            self.emit_global("declare noalias i8* @calloc(i64, i64)")
+            self.emit_global("declare void @free(i8*)")
+            self.emit_global("declare void @plush_alloc_failed(i64, i64) cold noreturn nounwind")
+            self.heap_declared = True
+        # The slot starts out null in the entry block; a declaration that runs
+        # again (inside a loop) frees the previous block before allocating
+        slot = f"%{var_name}_slot"
+        self.emit_entry(f"{slot} = alloca i8*, align 8")
+        self.emit_entry(f"store i8* null, i8** {slot}, align 8")
+        self.heap_slots.append(slot)
+        element_size = self.type_size(element_type_ir)
+        self.emit(f"%{var_name}_old = load i8*, i8** {slot}, align 8")
+        self.emit(f"call void @free(i8* %{var_name}_old)")
+        count = size // element_size
+        self.emit(f"%{var_name}_heap = call i8* @calloc(i64 {count}, i64 {element_size})")
+        # Like plush_map, a failed allocation exits with a message on stderr
+        self.emit(f"%{var_name}_failed = icmp eq i8* %{var_name}_heap, null")
+        self.emit(f"br i1 %{var_name}_failed, label %{var_name}_no_memory, label %{var_name}_allocated")
+        self.indentation -= 1
+        self.emit(f"{var_name}_no_memory:")
+        self.indentation += 1
+        self.emit(f"call void @plush_alloc_failed(i64 {count}, i64 {element_size})")
+        self.emit("unreachable")
+        self.indentation -= 1
+        self.emit(f"{var_name}_allocated:")
+        self.indentation += 1
+        self.emit(f"store i8* %{var_name}_heap, i8** {slot}, align 8")
+        self.emit(f"%{var_name} = bitcast i8* %{var_name}_heap to {array_type}*")
+        self.record_allocation(name, array_type, dimensions, element_type_ir, "heap")
+
+    def finish_function(self):
+        """
+        Free the current function's heap arrays, unmap its mapped files and
+        stop its profile timer in front of each of its exits, then place the
+        entry block lines.
+        """
+        for exit_number, index in reversed(list(enumerate(self.exit_indices))):
+            line = self.output[index]
+            indent = line[:len(line) - len(line.lstrip())]
+            frees = []
+            for slot in self.heap_slots:
+                loaded = f"{slot}_exit{exit_number}"
+                frees.append(f"{indent}{loaded} = load i8*, i8** {slot}, align 8{self.debug_suffix()}")
+                frees.append(f"{indent}call void @free(i8* {loaded}){self.debug_suffix()}")
+            for slot, length_slot, element_size in self.mapped_slots:
+                loaded = f"{slot}_exit{exit_number}"
+                length = f"{length_slot}_exit{exit_number}"
+                frees.append(f"{indent}{loaded} = load i8*, i8** {slot}, align 8{self.debug_suffix()}")
+                frees.append(f"{indent}{length} = load i32, i32* {length_slot}, align 4{self.debug_suffix()}")
+                frees.append(f"{indent}call void @plush_unmap(i8* {loaded}, i32 {length}, i64 {element_size}){self.debug_suffix()}")
+            if self.instrument:
+                frees.append(f"{indent}call void @plush_profile_exit(%plush.profile.entry* @plush.profile.{self.function_name}, "
+                             f"i64 %profile.start){self.debug_suffix()}")
+            self.output[index:index] = frees
+        self.output[self.entry_index:self.entry_index] = self.entry_lines
+        if "readnone" in self.attributes.get(self.function_name, []):
+            self.check_readnone(self.output[self.entry_index:])
+
+    def check_readnone(self, body):
+        """
+        A readnone function may only write its own allocas and call other
+        readnone functions, intrinsics or pow, a new instrumentation mode left
+        out of instrumented() fails here instead of miscompiling.
+        """
+        for line in body:
+            if MEMORY_WRITE.match(line) and "@" in line:
+                raise Exception(f"readnone function '{self.function_name}' writes a global: {line.strip()}")
+            for callee in CALL_TARGET.findall(line):
+                if callee.startswith("llvm.") or callee in READNONE_LIBCALLS:
+                    continue
+                if "readnone" not in self.attributes.get(callee, []):
+                    raise Exception(f"readnone function '{self.function_name}' calls '{callee}'")
+
+    def allocation_report(self):
+        """Lines listing where each array was allocated and why."""
+        lines = [f"Array allocations (stack limit {self.stack_array_limit} bytes):"]
+        for function_name, name, array_type, size, strategy in self.allocations:
+            lines.append(f"  {function_name}: {name} {array_type} {size} bytes -> {strategy}")
+        return lines
 
     def visit_ArrayDeclaration(self, node):
+        symbol = self.declared_symbol(node)
         element_type_ir = self.get_type(node.data_type[-1])
         dimensions = self.calculate_array_dimensions(node.value)
-        var_name = f"x{self.var_count}"
-        self.var_count += 1
         # dimensions is a list of the array dimensions
         array_type = self.calculate_array_type(element_type_ir, dimensions)
-        
-        self.emit(f"%{var_name} = alloca {array_type}, align 16")
-        
-        # Initialize the array with values
-        self.process_value(node.value, [], var_name, array_type, element_type_ir)
-        
-        self.add_to_symbol_table(node.name, [array_type, node.data_type], var_name)
+        initializer = self.constant_initializer(node.value, element_type_ir)
+        read_only = node.var_kind == "val" and not symbol.mutated
+        self.array_dimensions[symbol] = dimensions
+
+        if symbol.storage == "global":
+            if initializer is None:
+                raise Exception(f"Global array '{node.name}' must be initialized with literals")
+            var_name = f"g.{node.name}"
+            linkage = "constant" if read_only else "global"
+            self.emit(f"@{var_name} = {linkage} {array_type} {initializer}, align 16")
+            self.record_allocation(node.name, array_type, dimensions, element_type_ir, "global")
+        elif initializer is not None and read_only:
+            # Never written, so the literal itself is the array
+            var_name = self.array_constant(array_type, initializer)
+            self.constant_aliases.add(symbol)
+            self.record_allocation(node.name, array_type, dimensions, element_type_ir, "constant")
+        elif initializer is not None:
+            var_name = f"x{symbol.slot}"
+            self.allocate_array(node.name, var_name, array_type, dimensions, element_type_ir)
+            self.copy_array_constant(var_name, array_type, self.array_constant(array_type, initializer), dimensions, element_type_ir)
+        else:
+            var_name = f"x{symbol.slot}"
+            self.allocate_array(node.name, var_name, array_type, dimensions, element_type_ir)
+            # Initialize the array with values
+            self.process_value(node.value, [], var_name, array_type, element_type_ir)
+
+        self.storage[symbol] = ([array_type, node.data_type], var_name)
+
+    def visit_MappedArrayDeclaration(self, node):
+        symbol = self.declared_symbol(node)
+        if symbol.storage == "global":
+            raise Exception(f"Global array '{node.name}' cannot map a file")
+        if not self.map_declared:
+            self.emit_global("declare i8* @plush_map(i8*, i64, i32*)")
+            self.emit_global("declare void @plush_unmap(i8*, i32, i64)")
+            self.map_declared = True
+        element_type_ir = self.get_type(node.map_type)
+        element_size = self.type_size(element_type_ir)
+        _, path = yield node.path
+        path = path.replace("getelementptr inbounds", "getelementptr inbounds (") + ")"
+
+        # Like heap arrays, the slots start out empty in the entry block and
+        # a declaration that runs again unmaps the previous file first
+        var_name = f"x{symbol.slot}"
+        slot = f"%{var_name}_map_slot"
+        length_slot = f"%{var_name}_length_slot"
+        self.emit_entry(f"{slot} = alloca i8*, align 8")
+        self.emit_entry(f"store i8* null, i8** {slot}, align 8")
+        self.emit_entry(f"{length_slot} = alloca i32, align 4")
+        self.emit_entry(f"store i32 0, i32* {length_slot}, align 4")
+        self.mapped_slots.append((slot, length_slot, element_size))
+        self.emit(f"%{var_name}_old = load i8*, i8** {slot}, align 8")
+        self.emit(f"%{var_name}_old_length = load i32, i32* {length_slot}, align 4")
+        self.emit(f"call void @plush_unmap(i8* %{var_name}_old, i32 %{var_name}_old_length, i64 {element_size})")
+        self.emit(f"%{var_name}_map = call i8* @plush_map(i8* {path}, i64 {element_size}, i32* {length_slot})")
+        self.emit(f"store i8* %{var_name}_map, i8** {slot}, align 8")
+        self.emit(f"%{var_name}_length = load i32, i32* {length_slot}, align 4")
+        self.emit(f"%{var_name}_data = bitcast i8* %{var_name}_map to {element_type_ir}*")
+
+        # Accessed through the pointer like an array parameter, nothing is copied
+        self.array_views[symbol] = (element_type_ir, f"%{var_name}_data", [f"%{var_name}_length"])
+        self.storage[symbol] = (node.data_type, var_name)
+
+    def visit_ArrayLength(self, node):
+        symbol, _ = self.lookup_storage(node, node.name)
+        if symbol in self.array_views:
+            _, _, dimensions = self.array_views[symbol]
+            return ("i32", dimensions[0])
+        return ("i32", f"{self.array_dimensions[symbol][0]}")
+
+    def constant_initializer(self, value, element_type_ir):
+        """Return the LLVM constant for a rectangular literal array, or None."""
+        if not isinstance(value, list):
+            if not isinstance(value, Literal):
+                return None
+            return self.format_constant(value.value, element_type_ir)
+        item_dimensions = self.calculate_array_dimensions(value[0]) if isinstance(value[0], list) else None
+        item_type = self.calculate_array_type(element_type_ir, item_dimensions) if item_dimensions else element_type_ir
+        parts = []
+        for item in value:
+            if isinstance(item, list) != (item_dimensions is not None):
+                return None
+            if item_dimensions and self.calculate_array_dimensions(item) != item_dimensions:
+                return None
+            item_ir = self.constant_initializer(item, element_type_ir)
+            if item_ir is None:
+                return None
+            parts.append(f"{item_type} {item_ir}")
+        return f"[{', '.join(parts)}]"
+
+    def format_constant(self, value, type_ir):
+        if type_ir in ("float", "double"):
+            return self.format_double(float(value))
+        return f"{int(value)}"
+
+    def format_double(self, value):
+        # LLVM reads decimals only with a fraction part, anything else
+        # (exponent-only forms, inf, nan) is written as the exact bit pattern
+        text = repr(value)
+        if "." in text:
+            return text
+        return "0x" + struct.pack(">d", value).hex().upper()
+
+    def copy_array_constant(self, var_name, array_type, constant_name, dimensions, element_type_ir):
+        if not self.memcpy_declared:
+            self.emit_global("declare void @llvm.memcpy.p0i8.p0i8.i64(i8* noalias nocapture writeonly, i8* noalias nocapture readonly, i64, i1 immarg)")
+            self.memcpy_declared = True
+        size = self.array_size(dimensions, element_type_ir)
+        self.emit(f"%{var_name}_bytes = bitcast {array_type}* %{var_name} to i8*")
+        self.emit(
+            f"call void @llvm.memcpy.p0i8.p0i8.i64(i8* align 16 %{var_name}_bytes, "
+            f"i8* align 16 bitcast ({array_type}* @{constant_name} to i8*), i64 {size}, i1 false)"
+        )
 
-    def visit_ArrayAccess(self, node):
-        var_type, var_name = self.lookup_symbol(node.name)
-        _array_shape_str, _array_shape_list = var_type
-        element_type_ir = self.get_type(_array_shape_list[-1])
-        
-        index_vals = [self.visit(index)[1] for index in node.index]
-        array_access_str = ", ".join([f"i32 {index_val}" for index_val in index_vals])
+    def type_size(self, type_ir):
+        return {"i1": 1, "i8": 1, "i32": 4, "float": 4, "double": 8}.get(type_ir, 8)
+
+    def element_pointer(self, symbol, var_type, var_name, index_vals):
+        """Emit the address of one array element and return it."""
         element_ptr = f"%{var_name}_element_ptr_{self.var_count}"
         self.var_count += 1
-        self.emit(f"{element_ptr} = getelementptr inbounds {_array_shape_str}, {_array_shape_str}* %{var_name}, i32 0, {array_access_str}")
-        
+        if symbol in self.array_views:
+            # Row-major offset from the dimensions passed with the pointer
+            element_type_ir, pointer, dimensions = self.array_views[symbol]
+            offset = index_vals[0]
+            for dimension, index_val in zip(dimensions[1:], index_vals[1:]):
+                scaled = f"%tmp{self.temp_count}"
+                self.temp_count += 1
+                self.emit(f"{scaled} = mul i32 {offset}, {dimension}")
+                offset = f"%tmp{self.temp_count}"
+                self.temp_count += 1
+                self.emit(f"{offset} = add i32 {scaled}, {index_val}")
+            self.emit(f"{element_ptr} = getelementptr inbounds {element_type_ir}, {element_type_ir}* {pointer}, i32 {offset}")
+            return element_ptr
+
+        _array_shape_str, _array_shape_list = var_type
+        array_access_str = ", ".join([f"i32 {index_val}" for index_val in index_vals])
+        self.emit(f"{element_ptr} = getelementptr inbounds {_array_shape_str}, {_array_shape_str}* {self.address_of(symbol)}, i32 0, {array_access_str}")
+        return element_ptr
+
+    def array_argument(self, symbol):
+        """Lower an array argument to its element pointer followed by its dimensions."""
+        if symbol in self.array_views:
+            element_type_ir, pointer, dimensions = self.array_views[symbol]
+        else:
+            (array_type, data_type), var_name = self.storage[symbol]
+            element_type_ir = self.get_type(data_type[-1])
+            dimensions = self.array_dimensions[symbol]
+            pointer = f"%{var_name}_ptr_{self.var_count}"
+            self.var_count += 1
+            zeros = ", ".join(["i32 0"] * (len(dimensions) + 1))
+            self.emit(f"{pointer} = getelementptr inbounds {array_type}, {array_type}* {self.address_of(symbol)}, {zeros}")
+        return [f"{element_type_ir}* {pointer}"] + [f"i32 {dimension}" for dimension in dimensions]
+
+    def parameter_types(self, param_type):
+        """LLVM types a parameter is passed as, arrays take one i32 per dimension."""
+        if isinstance(param_type, list):
+            return [f"{self.get_type(param_type[-1])}*"] + ["i32"] * (len(param_type) - 1)
+        return [self.get_type(param_type)]
+
+    def visit_ArrayAccess(self, node):
+        symbol, (var_type, var_name) = self.lookup_storage(node, node.name)
+        element_type_ir = self.get_type(symbol.data_type[-1])
+
+        index_vals = []
+        for index in node.index:
+            index_vals.append((yield index)[1])
+        element_ptr = self.element_pointer(symbol, var_type, var_name, index_vals)
+
         load_var = f"%{node.name}_tmp{self.temp_count}"
         self.temp_count += 1
-        self.emit(f"{load_var} = load {element_type_ir}, {element_type_ir}* {element_ptr}, align 16")
+        self.emit(f"{load_var} = load {element_type_ir}, {element_type_ir}* {element_ptr}, {self.calculate_alignment(element_type_ir)}")
         return element_type_ir, load_var
 
     def visit_ArrayAssignmentStatement(self, node):
-        var_type, var_name = self.lookup_symbol(node.target)
-        _array_shape_str, _array_shape_list = var_type
-        element_type_ir = self.get_type(_array_shape_list[-1])
-        
-        index_vals = [self.visit(index)[1] for index in node.index]
-        array_access_str = ", ".join([f"i32 {index_val}" for index_val in index_vals])
-        element_ptr = f"%{var_name}_element_ptr_{self.var_count}"
-        self.var_count += 1
-        self.emit(f"{element_ptr} = getelementptr inbounds {_array_shape_str}, {_array_shape_str}* %{var_name}, i32 0, {array_access_str}")
-        
-        value_type, value_ir = self.visit(node.value)
-        self.emit(f"store {element_type_ir} {value_ir}, {element_type_ir}* {element_ptr}, align 16")
+        symbol, (var_type, var_name) = self.lookup_storage(node, node.target)
+        element_type_ir = self.get_type(symbol.data_type[-1])
+
+        index_vals = []
+        for index in node.index:
+            index_vals.append((yield index)[1])
+        element_ptr = self.element_pointer(symbol, var_type, var_name, index_vals)
+
+        value_type, value_ir = yield node.value
+        self.emit(f"store {element_type_ir} {value_ir}, {element_type_ir}* {element_ptr}, {self.calculate_alignment(element_type_ir)}")
 
     def visit_VariableReference(self, node):
-        var_type, var_name = self.lookup_symbol(node.name)
+        symbol, (var_type, var_name) = self.lookup_storage(node, node.name)
         var_type = self.get_type(var_type)
         tmp_var = f"%{node.name}_tmp{self.temp_count}"
         self.temp_count += 1
-        if var_name.startswith("g"):
-            self.emit(f"{tmp_var} = load {var_type}, {var_type}* @{var_name}, {self.calculate_alignment(var_type)}")
-        elif var_name.startswith("x"):
-            self.emit(f"{tmp_var} = load {var_type}, {var_type}* %{var_name}, {self.calculate_alignment(var_type)}")
-        elif var_name.startswith("p"):
-            return (var_type, f"%{var_name}")
-        else:
-            self.emit(f"{tmp_var} = alloca {var_type}, {self.calculate_alignment(var_type)}")
-            self.emit(f"store {var_type} %{var_name}, {var_type}* {tmp_var}, {self.calculate_alignment(var_type)}")
+        self.emit(f"{tmp_var} = load {var_type}, {var_type}* {self.address_of(symbol)}, {self.calculate_alignment(var_type)}")
         return (var_type, tmp_var)
 
     def visit_FunctionCall(self, node):
-        function_return_type = self.function_signatures.get(
-            node.name, "void"
-        )  # Default to "void" if unknown
-        arg_results = [self.visit(arg) for arg in node.arguments]
-        arg_list = [f"{arg_type} {arg_val}" for arg_type, arg_val in arg_results]
+        function_symbol = self.resolver.symbol_for(node)
+        # Default to "void" if unknown
+        function_return_type = function_symbol.data_type if function_symbol else "void"
+        arg_list = []
+        for arg in node.arguments:
+            symbol = self.resolver.symbol_for(arg)
+            if isinstance(arg, VariableReference) and symbol is not None and isinstance(symbol.data_type, list):
+                # Arrays are passed by reference, never copied
+                arg_list.extend(self.array_argument(symbol))
+            else:
+                arg_type, arg_val = yield arg
+                arg_list.append(f"{arg_type} {arg_val}")
         result_var = f"%tmp{self.temp_count}"
         self.temp_count += 1
         _function_return_type = self.get_type(function_return_type)
@@ -333,22 +1091,42 @@ class LLVMIRGenerator:
         return (_function_return_type, result_var)
 
     def function_statement(self, node, function_name):
+        self.reset_function_counters()
+        self.function_name = function_name
+        self.source_file = getattr(node, "source_file", "")
         self.push_symbol_table()  # New scope for function
         arg_list = []
-        if node.parameters and any(node.parameters):
-            for param_name, param_type in node.parameters:
-                arg_type = self.get_type(param_type)
-                arg_name = f"p{self.var_count}"
-                self.var_count += 1
-                arg_list.append(f"{arg_type} %{arg_name}")
-                # Add parameter to symbol table
-                self.add_to_symbol_table(param_name, param_type, arg_name, "parameter")
-
-        self.function_signatures[function_name] = node.return_type
+        params = self.resolver.parameters.get(id(node), [])
+        for param in params:
+            if isinstance(param.data_type, list):
+                pointer_type, *dimension_types = self.parameter_types(param.data_type)
+                arg_list.append(f"{pointer_type} %p{param.slot}")
+                arg_list.extend(f"i32 %p{param.slot}.d{k}" for k in range(len(dimension_types)))
+            else:
+                arg_type = self.get_type(param.data_type)
+                arg_list.append(f"{arg_type} %p{param.slot}")
 
+        # A memoized function's body becomes @name.impl behind the caching @name
+        if function_name in self.memoized:
+            define_name, linkage = f"{function_name}.impl", "internal"
+        else:
+            define_name, linkage = function_name, self.linkage(function_name)
+        attributes = " ".join(self.attributes.get(function_name, []))
+        subprogram = self.debug_subprogram(node, function_name, define_name, linkage, params) if self.debug else None
+        if subprogram is not None:
+            attributes += f" !dbg {subprogram}"
         self.emit(
-            f"define {self.get_type(node.return_type)} @{function_name}({', '.join(arg_list)}) {{"
+            f"define {linkage} {self.get_type(node.return_type)} @{define_name}({', '.join(arg_list)}) {attributes} {{"
         )
+        self.debug_scope = subprogram
+        self.entry_lines = []
+        if self.instrument:
+            self.profile_entries.append(function_name)
+            self.emit_entry(f"%profile.start = call i64 @plush_profile_enter(%plush.profile.entry* @plush.profile.{function_name})")
+        self.entry_index = len(self.output)
+        self.exit_indices = []
+        self.heap_slots = []
+        self.mapped_slots = []
 
         self.indentation += 1
 
@@ -357,29 +1135,45 @@ class LLVMIRGenerator:
             _return_var = f"retval{self.var_count}"
             self.var_count += 1
             self.emit(
-                f"%{_return_var} = alloca {self.get_type(node.return_type)}, align 4"
+                f"%{_return_var} = alloca {self.get_type(node.return_type)}, {self.calculate_alignment(self.get_type(node.return_type))}"
             )
             self.add_to_symbol_table("return", node.return_type, _return_var)
             _return_block = f"retblock{self.var_count}"
             self.add_to_symbol_table("return_code_block", "block", _return_block)
 
-        _params = self.symbol_table_stack[-1].get("params", {})
-        if _params:
-            for param_name, (param_type, param_var) in _params.items():
-                arg_name = f"x{self.var_count}"
-                self.var_count += 1
-                self.emit(f"%{arg_name} = alloca {self.get_type(param_type)}, align 4")
-                self.emit(
-                    f"store {self.get_type(param_type)} %{param_var}, {self.get_type(param_type)}* %{arg_name}, align 4"
-                )
-                self.add_to_symbol_table(param_name, param_type, arg_name)
+        for param in params:
+            param_type = param.data_type
+            if isinstance(param_type, list):
+                dimensions = [f"%p{param.slot}.d{k}" for k in range(len(param_type) - 1)]
+                self.array_views[param] = (self.get_type(param_type[-1]), f"%p{param.slot}", dimensions)
+                self.storage[param] = (param_type, f"p{param.slot}")
+                continue
+            arg_name = f"x{param.slot}"
+            arg_type = self.get_type(param_type)
+            self.emit(f"%{arg_name} = alloca {arg_type}, {self.calculate_alignment(arg_type)}")
+            self.emit(
+                f"store {arg_type} %p{param.slot}, {arg_type}* %{arg_name}, {self.calculate_alignment(arg_type)}"
+            )
+            self.storage[param] = (param_type, arg_name)
+
+        # Self tail calls store the new arguments in the parameter slots and
+        # jump back here, so tail recursion runs as a loop
+        self.tail_calls = find_self_tail_calls(node, self.resolver) if isinstance(node, FunctionStatement) else set()
+        self.tail_params = params
+        if self.tail_calls:
+            self.emit("br label %tailrec")
+            self.indentation -= 1
+            self.emit("tailrec:")
+            self.indentation += 1
 
-        self.visit(node.body)
+        yield node.body
         self.indentation -= 1
 
+        # The exits, and the frees in front of them, are on the closing brace
+        self.debug_line = self.node_lines(node)[1] or self.debug_line
         if node.return_type == "void":
             self.indentation += 1
-            self.emit("ret void")
+            self.emit_function_exit("ret void")
             self.indentation -= 1
         else:
             _return_block = self.lookup_symbol("return_code_block")[1]
@@ -395,33 +1189,146 @@ class LLVMIRGenerator:
             var_name = f"%return{self.var_count}"
             self.var_count += 1
             self.emit(
-                f"{var_name} = load {self.get_type(ret_type)}, {self.get_type(ret_type)}* %{ret_val}, align 4"
+                f"{var_name} = load {self.get_type(ret_type)}, {self.get_type(ret_type)}* %{ret_val}, {self.calculate_alignment(self.get_type(ret_type))}"
             )
-            self.emit(f"ret {self.get_type(ret_type)} {var_name}")
+            self.emit_function_exit(f"ret {self.get_type(ret_type)} {var_name}")
             self.indentation -= 1
 
+        self.finish_function()
+        self.debug_scope = None
         self.emit("}")
         self.pop_symbol_table()
+        self.function_name = None
+        if function_name in self.memoized:
+            self.memo_wrapper(function_name, node.return_type, params)
+
+    def memo_wrapper(self, name, return_type, params):
+        """
+        Emit @name, which looks its arguments up in a direct-mapped table
+        and only calls @name.impl on a miss. Recursive calls in the body go
+        through @name, so they are cached as well.
+        """
+        ret_ir = self.get_type(return_type)
+        param_irs = [self.get_type(param.data_type) for param in params]
+        entry_type = f"%{name}.memo.entry"
+        table_type = f"[{self.memo_size} x {entry_type}]"
+        # Entry layout: filled flag, the arguments, the result
+        self.emit_global(f"{entry_type} = type {{ {', '.join(['i8'] + param_irs + [ret_ir])} }}")
+        self.emit_global(f"@{name}.memo = internal global {table_type} zeroinitializer, align 16")
+
+        args = [f"%a{i}" for i in range(len(params))]
+        args_ir = ", ".join(f"{param_ir} {arg}" for param_ir, arg in zip(param_irs, args))
+        attributes = " ".join(attribute for attribute in self.attributes[name] if attribute != "readnone")
+        self.emit(f"define {self.linkage(name)} {ret_ir} @{name}({args_ir}) {attributes} {{")
+        self.indentation += 1
+
+        # FNV-1a over the argument bits. Its multiplications only carry bits
+        # upwards, and doubles differ mostly in their top bits, so the
+        # murmur3 finalizer mixes the high bits into the slot bits
+        hash_value = "-3750763034362895579"
+        for i, (param_ir, arg) in enumerate(zip(param_irs, args)):
+            bits = self.memo_key_bits(param_ir, arg, f"%k{i}")
+            self.emit(f"%h{i}.x = xor i64 {hash_value}, {bits}")
+            self.emit(f"%h{i} = mul i64 %h{i}.x, 1099511628211")
+            hash_value = f"%h{i}"
+        for step, multiplier in enumerate(["-49064778989728563", "-4265267296055464877"]):
+            self.emit(f"%mix{step}.high = lshr i64 {hash_value}, 33")
+            self.emit(f"%mix{step}.x = xor i64 {hash_value}, %mix{step}.high")
+            self.emit(f"%mix{step} = mul i64 %mix{step}.x, {multiplier}")
+            hash_value = f"%mix{step}"
+        self.emit(f"%hash.high = lshr i64 {hash_value}, 33")
+        self.emit(f"%hash = xor i64 {hash_value}, %hash.high")
+        self.emit(f"%slot = and i64 %hash, {self.memo_size - 1}")
+        self.emit(f"%entry = getelementptr inbounds {table_type}, {table_type}* @{name}.memo, i64 0, i64 %slot")
+        self.emit(f"%filled.ptr = getelementptr inbounds {entry_type}, {entry_type}* %entry, i32 0, i32 0")
+        self.emit("%filled = load i8, i8* %filled.ptr, align 1")
+        self.emit("%is_filled = icmp ne i8 %filled, 0")
+        self.emit("br i1 %is_filled, label %compare, label %fill")
+
+        self.indentation -= 1
+        self.emit("compare:")
+        self.indentation += 1
+        same = "true"
+        for i, (param_ir, arg) in enumerate(zip(param_irs, args)):
+            self.emit(f"%cached{i}.ptr = getelementptr inbounds {entry_type}, {entry_type}* %entry, i32 0, i32 {i + 1}")
+            self.emit(f"%cached{i} = load {param_ir}, {param_ir}* %cached{i}.ptr")
+            # Doubles compare by bits, so NaN arguments still hit and -0.0 is not 0.0
+            cached_bits = self.memo_key_bits(param_ir, f"%cached{i}", f"%cached{i}.bits")
+            self.emit(f"%same{i}.arg = icmp eq i64 {cached_bits}, %k{i}")
+            self.emit(f"%same{i} = and i1 {same}, %same{i}.arg")
+            same = f"%same{i}"
+        miss = "fill" if self.memo_policy == "replace" else "bypass"
+        self.emit(f"br i1 {same}, label %hit, label %{miss}")
+
+        self.indentation -= 1
+        self.emit("hit:")
+        self.indentation += 1
+        result_index = len(params) + 1
+        self.emit(f"%hit.ptr = getelementptr inbounds {entry_type}, {entry_type}* %entry, i32 0, i32 {result_index}")
+        self.emit(f"%hit.value = load {ret_ir}, {ret_ir}* %hit.ptr")
+        self.emit(f"ret {ret_ir} %hit.value")
+
+        self.indentation -= 1
+        self.emit("fill:")
+        self.indentation += 1
+        self.emit(f"%result = call {ret_ir} @{name}.impl({args_ir})")
+        self.emit("store i8 1, i8* %filled.ptr, align 1")
+        for i, (param_ir, arg) in enumerate(zip(param_irs, args)):
+            self.emit(f"%key{i}.ptr = getelementptr inbounds {entry_type}, {entry_type}* %entry, i32 0, i32 {i + 1}")
+            self.emit(f"store {param_ir} {arg}, {param_ir}* %key{i}.ptr")
+        self.emit(f"%result.ptr = getelementptr inbounds {entry_type}, {entry_type}* %entry, i32 0, i32 {result_index}")
+        self.emit(f"store {ret_ir} %result, {ret_ir}* %result.ptr")
+        self.emit(f"ret {ret_ir} %result")
+
+        if self.memo_policy == "keep":
+            self.indentation -= 1
+            self.emit("bypass:")
+            self.indentation += 1
+            self.emit(f"%uncached = call {ret_ir} @{name}.impl({args_ir})")
+            self.emit(f"ret {ret_ir} %uncached")
+
+        self.indentation -= 1
+        self.emit("}")
+
+    def memo_key_bits(self, param_ir, value, name):
+        """Widen a scalar to i64 for hashing and comparing, returns the new value."""
+        if param_ir == "double":
+            self.emit(f"{name} = bitcast double {value} to i64")
+        else:
+            self.emit(f"{name} = zext {param_ir} {value} to i64")
+        return name
 
     def visit_FunctionStatement(self, node):
-        self.function_statement(node, node.name)
+        return self.function_statement(node, node.name)
 
     def visit_MainFunctionStatement(self, node):
-        self.function_statement(node, "main")
+        return self.function_statement(node, "main")
 
     def visit_FunctionDeclaration(self, node):
-        arg_list = [f"{self.get_type(param_type)}" for _, param_type in node.parameters]
-        self.function_signatures[node.name] = node.return_type
+        arg_list = [ir_type for _, param_type in node.parameters for ir_type in self.parameter_types(param_type)]
         self.emit_global(
             f"declare {self.get_type(node.return_type)} @{node.name}({', '.join(arg_list)})"
         )
 
     def visit_StatementBlock(self, node):
         for stmt in node.statements:
-            self.visit(stmt)
+            yield stmt
 
     def visit_ExpressionStatement(self, node):
-        self.visit(node.expression)
+        if id(node.expression) in self.tail_calls:
+            yield self.tail_call(node.expression)
+        else:
+            yield node.expression
+
+    def tail_call(self, call):
+        """Rebind the parameters to the call's arguments and jump back to the start."""
+        values = []
+        for arg in call.arguments:
+            values.append((yield arg))
+        for param, (arg_type, arg_val) in zip(self.tail_params, values):
+            param_type = self.get_type(param.data_type)
+            self.emit(f"store {param_type} {arg_val}, {param_type}* %x{param.slot}, {self.calculate_alignment(param_type)}")
+        self.emit("br label %tailrec")
 
     def visit_BreakStatement(self, node):
         _, _, end_block = self.get_while_blocks()
@@ -433,7 +1340,7 @@ class LLVMIRGenerator:
 
     def visit_IfStatement(self, node):
         self.push_symbol_table()  # New scope for if block
-        _, cond_var = self.visit(node.condition)
+        _, cond_var = yield node.condition
         if_count = self.temp_count
         self.temp_count += 1
         self.emit(f"br i1 {cond_var}, label %then{if_count}, label %else{if_count}")
@@ -441,13 +1348,16 @@ class LLVMIRGenerator:
             self.indentation -= 1
         self.emit(f"then{if_count}:")
         self.indentation += 1
-        self.visit(node.then_block)
+        self.count_block("then", node, "then")
+        yield node.then_block
         self.emit(f"br label %ifcont{if_count}")
         self.indentation -= 1
         self.emit(f"else{if_count}:")
         self.indentation += 1
+        # Without an else block this counts the times the condition was false
+        self.count_block("else", node, "else")
         if node.else_block:
-            self.visit(node.else_block)
+            yield node.else_block
         self.emit(f"br label %ifcont{if_count}")
 
         self.indentation -= 1
@@ -465,14 +1375,16 @@ class LLVMIRGenerator:
             self.indentation -= 1
         self.emit(f"cond{_while_count}:")
         self.indentation += 1
-        cond_var = self.visit(node.condition)
+        self.count_block("cond", node, "cond")
+        cond_var = yield node.condition
         cond_var_type, cond_var_name = cond_var
         self.emit(f"br i1 {cond_var_name}, label %body{_while_count}, label %end{_while_count}")
         self.indentation -= 1
 
         self.emit(f"body{_while_count}:")
         self.indentation += 1
-        self.visit(node.body)
+        self.count_block("body", node, "body")
+        yield node.body
         self.emit(f"br label %cond{_while_count}")
         self.indentation -= 1
 
@@ -489,39 +1401,52 @@ class LLVMIRGenerator:
         self.indentation -= 1
         self.emit(f"body{_do_while_count}:")
         self.indentation += 1
-        self.visit(node.body)
+        self.count_block("body", node, "body")
+        yield node.body
         self.emit(f"br label %cond{_do_while_count}")
         self.indentation -= 1
         self.emit(f"cond{_do_while_count}:")
         self.indentation += 1
-        cond_var = self.visit(node.condition)
+        self.count_block("cond", node, "cond")
+        cond_var = yield node.condition
         cond_var_type, cond_var_name = cond_var
         self.emit(f"br i1 {cond_var_name}, label %body{_do_while_count}, label %end{_do_while_count}")
         self.emit(f"end{_do_while_count}:")
         self.pop_symbol_table()
 
     def visit_AssignmentStatement(self, node):
-        lit_type, value = self.visit(node.value)
-        var_type, var_name = self.lookup_symbol(node.target)
+        if id(node.value) in self.tail_calls:
+            yield self.tail_call(node.value)
+            return
+        lit_type, value = yield node.value
+        symbol, (var_type, var_name) = self.lookup_storage(node, node.target)
         var_type = self.get_type(var_type)
-        if var_name.startswith("g"):
-            self.emit(f"store {lit_type} {value}, {var_type}* @{var_name}")
-        else:
-            self.emit(f"store {lit_type} {value}, {var_type}* %{var_name}")
+        self.emit(f"store {lit_type} {value}, {var_type}* {self.address_of(symbol)}")
 
     def visit_ReturnStatement(self, node):
-        if node.value:
-            ret_type, ret_val = self.visit(node.value)
+        if id(node.value) in self.tail_calls:
+            yield self.tail_call(node.value)
+        elif node.value:
+            ret_type, ret_val = yield node.value
             self.emit(
                 f"store {ret_type} {ret_val}, {ret_type}* %{self.lookup_symbol('return')[1]}"
             )
             _return_code_block_var = self.lookup_symbol("return_code_block")[1]
             self.emit(f"br label %{_return_code_block_var}")
         else:
-            self.emit("ret void")
+            self.emit_function_exit("ret void")
     
+    def with_flags(self, op_code):
+        """Add the enabled nsw or fast-math flags to an arithmetic op code."""
+        opcode, *predicate = op_code.split()
+        if self.nsw and opcode in ("add", "sub", "mul"):
+            return f"{opcode} nsw"
+        if self.fast_math and opcode in ("fadd", "fsub", "fmul", "fdiv", "frem", "fcmp"):
+            return " ".join([opcode, self.fast_math] + predicate)
+        return op_code
+
     def visit_UnaryExpression(self, node):
-        operand_type, operand_ir = self.visit(node.operand)
+        operand_type, operand_ir = yield node.operand
         result_var = f"%tmp{self.temp_count}"
         self.temp_count += 1
 
@@ -532,10 +1457,10 @@ class LLVMIRGenerator:
             return ("i1", result_var)
         elif node.operator == "-":
             if operand_type == "i32":
-                self.emit(f"{result_var} = sub i32 0, {operand_ir}")
+                self.emit(f"{result_var} = {self.with_flags('sub')} i32 0, {operand_ir}")
                 return ("i32", result_var)
             elif operand_type == "double":
-                self.emit(f"{result_var} = fsub double 0.0, {operand_ir}")
+                self.emit(f"{result_var} = {self.with_flags('fsub')} double 0.0, {operand_ir}")
                 return ("double", result_var)
             else:
                 raise Exception(f"Invalid operand type for unary '-': {operand_type}")
@@ -544,36 +1469,14 @@ class LLVMIRGenerator:
 
 
     def visit_BinaryExpression(self, node):
-        left_type, left = (
-            self.visit(node.left)
-            if not isinstance(node.left, VariableReference)
-            else (
-                self.get_type(self.lookup_symbol(node.left.name)[0]),
-                self.visit(node.left),
-            )
-        )
-        right_type, right = (
-            self.visit(node.right)
-            if not isinstance(node.right, VariableReference)
-            else (
-                self.get_type(self.lookup_symbol(node.right.name)[0]),
-                self.visit(node.right),
-            )
-        )
-
-        if isinstance(left, tuple):
-            left_var_type, left_var_name = left  # Reference Unpack tuple
-        else:
-            left_var_type, left_var_name = left_type, left  # Is literal
-
-        if isinstance(right, tuple):
-            right_var_type, right_var_name = right  # Reference Unpack tuple
-        else:
-            right_var_type, right_var_name = right_type, right  # Is literal
+        left_type, left_var_name = yield node.left
+        right_type, right_var_name = yield node.right
+        left_type = self.typed(node.left, left_type)
+        right_type = self.typed(node.right, right_type)
 
         if node.operator in ("||", "&&"):
-            if left_var_type != "i1" or right_var_type != "i1":
-                raise Exception(f"Invalid operand types for logical operator '{node.operator}': {left_var_type} and {right_var_type}")
+            if left_type != "i1" or right_type != "i1":
+                raise Exception(f"Invalid operand types for logical operator '{node.operator}': {left_type} and {right_type}")
 
             true_block = f"true_block{self.temp_count}"
             false_block = f"false_block{self.temp_count}"
@@ -586,11 +1489,13 @@ class LLVMIRGenerator:
                 self.indentation -= 1
                 self.emit(f"{true_block}:")
                 self.indentation += 1
+                self.count_block(f"{node.operator} true", node)
                 self.emit(f"br label %{end_block}")
                 self.indentation -= 1
 
                 self.emit(f"{false_block}:")
                 self.indentation += 1
+                self.count_block(f"{node.operator} false", node)
                 self.emit(f"br label %{end_block}")
                 self.indentation -= 1
 
@@ -602,11 +1507,13 @@ class LLVMIRGenerator:
                 self.indentation -= 1
                 self.emit(f"{true_block}:")
                 self.indentation += 1
+                self.count_block(f"{node.operator} true", node)
                 self.emit(f"br label %{end_block}")
                 self.indentation -= 1
 
                 self.emit(f"{false_block}:")
                 self.indentation += 1
+                self.count_block(f"{node.operator} false", node)
                 self.emit(f"br label %{end_block}")
                 self.indentation -= 1
 
@@ -723,9 +1630,11 @@ class LLVMIRGenerator:
             raise Exception(f"Unsupported operator: {node.operator}")
         else:
             self.emit(
-                f"{result_var} = {op_code} {left_type} {left_var_name}, {right_var_name}"
+                f"{result_var} = {self.with_flags(op_code)} {left_type} {left_var_name}, {right_var_name}"
             )
-        return (left_type, result_var)
+        if op_code and op_code.split()[0] in ("icmp", "fcmp"):
+            return ("i1", result_var)
+        return (self.typed(node, left_type), result_var)
 
     def visit_Literal(self, node):
         if isinstance(node.value, bool):
@@ -735,9 +1644,8 @@ class LLVMIRGenerator:
         elif isinstance(node.value, float):
             return ("double", f"{node.value}")
         elif isinstance(node.value, str):
-            self.emit_global(f"@.str{self.var_count} = private unnamed_addr constant [{len(node.value) + 1} x i8] c\"{node.value}\\00\"")
-            str_ptr = f"getelementptr inbounds [{len(node.value) + 1} x i8], [{len(node.value) + 1} x i8]* @.str{self.var_count}, i32 0, i32 0"
-            self.var_count += 1
+            str_name = self.string_constant(node.value)
+            str_ptr = f"getelementptr inbounds [{len(node.value) + 1} x i8], [{len(node.value) + 1} x i8]* @{str_name}, i32 0, i32 0"
             return (f"[{len(node.value) + 1} x i8]", str_ptr)
 
     def get_type(self, type_str):
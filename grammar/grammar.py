@@ -3,9 +3,15 @@ import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from functools import partial
 import ply.yacc as yacc
-from lexer.lexer import tokens
+from lexer.lexer import tokens, lexer
 from tree import ast_nodes
+from tracing import Tracer
+
+# Where the running parse() records node spans, see tree.source_map
+current_source_map = None
+current_file = 0
 
 
 precedence = (
@@ -42,12 +48,16 @@ def p_program(p):
     else:
         # program has only declaration_list
         p[0] = ast_nodes.Program(global_variables=ast_nodes.GlobalVariables(declarations=[]), declarations=p[1], imports=[])
+    located(p, p[0])
 
+# Left-recursive list rules append to the list built so far instead of
+# copying it, so long statement and argument lists build in linear time
 def p_import_list(p):
     """import_list : import_list import_statement
                    | import_statement"""
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -59,7 +69,8 @@ def p_global_declaration_list(p):
     """global_declaration_list : global_declaration_list global_declaration
                                | empty"""
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -71,7 +82,8 @@ def p_declaration_list(p):
     """declaration_list : declaration_list declaration
                         | empty"""
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -88,8 +100,11 @@ def p_variable_declaration(p):
                             | VAR IDENTIFIER COLON array_type ASSIGN array_initializer SEMICOLON
                             | VAL IDENTIFIER COLON array_type ASSIGN array_initializer SEMICOLON
                             | VAR IDENTIFIER COLON array_allocation_type SEMICOLON
-                            | VAL IDENTIFIER COLON array_allocation_type SEMICOLON"""
-    if len(p) == 8 and isinstance(p[4], list):
+                            | VAL IDENTIFIER COLON array_allocation_type SEMICOLON
+                            | VAL IDENTIFIER COLON array_type ASSIGN mapped_file SEMICOLON"""
+    if len(p) == 8 and p.slice[6].type == "mapped_file":
+        p[0] = ast_nodes.MappedArrayDeclaration(p[1], p[2], p[4], *p[6])
+    elif len(p) == 8 and isinstance(p[4], list):
         p[0] = ast_nodes.ArrayDeclaration(p[1], p[2], p[4], p[6])
     elif len(p) == 8:
         p[0] = ast_nodes.VariableDeclaration(p[1], p[2], p[4], p[6])
@@ -97,6 +112,7 @@ def p_variable_declaration(p):
         p[0] = ast_nodes.ArrayAllocation(p[1], p[2], p[4])
     else:
         p[0] = ast_nodes.VariableDeclaration(p[1], p[2], p[4], None)
+    located(p, p[0])
 
 def p_array_type(p):
     """array_type : LBRACKET TYPE RBRACKET
@@ -112,6 +128,11 @@ def p_array_type(p):
     else:
         p[0] = ["array", p[3]]
 
+def p_mapped_file(p):
+    """mapped_file : MMAPINTS LPAREN expression RPAREN
+                   | MMAPDOUBLES LPAREN expression RPAREN"""
+    p[0] = ("int" if p[1] == "mmap_ints" else "double", p[3])
+
 def p_array_allocation_type(p):
     """array_allocation_type : LBRACKET NUMBER RBRACKET array_allocation_type
                              | LBRACKET NUMBER RBRACKET TYPE"""
@@ -129,18 +150,48 @@ def p_array_initializer_list(p):
     """array_initializer_list : array_initializer_list COMMA array_initializer
                               | array_initializer"""
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
 def p_function_declaration(p):
     """function_declaration : FUNCTION IDENTIFIER LPAREN parameter_list RPAREN COLON TYPE SEMICOLON
+                            | annotation_list function_statement
                             | function_statement"""
     if len(p) == 9:  # Function declaration 
-        p[0] = ast_nodes.FunctionDeclaration(p[2], p[4], p[7])
+        p[0] = located(p, ast_nodes.FunctionDeclaration(p[2], p[4], p[7]))
+    elif len(p) == 3:  # Annotated function statement
+        p[2].annotations = p[1]
+        p[0] = p[2]
     else:  # Function statement 
         p[0] = p[1]
 
+def p_annotation_list(p):
+    """annotation_list : annotation_list ANNOTATION
+                       | ANNOTATION"""
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
+    else:
+        p[0] = [p[1]]
+
+def located(p, node, blocks=None, first=1, last=None):
+    """
+    Record the source span of the production's symbols `first` to `last`
+    (all of them by default) for its node, and those of its sub-blocks,
+    given as block name to symbol index. Only parse() records spans.
+    """
+    if current_source_map is None:
+        return node
+    last = len(p) - 1 if last is None else last
+    current_source_map.add(node, current_file, p.lexspan(first)[0], p.lexspan(last)[1])
+    if blocks:
+        node.block_spans = {
+            name: current_source_map.add_span(current_file, *p.lexspan(index)) for name, index in blocks.items()
+        }
+    return node
+
 def p_function_statement(p):
     """function_statement : FUNCTION IDENTIFIER LPAREN parameter_list RPAREN COLON TYPE statement_block
                           | FUNCTION IDENTIFIER LPAREN parameter_list RPAREN statement_block
@@ -166,13 +217,15 @@ def p_function_statement(p):
             p[0] = ast_nodes.FunctionStatement(p[2], p[4], p[7], p[8])
         else:
             p[0] = ast_nodes.FunctionStatement(p[2], p[4], "void", p[6])
+    located(p, p[0])
 
 def p_parameter_list(p):
     """parameter_list : parameter_list COMMA parameter
                       | parameter
                       | empty"""
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     elif len(p) == 2:
         p[0] = [p[1]]
     else:
@@ -181,7 +234,11 @@ def p_parameter_list(p):
 def p_parameter(p):
     """parameter : IDENTIFIER COLON TYPE
                  | VAL IDENTIFIER COLON TYPE
-                 | VAR IDENTIFIER COLON TYPE"""
+                 | VAR IDENTIFIER COLON TYPE
+                 | IDENTIFIER COLON array_type
+                 | VAL IDENTIFIER COLON array_type
+                 | VAR IDENTIFIER COLON array_type"""
+    # Array parameters keep the list type, e.g. ["array", "array", "int"]
     if len(p) == 4:
         p[0] = (p[1], p[3])
     else:
@@ -195,7 +252,8 @@ def p_statement_list(p):
     """statement_list : statement_list statement
                       | empty"""
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -227,6 +285,7 @@ def p_print_statement(p):
         p[0] = ast_nodes.PrintStatement("double", p[3])
     elif p[1] == "printf":
         p[0] = ast_nodes.PrintfStatement(p[3], p[5])
+    located(p, p[0])
 
 def p_return_statement(p):
     """return_statement : RETURN expression SEMICOLON
@@ -235,6 +294,7 @@ def p_return_statement(p):
         p[0] = ast_nodes.ReturnStatement(p[2])
     else:
         p[0] = ast_nodes.ReturnStatement(None)
+    located(p, p[0])
 
 def p_if_statement(p):
     """if_statement : IF LPAREN expression RPAREN statement_block ELSE statement_block
@@ -244,30 +304,30 @@ def p_if_statement(p):
     if p[1] == 'if':
         if p[2] == '(':
             if len(p) == 8:
-                p[0] = ast_nodes.IfStatement(p[3], p[5], p[7])
+                p[0] = located(p, ast_nodes.IfStatement(p[3], p[5], p[7]), {"then": 5, "else": 7})
             else:
-                p[0] = ast_nodes.IfStatement(p[3], p[5], None)
+                p[0] = located(p, ast_nodes.IfStatement(p[3], p[5], None), {"then": 5})
         else:
             if len(p) == 6:
-                p[0] = ast_nodes.IfStatement(p[2], p[3], p[5])
+                p[0] = located(p, ast_nodes.IfStatement(p[2], p[3], p[5]), {"then": 3, "else": 5})
             else:
-                p[0] = ast_nodes.IfStatement(p[2], p[3], None)
+                p[0] = located(p, ast_nodes.IfStatement(p[2], p[3], None), {"then": 3})
 
 def p_while_statement(p):
     """while_statement : WHILE LPAREN expression RPAREN statement_block
                        | WHILE expression statement_block"""
     if len(p) == 6:
-        p[0] = ast_nodes.WhileStatement(p[3], p[5])
+        p[0] = located(p, ast_nodes.WhileStatement(p[3], p[5]), {"cond": 3, "body": 5})
     else:
-        p[0] = ast_nodes.WhileStatement(p[2], p[3])
+        p[0] = located(p, ast_nodes.WhileStatement(p[2], p[3]), {"cond": 2, "body": 3})
 
 def p_do_while_statement(p):
     """do_while_statement : DO statement_block WHILE LPAREN expression RPAREN SEMICOLON
                           | DO statement_block WHILE expression SEMICOLON"""
     if len(p) == 8:
-        p[0] = ast_nodes.DoWhileStatement(p[5], p[2])
+        p[0] = located(p, ast_nodes.DoWhileStatement(p[5], p[2]), {"body": 2, "cond": 5})
     else:
-        p[0] = ast_nodes.DoWhileStatement(p[4], p[2])
+        p[0] = located(p, ast_nodes.DoWhileStatement(p[4], p[2]), {"body": 2, "cond": 4})
 
 def p_assignment_statement(p):
     """assignment_statement : IDENTIFIER ASSIGN expression SEMICOLON
@@ -275,42 +335,63 @@ def p_assignment_statement(p):
                             | IDENTIFIER DECREMENT expression SEMICOLON"""
     if p[2] == ':=':
         p[0] = ast_nodes.AssignmentStatement(p[1], p[3])
-    elif p[2] == '+=':
-        p[0] = ast_nodes.AssignmentStatement(p[1], ast_nodes.BinaryExpression('+', ast_nodes.VariableReference(p[1]), p[3]))
-    elif p[2] == '-=':
-        p[0] = ast_nodes.AssignmentStatement(p[1], ast_nodes.BinaryExpression('-', ast_nodes.VariableReference(p[1]), p[3]))
+    else:
+        # x += e is x := x + e, the reference is the target's token
+        target = located(p, ast_nodes.VariableReference(p[1]), first=1, last=1)
+        p[0] = ast_nodes.AssignmentStatement(p[1], located(p, ast_nodes.BinaryExpression(p[2][0], target, p[3])))
+    located(p, p[0])
 
 def p_increment_statement(p):
     """increment_statement : IDENTIFIER PLUSPLUS SEMICOLON
                            | PLUSPLUS IDENTIFIER SEMICOLON"""
-    if p[2] == '++':
-        p[0] = ast_nodes.AssignmentStatement(p[1], ast_nodes.BinaryExpression('+', ast_nodes.VariableReference(p[1]), ast_nodes.Literal(1)))
-    else:
-        p[0] = ast_nodes.AssignmentStatement(p[2], ast_nodes.BinaryExpression('+', ast_nodes.VariableReference(p[2]), ast_nodes.Literal(1)))
+    p[0] = step_statement(p, '+')
 
 def p_decrement_statement(p):
     """decrement_statement : IDENTIFIER MINUSMINUS SEMICOLON
                            | MINUSMINUS IDENTIFIER SEMICOLON"""
-    if p[2] == '--':
-        p[0] = ast_nodes.AssignmentStatement(p[1], ast_nodes.BinaryExpression('-', ast_nodes.VariableReference(p[1]), ast_nodes.Literal(1)))
-    else:
-        p[0] = ast_nodes.AssignmentStatement(p[2], ast_nodes.BinaryExpression('-', ast_nodes.VariableReference(p[2]), ast_nodes.Literal(1)))
+    p[0] = step_statement(p, '-')
+
+def step_statement(p, operator):
+    """x++ and x-- become x := x + 1 and x := x - 1, the literal is the operator's token."""
+    name_index, operator_index = (1, 2) if p.slice[1].type == 'IDENTIFIER' else (2, 1)
+    target = located(p, ast_nodes.VariableReference(p[name_index]), first=name_index, last=name_index)
+    one = located(p, ast_nodes.Literal(1), first=operator_index, last=operator_index)
+    return located(p, ast_nodes.AssignmentStatement(p[name_index], located(p, ast_nodes.BinaryExpression(operator, target, one))))
 
 def p_array_assignment_statement(p):
     "array_assignment_statement : array_access ASSIGN expression SEMICOLON"
-    p[0] = ast_nodes.ArrayAssignmentStatement(p[1].name, p[1].index, p[3])
+    p[0] = located(p, ast_nodes.ArrayAssignmentStatement(p[1].name, p[1].index, p[3]))
     
 def p_expression_statement(p):
     "expression_statement : expression SEMICOLON"
-    p[0] = ast_nodes.ExpressionStatement(p[1])
+    p[0] = located(p, ast_nodes.ExpressionStatement(p[1]))
 
 def p_function_call(p):
     "function_call : IDENTIFIER LPAREN expression_list RPAREN"
-    p[0] = ast_nodes.FunctionCall(p[1], p[3])
+    p[0] = located(p, ast_nodes.FunctionCall(p[1], p[3]))
+
+def p_read_expression(p):
+    """read_expression : READINT LPAREN RPAREN
+                       | READDOUBLE LPAREN RPAREN
+                       | READINTSINTO LPAREN IDENTIFIER COMMA expression RPAREN
+                       | READDOUBLESINTO LPAREN IDENTIFIER COMMA expression RPAREN"""
+    if p[1] == "read_int":
+        p[0] = ast_nodes.ReadExpression("int")
+    elif p[1] == "read_double":
+        p[0] = ast_nodes.ReadExpression("double")
+    elif p[1] == "read_ints_into":
+        p[0] = ast_nodes.ReadIntoExpression("int", p[3], p[5])
+    else:
+        p[0] = ast_nodes.ReadIntoExpression("double", p[3], p[5])
+    located(p, p[0])
+
+def p_array_length(p):
+    """array_length : ARRAYLENGTH LPAREN IDENTIFIER RPAREN"""
+    p[0] = located(p, ast_nodes.ArrayLength(p[3]))
 
 def p_array_access(p):
     """array_access : IDENTIFIER array_access_list"""
-    p[0] = ast_nodes.ArrayAccess(p[1], p[2])
+    p[0] = located(p, ast_nodes.ArrayAccess(p[1], p[2]))
 
 def p_array_access_list(p):
     """array_access_list : array_access_list LBRACKET expression RBRACKET
@@ -318,14 +399,16 @@ def p_array_access_list(p):
     if len(p) == 4:
         p[0] = [p[2]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 # Expressions
 def p_expression_list(p):
     """expression_list : expression_list COMMA expression
                        | expression"""
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -362,35 +445,37 @@ def p_expression(p):
                   | STRING
                   | TRUE
                   | FALSE
-                  | function_call"""
+                  | function_call
+                  | read_expression
+                  | array_length"""
     if len(p) == 4:
         if p[1] == '(':
             p[0] = p[2]
         elif p[1] == 'not':
-            p[0] = ast_nodes.UnaryExpression(p[1], p[2])
+            p[0] = located(p, ast_nodes.UnaryExpression(p[1], p[2]))
         else:
-            p[0] = ast_nodes.BinaryExpression(p[2], p[1], p[3])
+            p[0] = located(p, ast_nodes.BinaryExpression(p[2], p[1], p[3]))
     elif len(p) == 3 and p[1] == '!':
-        p[0] = ast_nodes.UnaryExpression(p[1], p[2])
+        p[0] = located(p, ast_nodes.UnaryExpression(p[1], p[2]))
     elif len(p) == 3 and p[1] == '-':
-        p[0] = ast_nodes.Literal(-1 * p[2])
+        p[0] = located(p, ast_nodes.Literal(-1 * p[2]))
     elif len(p) == 2 and isinstance(p[1], ast_nodes.ArrayAccess):
         p[0] = p[1]
     elif len(p) == 5:
-        p[0] = ast_nodes.ArrayAccess(p[1], p[3])
+        p[0] = located(p, ast_nodes.ArrayAccess(p[1], p[3]))
     elif len(p) == 3 and isinstance(p[2], list):
-        p[0] = ast_nodes.ArrayAccess(p[1], p[2])
+        p[0] = located(p, ast_nodes.ArrayAccess(p[1], p[2]))
     else:
         if p.slice[1].type == 'IDENTIFIER':
-            p[0] = ast_nodes.VariableReference(p[1])
+            p[0] = located(p, ast_nodes.VariableReference(p[1]))
         elif p.slice[1].type == 'NUMBER' or p.slice[1].type == 'FLOAT' or p.slice[1].type == 'STRING':
-            p[0] = ast_nodes.Literal(p[1])
+            p[0] = located(p, ast_nodes.Literal(p[1]))
         elif p.slice[1].type == 'TRUE' or p.slice[1].type == 'FALSE':
-            p[0] = ast_nodes.Literal(p[1] == 'true')
+            p[0] = located(p, ast_nodes.Literal(p[1] == 'true'))
         elif p.slice[1].type == 'BREAK':
-            p[0] = ast_nodes.BreakStatement()
+            p[0] = located(p, ast_nodes.BreakStatement())
         elif p.slice[1].type == 'CONTINUE':
-            p[0] = ast_nodes.ContinueStatement()
+            p[0] = located(p, ast_nodes.ContinueStatement())
         else:
             p[0] = p[1]
 
@@ -399,13 +484,46 @@ def p_empty(p):
     pass
 
 def p_error(p):
-    if p:
+    if p and current_source_map is not None:
+        line, column = current_source_map.line_column(current_file, p.lexpos)
+        print(f"Syntax error at '{p.value}', line {line}, column {column}")
+    elif p:
         print(f"Syntax error at '{p.value}', line {p.lineno}")
     else:
         print("Syntax error at EOF")
 
 parser = yacc.yacc(debug=True, debugfile="parser.out")
 
+def next_token():
+    # The lexer is past the token now, PLY carries its end into lexspan()
+    token = lexer.token()
+    if token is not None:
+        token.endlexpos = lexer.lexpos
+    return token
+
+def parse(source_code, source_map=None, filename="", tracer=None):
+    """
+    Parse one source file, counting lines from 1. With a source map, the
+    span of every node is recorded in it, see tree.source_map.
+    """
+    global current_source_map, current_file
+    tracer = tracer if tracer is not None else Tracer(enabled=False)
+    lexer.lineno = 1
+    lexer.input(source_code)
+    tokenfunc = next_token
+    if tracer.enabled:
+        # Lexed up front, so lexing and parsing show up as separate spans
+        with tracer.span("lex", file=filename):
+            lexed = list(iter(next_token, None))
+        tokenfunc = partial(next, iter(lexed), None)
+    current_source_map = source_map
+    current_file = source_map.add_file(filename, source_code) if source_map is not None else 0
+    try:
+        with tracer.span("parse", file=filename):
+            return parser.parse(lexer=lexer, tracking=True, tokenfunc=tokenfunc)
+    finally:
+        current_source_map = None
+
 # Example usage
 if __name__ == "__main__":
     import print_tree
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'nonassocLTGTLEGEEQUALSNEleftPLUSMINUSleftTIMESDIVIDEMODleftANDORrightNOTleftBITWISE_NOTleftBITWISE_ANDleftBITWISE_ORleftBITWISE_XORleftBITWISE_LSHIFTBITWISE_RSHIFTrightPLUSPLUSMINUSMINUSAND ARGSTRING ASSIGN BITWISE_AND BITWISE_LSHIFT BITWISE_NOT BITWISE_OR BITWISE_RSHIFT BITWISE_XOR BREAK COLON COMMA CONTINUE DECREMENT DIVIDE DO ELSE EQUALS FALSE FLOAT FUNCTION GE GT IDENTIFIER IF IMPORT INCREMENT LBRACE LBRACKET LE LPAREN LT MAIN MINUS MINUSMINUS MOD NE NOT NUMBER OR PLUS PLUSPLUS PRINTDOUBLE PRINTF PRINTINT PRINTSTRING RBRACE RBRACKET RETURN RPAREN SEMICOLON SQUARE STRING TIMES TRUE TYPE VAL VAR WHILEprogram : import_list global_declaration_list declaration_list\n               | import_list declaration_list\n               | global_declaration_list declaration_list\n               | declaration_listimport_list : import_list import_statement\n                   | import_statementimport_statement : IMPORT IDENTIFIER SEMICOLONglobal_declaration_list : global_declaration_list global_declaration\n                               | emptyglobal_declaration : variable_declarationdeclaration_list : declaration_list declaration\n                        | emptydeclaration : function_declaration\n                   | statementvariable_declaration : VAL IDENTIFIER COLON TYPE ASSIGN expression SEMICOLON\n                            | VAR IDENTIFIER COLON TYPE ASSIGN expression SEMICOLON\n                            | VAR IDENTIFIER COLON TYPE SEMICOLON\n                            | VAR IDENTIFIER COLON array_type ASSIGN array_initializer SEMICOLON\n                            | VAL IDENTIFIER COLON array_type ASSIGN array_initializer SEMICOLON\n                            | VAR IDENTIFIER COLON array_allocation_type SEMICOLON\n                            | VAL IDENTIFIER COLON array_allocation_type SEMICOLONarray_type : LBRACKET TYPE RBRACKET\n                  | LBRACKET array_type RBRACKET\n                  | LBRACKET RBRACKET array_type\n                  | LBRACKET RBRACKET TYPEarray_allocation_type : LBRACKET NUMBER RBRACKET array_allocation_type\n                             | LBRACKET NUMBER RBRACKET TYPEarray_initializer : LBRACKET expression_list RBRACKET\n                         | LBRACKET array_initializer_list RBRACKETarray_initializer_list : array_initializer_list COMMA array_initializer\n                              | array_initializerfunction_declaration : FUNCTION IDENTIFIER LPAREN parameter_list RPAREN COLON TYPE SEMICOLON\n                            | function_statementfunction_statement : FUNCTION IDENTIFIER LPAREN parameter_list RPAREN COLON TYPE statement_block\n                          | FUNCTION IDENTIFIER LPAREN parameter_list RPAREN statement_block\n                          | FUNCTION MAIN LPAREN parameter_list RPAREN COLON TYPE statement_block\n                          | FUNCTION MAIN LPAREN VAL ARGSTRING RPAREN COLON TYPE statement_block\n                          | FUNCTION MAIN LPAREN VAR ARGSTRING RPAREN COLON TYPE statement_block\n                          | FUNCTION MAIN LPAREN parameter_list RPAREN statement_block\n                          | FUNCTION MAIN LPAREN VAR ARGSTRING RPAREN statement_block\n                          | FUNCTION MAIN LPAREN VAL ARGSTRING RPAREN statement_blockparameter_list : parameter_list COMMA parameter\n                      | parameter\n                      | emptyparameter : IDENTIFIER COLON TYPE\n                 | VAL IDENTIFIER COLON TYPE\n                 | VAR IDENTIFIER COLON TYPEstatement_block : LBRACE statement_list RBRACEstatement_list : statement_list statement\n                      | emptystatement : variable_declaration\n                 | if_statement\n                 | while_statement\n                 | do_while_statement\n                 | assignment_statement\n                 | array_assignment_statement\n                 | increment_statement\n                 | decrement_statement\n                 | expression_statement\n                 | return_statement\n                 | print_statementprint_statement : PRINTINT LPAREN expression RPAREN SEMICOLON\n                       | PRINTDOUBLE LPAREN expression RPAREN SEMICOLON\n                       | PRINTSTRING LPAREN expression RPAREN SEMICOLON\n                       | PRINTF LPAREN STRING COMMA expression_list RPAREN SEMICOLONreturn_statement : RETURN expression SEMICOLON\n                        | RETURN SEMICOLONif_statement : IF LPAREN expression RPAREN statement_block ELSE statement_block\n                    | IF LPAREN expression RPAREN statement_block\n                    | IF expression statement_block ELSE statement_block\n                    | IF expression statement_blockwhile_statement : WHILE LPAREN expression RPAREN statement_block\n                       | WHILE expression statement_blockdo_while_statement : DO statement_block WHILE LPAREN expression RPAREN SEMICOLON\n                          | DO statement_block WHILE expression SEMICOLONassignment_statement : IDENTIFIER ASSIGN expression SEMICOLON\n                            | IDENTIFIER INCREMENT expression SEMICOLON\n                            | IDENTIFIER DECREMENT expression SEMICOLONincrement_statement : IDENTIFIER PLUSPLUS SEMICOLON\n                           | PLUSPLUS IDENTIFIER SEMICOLONdecrement_statement : IDENTIFIER MINUSMINUS SEMICOLON\n                           | MINUSMINUS IDENTIFIER SEMICOLONarray_assignment_statement : array_access ASSIGN expression SEMICOLONexpression_statement : expression SEMICOLONfunction_call : IDENTIFIER LPAREN expression_list RPARENarray_access : IDENTIFIER array_access_listarray_access_list : array_access_list LBRACKET expression RBRACKET\n                         | LBRACKET expression RBRACKETexpression_list : expression_list COMMA expression\n                       | expressionexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression TIMES expression\n                  | expression DIVIDE expression\n                  | expression MOD expression\n                  | expression GT expression\n                  | expression LT expression\n                  | expression GE expression\n                  | expression LE expression\n                  | expression EQUALS expression\n                  | expression NE expression\n                  | expression AND expression\n                  | expression OR expression\n                  | expression BITWISE_AND expression\n                  | expression BITWISE_OR expression\n                  | expression SQUARE expression\n                  | expression BITWISE_NOT expression\n                  | expression BITWISE_LSHIFT expression\n                  | expression BITWISE_RSHIFT expression\n                  | LPAREN expression RPAREN\n                  | NOT expression\n                  | MINUS NUMBER %prec NOT\n                  | MINUS FLOAT %prec NOT\n                  | IDENTIFIER\n                  | array_access\n                  | BREAK\n                  | CONTINUE\n                  | NUMBER\n                  | FLOAT\n                  | STRING\n                  | TRUE\n                  | FALSE\n                  | function_callempty :'
+_lr_signature = 'nonassocLTGTLEGEEQUALSNEleftPLUSMINUSleftTIMESDIVIDEMODleftANDORrightNOTleftBITWISE_NOTleftBITWISE_ANDleftBITWISE_ORleftBITWISE_XORleftBITWISE_LSHIFTBITWISE_RSHIFTrightPLUSPLUSMINUSMINUSAND ANNOTATION ARGSTRING ARRAYLENGTH ASSIGN BITWISE_AND BITWISE_LSHIFT BITWISE_NOT BITWISE_OR BITWISE_RSHIFT BITWISE_XOR BREAK COLON COMMA CONTINUE DECREMENT DIVIDE DO ELSE EQUALS FALSE FLOAT FUNCTION GE GT IDENTIFIER IF IMPORT INCREMENT LBRACE LBRACKET LE LPAREN LT MAIN MINUS MINUSMINUS MMAPDOUBLES MMAPINTS MOD NE NOT NUMBER OR PLUS PLUSPLUS PRINTDOUBLE PRINTF PRINTINT PRINTSTRING RBRACE RBRACKET READDOUBLE READDOUBLESINTO READINT READINTSINTO RETURN RPAREN SEMICOLON SQUARE STRING TIMES TRUE TYPE VAL VAR WHILEprogram : import_list global_declaration_list declaration_list\n               | import_list declaration_list\n               | global_declaration_list declaration_list\n               | declaration_listimport_list : import_list import_statement\n                   | import_statementimport_statement : IMPORT IDENTIFIER SEMICOLONglobal_declaration_list : global_declaration_list global_declaration\n                               | emptyglobal_declaration : variable_declarationdeclaration_list : declaration_list declaration\n                        | emptydeclaration : function_declaration\n                   | statementvariable_declaration : VAL IDENTIFIER COLON TYPE ASSIGN expression SEMICOLON\n                            | VAR IDENTIFIER COLON TYPE ASSIGN expression SEMICOLON\n                            | VAR IDENTIFIER COLON TYPE SEMICOLON\n                            | VAR IDENTIFIER COLON array_type ASSIGN array_initializer SEMICOLON\n                            | VAL IDENTIFIER COLON array_type ASSIGN array_initializer SEMICOLON\n                            | VAR IDENTIFIER COLON array_allocation_type SEMICOLON\n                            | VAL IDENTIFIER COLON array_allocation_type SEMICOLON\n                            | VAL IDENTIFIER COLON array_type ASSIGN mapped_file SEMICOLONarray_type : LBRACKET TYPE RBRACKET\n                  | LBRACKET array_type RBRACKET\n                  | LBRACKET RBRACKET array_type\n                  | LBRACKET RBRACKET TYPEmapped_file : MMAPINTS LPAREN expression RPAREN\n                   | MMAPDOUBLES LPAREN expression RPARENarray_allocation_type : LBRACKET NUMBER RBRACKET array_allocation_type\n                             | LBRACKET NUMBER RBRACKET TYPEarray_initializer : LBRACKET expression_list RBRACKET\n                         | LBRACKET array_initializer_list RBRACKETarray_initializer_list : array_initializer_list COMMA array_initializer\n                              | array_initializerfunction_declaration : FUNCTION IDENTIFIER LPAREN parameter_list RPAREN COLON TYPE SEMICOLON\n                            | annotation_list function_statement\n                            | function_statementannotation_list : annotation_list ANNOTATION\n                       | ANNOTATIONfunction_statement : FUNCTION IDENTIFIER LPAREN parameter_list RPAREN COLON TYPE statement_block\n                          | FUNCTION IDENTIFIER LPAREN parameter_list RPAREN statement_block\n                          | FUNCTION MAIN LPAREN parameter_list RPAREN COLON TYPE statement_block\n                          | FUNCTION MAIN LPAREN VAL ARGSTRING RPAREN COLON TYPE statement_block\n                          | FUNCTION MAIN LPAREN VAR ARGSTRING RPAREN COLON TYPE statement_block\n                          | FUNCTION MAIN LPAREN parameter_list RPAREN statement_block\n                          | FUNCTION MAIN LPAREN VAR ARGSTRING RPAREN statement_block\n                          | FUNCTION MAIN LPAREN VAL ARGSTRING RPAREN statement_blockparameter_list : parameter_list COMMA parameter\n                      | parameter\n                      | emptyparameter : IDENTIFIER COLON TYPE\n                 | VAL IDENTIFIER COLON TYPE\n                 | VAR IDENTIFIER COLON TYPE\n                 | IDENTIFIER COLON array_type\n                 | VAL IDENTIFIER COLON array_type\n                 | VAR IDENTIFIER COLON array_typestatement_block : LBRACE statement_list RBRACEstatement_list : statement_list statement\n                      | emptystatement : variable_declaration\n                 | if_statement\n                 | while_statement\n                 | do_while_statement\n                 | assignment_statement\n                 | array_assignment_statement\n                 | increment_statement\n                 | decrement_statement\n                 | expression_statement\n                 | return_statement\n                 | print_statementprint_statement : PRINTINT LPAREN expression RPAREN SEMICOLON\n                       | PRINTDOUBLE LPAREN expression RPAREN SEMICOLON\n                       | PRINTSTRING LPAREN expression RPAREN SEMICOLON\n                       | PRINTF LPAREN STRING COMMA expression_list RPAREN SEMICOLONreturn_statement : RETURN expression SEMICOLON\n                        | RETURN SEMICOLONif_statement : IF LPAREN expression RPAREN statement_block ELSE statement_block\n                    | IF LPAREN expression RPAREN statement_block\n                    | IF expression statement_block ELSE statement_block\n                    | IF expression statement_blockwhile_statement : WHILE LPAREN expression RPAREN statement_block\n                       | WHILE expression statement_blockdo_while_statement : DO statement_block WHILE LPAREN expression RPAREN SEMICOLON\n                          | DO statement_block WHILE expression SEMICOLONassignment_statement : IDENTIFIER ASSIGN expression SEMICOLON\n                            | IDENTIFIER INCREMENT expression SEMICOLON\n                            | IDENTIFIER DECREMENT expression SEMICOLONincrement_statement : IDENTIFIER PLUSPLUS SEMICOLON\n                           | PLUSPLUS IDENTIFIER SEMICOLONdecrement_statement : IDENTIFIER MINUSMINUS SEMICOLON\n                           | MINUSMINUS IDENTIFIER SEMICOLONarray_assignment_statement : array_access ASSIGN expression SEMICOLONexpression_statement : expression SEMICOLONfunction_call : IDENTIFIER LPAREN expression_list RPARENread_expression : READINT LPAREN RPAREN\n                       | READDOUBLE LPAREN RPAREN\n                       | READINTSINTO LPAREN IDENTIFIER COMMA expression RPAREN\n                       | READDOUBLESINTO LPAREN IDENTIFIER COMMA expression RPARENarray_length : ARRAYLENGTH LPAREN IDENTIFIER RPARENarray_access : IDENTIFIER array_access_listarray_access_list : array_access_list LBRACKET expression RBRACKET\n                         | LBRACKET expression RBRACKETexpression_list : expression_list COMMA expression\n                       | expressionexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression TIMES expression\n                  | expression DIVIDE expression\n                  | expression MOD expression\n                  | expression GT expression\n                  | expression LT expression\n                  | expression GE expression\n                  | expression LE expression\n                  | expression EQUALS expression\n                  | expression NE expression\n                  | expression AND expression\n                  | expression OR expression\n                  | expression BITWISE_AND expression\n                  | expression BITWISE_OR expression\n                  | expression SQUARE expression\n                  | expression BITWISE_NOT expression\n                  | expression BITWISE_LSHIFT expression\n                  | expression BITWISE_RSHIFT expression\n                  | LPAREN expression RPAREN\n                  | NOT expression\n                  | MINUS NUMBER %prec NOT\n                  | MINUS FLOAT %prec NOT\n                  | IDENTIFIER\n                  | array_access\n                  | BREAK\n                  | CONTINUE\n                  | NUMBER\n                  | FLOAT\n                  | STRING\n                  | TRUE\n                  | FALSE\n                  | function_call\n                  | read_expression\n                  | array_lengthempty :'
     
-_lr_action_items = {'IMPORT':([0,2,5,10,112,],[7,7,-6,-5,-7,]),'VAL':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,58,74,99,104,112,115,116,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,210,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,15,15,-6,-9,15,15,-5,15,-8,-12,-10,-11,-13,-14,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,15,-84,-124,-67,-7,172,175,-79,-81,-71,-73,15,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,172,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'VAR':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,58,74,99,104,112,115,116,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,210,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,16,16,-6,-9,16,16,-5,16,-8,-12,-10,-11,-13,-14,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,16,-84,-124,-67,-7,173,176,-79,-81,-71,-73,16,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,173,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'FUNCTION':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,58,74,104,112,120,121,147,149,154,155,156,177,178,179,189,191,198,205,207,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,20,-6,-9,-124,20,-5,20,-8,-12,-10,-11,-13,-14,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,20,-84,-67,-7,-79,-81,-71,-73,-80,-82,-66,-76,-77,-78,-48,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'IF':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,58,74,99,104,112,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,36,-6,-9,-124,36,-5,36,-8,-12,-10,-11,-13,-14,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,36,-84,-124,-67,-7,-79,-81,-71,-73,36,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'WHILE':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,58,74,98,99,104,112,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,37,-6,-9,-124,37,-5,37,-8,-12,-10,-11,-13,-14,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,37,-84,150,-124,-67,-7,-79,-81,-71,-73,37,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'DO':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,58,74,99,104,112,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,38,-6,-9,-124,38,-5,38,-8,-12,-10,-11,-13,-14,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,38,-84,-124,-67,-7,-79,-81,-71,-73,38,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,24,25,26,27,28,29,30,31,32,33,34,36,37,40,41,42,49,58,63,64,65,69,70,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,99,100,104,105,106,107,112,115,116,120,121,122,147,149,150,151,152,154,155,156,172,173,175,176,177,178,179,182,187,189,190,191,195,196,198,204,205,207,210,218,219,220,222,223,224,225,229,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,21,-6,-9,57,-124,21,-5,21,-8,-12,-10,59,60,-11,-13,-14,61,72,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,72,72,101,102,72,72,21,72,72,72,72,72,-84,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-124,72,-67,72,72,72,-7,168,168,-79,-81,72,-71,-73,72,21,-50,-80,-82,-66,211,212,211,212,-76,-77,-78,72,72,-48,-49,-83,72,72,-21,72,-17,-20,168,-69,-70,-72,-75,-62,-63,-64,72,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'PLUSPLUS':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,21,23,24,25,26,27,28,29,30,31,32,33,34,58,74,99,104,112,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,40,-6,-9,-124,40,-5,40,-8,-12,-10,-11,-13,-14,66,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,40,-84,-124,-67,-7,-79,-81,-71,-73,40,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'MINUSMINUS':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,21,23,24,25,26,27,28,29,30,31,32,33,34,58,74,99,104,112,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,41,-6,-9,-124,41,-5,41,-8,-12,-10,-11,-13,-14,67,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,41,-84,-124,-67,-7,-79,-81,-71,-73,41,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'RETURN':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,58,74,99,104,112,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,42,-6,-9,-124,42,-5,42,-8,-12,-10,-11,-13,-14,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,42,-84,-124,-67,-7,-79,-81,-71,-73,42,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'PRINTINT':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,58,74,99,104,112,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,43,-6,-9,-124,43,-5,43,-8,-12,-10,-11,-13,-14,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,43,-84,-124,-67,-7,-79,-81,-71,-73,43,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'PRINTDOUBLE':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,58,74,99,104,112,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,44,-6,-9,-124,44,-5,44,-8,-12,-10,-11,-13,-14,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,44,-84,-124,-67,-7,-79,-81,-71,-73,44,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'PRINTSTRING':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,58,74,99,104,112,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,45,-6,-9,-124,45,-5,45,-8,-12,-10,-11,-13,-14,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,45,-84,-124,-67,-7,-79,-81,-71,-73,45,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'PRINTF':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,58,74,99,104,112,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,46,-6,-9,-124,46,-5,46,-8,-12,-10,-11,-13,-14,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,46,-84,-124,-67,-7,-79,-81,-71,-73,46,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'LPAREN':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,21,22,23,24,25,26,27,28,29,30,31,32,33,34,36,37,42,43,44,45,46,49,58,61,62,63,64,65,69,70,72,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,99,100,104,105,106,107,112,120,121,122,147,149,150,151,152,154,155,156,177,178,179,182,187,189,190,191,195,196,198,204,205,207,218,219,220,222,223,224,225,229,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,22,-6,-9,-124,22,-5,22,-8,-12,-10,-11,-13,-14,69,22,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,94,96,22,105,106,107,108,22,22,115,116,22,22,22,22,22,69,-84,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-124,22,-67,22,22,22,-7,-79,-81,22,-71,-73,187,22,-50,-80,-82,-66,-76,-77,-78,22,22,-48,-49,-83,22,22,-21,22,-17,-20,-69,-70,-72,-75,-62,-63,-64,22,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'NOT':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,23,24,25,26,27,28,29,30,31,32,33,34,36,37,42,49,58,63,64,65,69,70,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,99,100,104,105,106,107,112,120,121,122,147,149,150,151,152,154,155,156,177,178,179,182,187,189,190,191,195,196,198,204,205,207,218,219,220,222,223,224,225,229,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,49,-6,-9,-124,49,-5,49,-8,-12,-10,-11,-13,-14,49,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,49,49,49,49,49,49,49,49,49,49,-84,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-124,49,-67,49,49,49,-7,-79,-81,49,-71,-73,49,49,-50,-80,-82,-66,-76,-77,-78,49,49,-48,-49,-83,49,49,-21,49,-17,-20,-69,-70,-72,-75,-62,-63,-64,49,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'MINUS':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,39,42,47,49,50,51,52,53,54,55,56,58,63,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,99,100,103,104,105,106,107,109,110,111,112,117,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,177,178,179,180,181,182,183,184,186,187,188,189,190,191,195,196,198,204,205,207,216,217,218,219,220,221,222,223,224,225,227,229,235,239,244,248,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,48,-6,-9,-124,48,-5,48,-8,-12,-10,-11,-13,-14,-114,48,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,76,48,48,-115,48,-120,48,-118,-119,-116,-117,-121,-122,-123,48,48,48,48,-86,48,48,76,-114,-115,-84,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,76,48,76,-124,48,76,-67,48,48,48,-112,-113,-111,-7,76,76,76,-79,-81,48,76,76,-110,-91,-92,-93,-94,-95,76,76,76,76,76,76,-102,-103,-104,-105,76,-107,-108,-109,76,-71,76,-73,48,48,-50,76,-80,-82,-66,76,76,76,-76,-77,-78,76,-85,48,-88,-110,-110,48,76,-48,-49,-83,48,48,-21,48,-17,-20,-87,76,-69,-70,-72,76,-75,-62,-63,-64,76,48,76,-35,-39,-110,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'BREAK':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,23,24,25,26,27,28,29,30,31,32,33,34,36,37,42,49,58,63,64,65,69,70,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,99,100,104,105,106,107,112,120,121,122,147,149,150,151,152,154,155,156,177,178,179,182,187,189,190,191,195,196,198,204,205,207,218,219,220,222,223,224,225,229,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,52,-6,-9,-124,52,-5,52,-8,-12,-10,-11,-13,-14,52,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,52,52,52,52,52,52,52,52,52,52,-84,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-124,52,-67,52,52,52,-7,-79,-81,52,-71,-73,52,52,-50,-80,-82,-66,-76,-77,-78,52,52,-48,-49,-83,52,52,-21,52,-17,-20,-69,-70,-72,-75,-62,-63,-64,52,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'CONTINUE':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,23,24,25,26,27,28,29,30,31,32,33,34,36,37,42,49,58,63,64,65,69,70,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,99,100,104,105,106,107,112,120,121,122,147,149,150,151,152,154,155,156,177,178,179,182,187,189,190,191,195,196,198,204,205,207,218,219,220,222,223,224,225,229,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,53,-6,-9,-124,53,-5,53,-8,-12,-10,-11,-13,-14,53,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,53,53,53,53,53,53,53,53,53,53,-84,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-124,53,-67,53,53,53,-7,-79,-81,53,-71,-73,53,53,-50,-80,-82,-66,-76,-77,-78,53,53,-48,-49,-83,53,53,-21,53,-17,-20,-69,-70,-72,-75,-62,-63,-64,53,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'NUMBER':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,23,24,25,26,27,28,29,30,31,32,33,34,36,37,42,48,49,58,63,64,65,69,70,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,99,100,104,105,106,107,112,120,121,122,147,149,150,151,152,154,155,156,164,177,178,179,182,187,189,190,191,195,196,198,204,205,207,218,219,220,222,223,224,225,229,239,244,250,251,255,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,50,-6,-9,-124,50,-5,50,-8,-12,-10,-11,-13,-14,50,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,50,50,50,109,50,50,50,50,50,50,50,-84,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,-124,50,-67,50,50,50,-7,-79,-81,50,-71,-73,50,50,-50,-80,-82,-66,203,-76,-77,-78,50,50,-48,-49,-83,50,50,-21,50,-17,-20,-69,-70,-72,-75,-62,-63,-64,50,-35,-39,-15,-19,203,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'FLOAT':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,23,24,25,26,27,28,29,30,31,32,33,34,36,37,42,48,49,58,63,64,65,69,70,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,99,100,104,105,106,107,112,120,121,122,147,149,150,151,152,154,155,156,177,178,179,182,187,189,190,191,195,196,198,204,205,207,218,219,220,222,223,224,225,229,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,51,-6,-9,-124,51,-5,51,-8,-12,-10,-11,-13,-14,51,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,51,51,51,110,51,51,51,51,51,51,51,-84,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,-124,51,-67,51,51,51,-7,-79,-81,51,-71,-73,51,51,-50,-80,-82,-66,-76,-77,-78,51,51,-48,-49,-83,51,51,-21,51,-17,-20,-69,-70,-72,-75,-62,-63,-64,51,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'STRING':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,23,24,25,26,27,28,29,30,31,32,33,34,36,37,42,49,58,63,64,65,69,70,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,99,100,104,105,106,107,108,112,120,121,122,147,149,150,151,152,154,155,156,177,178,179,182,187,189,190,191,195,196,198,204,205,207,218,219,220,222,223,224,225,229,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,47,-6,-9,-124,47,-5,47,-8,-12,-10,-11,-13,-14,47,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,47,47,47,47,47,47,47,47,47,47,-84,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-124,47,-67,47,47,47,160,-7,-79,-81,47,-71,-73,47,47,-50,-80,-82,-66,-76,-77,-78,47,47,-48,-49,-83,47,47,-21,47,-17,-20,-69,-70,-72,-75,-62,-63,-64,47,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'TRUE':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,23,24,25,26,27,28,29,30,31,32,33,34,36,37,42,49,58,63,64,65,69,70,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,99,100,104,105,106,107,112,120,121,122,147,149,150,151,152,154,155,156,177,178,179,182,187,189,190,191,195,196,198,204,205,207,218,219,220,222,223,224,225,229,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,54,-6,-9,-124,54,-5,54,-8,-12,-10,-11,-13,-14,54,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,54,54,54,54,54,54,54,54,54,54,-84,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-124,54,-67,54,54,54,-7,-79,-81,54,-71,-73,54,54,-50,-80,-82,-66,-76,-77,-78,54,54,-48,-49,-83,54,54,-21,54,-17,-20,-69,-70,-72,-75,-62,-63,-64,54,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'FALSE':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,23,24,25,26,27,28,29,30,31,32,33,34,36,37,42,49,58,63,64,65,69,70,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,99,100,104,105,106,107,112,120,121,122,147,149,150,151,152,154,155,156,177,178,179,182,187,189,190,191,195,196,198,204,205,207,218,219,220,222,223,224,225,229,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,-124,-124,55,-6,-9,-124,55,-5,55,-8,-12,-10,-11,-13,-14,55,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,55,55,55,55,55,55,55,55,55,55,-84,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,-124,55,-67,55,55,55,-7,-79,-81,55,-71,-73,55,55,-50,-80,-82,-66,-76,-77,-78,55,55,-48,-49,-83,55,55,-21,55,-17,-20,-69,-70,-72,-75,-62,-63,-64,55,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'$end':([0,1,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,58,74,104,112,120,121,147,149,154,155,156,177,178,179,189,191,198,205,207,218,219,220,222,223,224,225,239,244,250,251,258,259,265,267,268,269,270,274,275,276,280,281,],[-124,0,-124,-124,-4,-6,-9,-124,-2,-5,-3,-8,-12,-10,-11,-13,-14,-33,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-1,-84,-67,-7,-79,-81,-71,-73,-80,-82,-66,-76,-77,-78,-48,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-35,-39,-15,-19,-16,-18,-41,-40,-68,-74,-65,-32,-34,-36,-37,-38,]),'MAIN':([20,],[62,]),'ASSIGN':([21,39,68,161,162,165,166,183,216,230,231,232,233,],[63,100,-86,196,197,204,206,-88,-87,-22,-24,-25,-23,]),'INCREMENT':([21,],[64,]),'DECREMENT':([21,],[65,]),'SEMICOLON':([21,35,39,42,47,50,51,52,53,54,55,56,57,66,67,68,72,73,101,102,103,109,110,111,117,118,119,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,153,163,165,167,181,183,188,192,193,194,216,227,228,235,236,248,249,256,257,260,271,272,],[-114,74,-115,104,-120,-118,-119,-116,-117,-121,-122,-123,112,120,121,-86,-114,-115,154,155,156,-112,-113,-111,177,178,179,-110,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,191,198,205,207,-85,-88,222,223,224,225,-87,250,251,258,259,269,270,-26,-27,274,-28,-29,]),'PLUS':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,75,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,75,-114,-115,75,75,75,-112,-113,-111,75,75,75,75,75,-110,-91,-92,-93,-94,-95,75,75,75,75,75,75,-102,-103,-104,-105,75,-107,-108,-109,75,75,75,75,75,75,75,-85,-88,-110,-110,75,-87,75,75,75,75,-110,]),'TIMES':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,77,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,77,-114,-115,77,77,77,-112,-113,-111,77,77,77,77,77,-110,77,77,-93,-94,-95,77,77,77,77,77,77,-102,-103,-104,-105,77,-107,-108,-109,77,77,77,77,77,77,77,-85,-88,-110,-110,77,-87,77,77,77,77,-110,]),'DIVIDE':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,78,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,78,-114,-115,78,78,78,-112,-113,-111,78,78,78,78,78,-110,78,78,-93,-94,-95,78,78,78,78,78,78,-102,-103,-104,-105,78,-107,-108,-109,78,78,78,78,78,78,78,-85,-88,-110,-110,78,-87,78,78,78,78,-110,]),'MOD':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,79,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,79,-114,-115,79,79,79,-112,-113,-111,79,79,79,79,79,-110,79,79,-93,-94,-95,79,79,79,79,79,79,-102,-103,-104,-105,79,-107,-108,-109,79,79,79,79,79,79,79,-85,-88,-110,-110,79,-87,79,79,79,79,-110,]),'GT':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,80,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,80,-114,-115,80,80,80,-112,-113,-111,80,80,80,80,80,-110,-91,-92,-93,-94,-95,None,None,None,None,None,None,-102,-103,-104,-105,80,-107,-108,-109,80,80,80,80,80,80,80,-85,-88,-110,-110,80,-87,80,80,80,80,-110,]),'LT':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,81,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,81,-114,-115,81,81,81,-112,-113,-111,81,81,81,81,81,-110,-91,-92,-93,-94,-95,None,None,None,None,None,None,-102,-103,-104,-105,81,-107,-108,-109,81,81,81,81,81,81,81,-85,-88,-110,-110,81,-87,81,81,81,81,-110,]),'GE':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,82,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,82,-114,-115,82,82,82,-112,-113,-111,82,82,82,82,82,-110,-91,-92,-93,-94,-95,None,None,None,None,None,None,-102,-103,-104,-105,82,-107,-108,-109,82,82,82,82,82,82,82,-85,-88,-110,-110,82,-87,82,82,82,82,-110,]),'LE':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,83,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,83,-114,-115,83,83,83,-112,-113,-111,83,83,83,83,83,-110,-91,-92,-93,-94,-95,None,None,None,None,None,None,-102,-103,-104,-105,83,-107,-108,-109,83,83,83,83,83,83,83,-85,-88,-110,-110,83,-87,83,83,83,83,-110,]),'EQUALS':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,84,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,84,-114,-115,84,84,84,-112,-113,-111,84,84,84,84,84,-110,-91,-92,-93,-94,-95,None,None,None,None,None,None,-102,-103,-104,-105,84,-107,-108,-109,84,84,84,84,84,84,84,-85,-88,-110,-110,84,-87,84,84,84,84,-110,]),'NE':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,85,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,85,-114,-115,85,85,85,-112,-113,-111,85,85,85,85,85,-110,-91,-92,-93,-94,-95,None,None,None,None,None,None,-102,-103,-104,-105,85,-107,-108,-109,85,85,85,85,85,85,85,-85,-88,-110,-110,85,-87,85,85,85,85,-110,]),'AND':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,86,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,86,-114,-115,86,86,86,-112,-113,-111,86,86,86,86,86,-110,86,86,86,86,86,86,86,86,86,86,86,-102,-103,-104,-105,86,-107,-108,-109,86,86,86,86,86,86,86,-85,-88,-110,-110,86,-87,86,86,86,86,-110,]),'OR':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,87,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,87,-114,-115,87,87,87,-112,-113,-111,87,87,87,87,87,-110,87,87,87,87,87,87,87,87,87,87,87,-102,-103,-104,-105,87,-107,-108,-109,87,87,87,87,87,87,87,-85,-88,-110,-110,87,-87,87,87,87,87,-110,]),'BITWISE_AND':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,88,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,88,-114,-115,88,88,88,-112,-113,88,88,88,88,88,88,-110,88,88,88,88,88,88,88,88,88,88,88,88,88,-104,-105,88,88,-108,-109,88,88,88,88,88,88,88,-85,-88,-110,-110,88,-87,88,88,88,88,-110,]),'BITWISE_OR':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,89,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,89,-114,-115,89,89,89,-112,-113,89,89,89,89,89,89,-110,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-105,89,89,-108,-109,89,89,89,89,89,89,89,-85,-88,-110,-110,89,-87,89,89,89,89,-110,]),'SQUARE':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,90,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,90,-114,-115,90,90,90,-112,-113,-111,90,90,90,90,90,-110,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,90,-107,-108,-109,90,90,90,90,90,90,90,-85,-88,-110,-110,90,-87,90,90,90,90,-110,]),'BITWISE_NOT':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,91,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,91,-114,-115,91,91,91,-112,-113,91,91,91,91,91,91,-110,91,91,91,91,91,91,91,91,91,91,91,91,91,-104,-105,91,-107,-108,-109,91,91,91,91,91,91,91,-85,-88,-110,-110,91,-87,91,91,91,91,-110,]),'BITWISE_LSHIFT':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,92,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,92,-114,-115,92,92,92,-112,-113,92,92,92,92,92,92,-110,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-108,-109,92,92,92,92,92,92,92,-85,-88,-110,-110,92,-87,92,92,92,92,-110,]),'BITWISE_RSHIFT':([21,35,39,47,50,51,52,53,54,55,56,68,71,72,73,95,97,103,109,110,111,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,181,183,184,186,188,216,217,221,227,235,248,],[-114,93,-115,-120,-118,-119,-116,-117,-121,-122,-123,-86,93,-114,-115,93,93,93,-112,-113,93,93,93,93,93,93,-110,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-108,-109,93,93,93,93,93,93,93,-85,-88,-110,-110,93,-87,93,93,93,93,-110,]),'LBRACKET':([21,68,72,113,114,164,183,197,199,201,206,216,229,234,273,],[70,122,70,164,164,199,-88,229,199,199,229,-87,229,255,229,]),'RBRACE':([24,25,26,27,28,29,30,31,32,33,34,74,99,104,120,121,147,149,151,152,154,155,156,177,178,179,189,190,191,198,205,207,218,219,220,222,223,224,225,250,251,258,259,268,269,270,],[-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-84,-124,-67,-79,-81,-71,-73,189,-50,-80,-82,-66,-76,-77,-78,-48,-49,-83,-21,-17,-20,-69,-70,-72,-75,-62,-63,-64,-15,-19,-16,-18,-68,-74,-65,]),'LBRACE':([38,47,50,51,52,53,54,55,56,68,72,73,95,97,109,110,111,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,181,183,184,185,186,209,213,216,245,246,247,260,263,277,278,],[99,-120,-118,-119,-116,-117,-121,-122,-123,-86,-114,-115,99,99,-112,-113,-111,-110,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-85,-88,99,99,99,99,99,-87,99,99,99,99,99,99,99,]),'RPAREN':([47,50,51,52,53,54,55,56,68,71,72,73,109,110,111,115,116,123,124,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,157,158,159,169,170,171,174,181,183,214,215,216,217,221,226,237,240,261,262,],[-120,-118,-119,-116,-117,-121,-122,-123,-86,126,-114,-115,-112,-113,-111,-124,-124,181,-90,-110,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,184,186,192,193,194,209,-43,-44,213,-85,-88,245,246,-87,-89,248,249,-45,-42,-46,-47,]),'COMMA':([47,50,51,52,53,54,55,56,68,72,73,109,110,111,115,116,123,124,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,160,169,170,171,174,181,183,216,217,226,237,240,252,253,254,261,262,271,272,279,],[-120,-118,-119,-116,-117,-121,-122,-123,-86,-114,-115,-112,-113,-111,-124,-124,182,-90,-110,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,195,210,-43,-44,210,-85,-88,-87,-89,182,-45,-42,182,273,-31,-46,-47,-28,-29,-30,]),'RBRACKET':([47,50,51,52,53,54,55,56,68,72,73,109,110,111,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,164,180,181,183,199,200,202,203,216,217,230,231,232,233,252,253,254,271,272,279,],[-120,-118,-119,-116,-117,-121,-122,-123,-86,-114,-115,-112,-113,-111,-90,183,-110,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,201,216,-85,-88,201,230,233,234,-87,-89,-22,-24,-25,-23,271,272,-31,-28,-29,-30,]),'COLON':([59,60,168,209,211,212,213,245,246,],[113,114,208,238,241,242,243,264,266,]),'TYPE':([113,114,164,199,201,208,234,238,241,242,243,264,266,],[161,165,200,200,232,237,257,260,261,262,263,277,278,]),'ELSE':([147,189,218,],[185,-48,247,]),'ARGSTRING':([175,176,],[214,215,]),}
+_lr_action_items = {'IMPORT':([0,2,5,10,129,],[7,7,-6,-5,-7,]),'VAL':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,111,116,129,132,133,137,138,165,167,169,170,172,173,174,200,201,202,207,213,214,215,225,232,234,237,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,15,15,-6,-9,15,15,-5,15,-8,-12,-10,-11,-13,-14,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,15,-36,-93,-140,-76,-7,195,198,-88,-90,-80,-82,15,-59,-89,-91,-75,-85,-86,-87,195,-57,-58,-92,-21,-17,-20,195,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'VAR':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,111,116,129,132,133,137,138,165,167,169,170,172,173,174,200,201,202,207,213,214,215,225,232,234,237,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,16,16,-6,-9,16,16,-5,16,-8,-12,-10,-11,-13,-14,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,16,-36,-93,-140,-76,-7,196,199,-88,-90,-80,-82,16,-59,-89,-91,-75,-85,-86,-87,196,-57,-58,-92,-21,-17,-20,196,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'FUNCTION':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,35,36,67,83,84,86,116,129,137,138,165,167,172,173,174,200,201,202,213,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,20,-6,-9,-140,20,-5,20,-8,-12,-10,-11,-13,-14,85,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-39,20,-36,-38,-93,-76,-7,-88,-90,-80,-82,-89,-91,-75,-85,-86,-87,-57,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'ANNOTATION':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,23,24,25,26,27,28,29,30,31,32,33,34,35,36,67,83,84,86,116,129,137,138,165,167,172,173,174,200,201,202,213,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,36,-6,-9,-140,36,-5,36,-8,-12,-10,-11,-13,-14,84,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-39,36,-36,-38,-93,-76,-7,-88,-90,-80,-82,-89,-91,-75,-85,-86,-87,-57,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'IF':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,111,116,129,137,138,165,167,169,170,172,173,174,200,201,202,213,214,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,38,-6,-9,-140,38,-5,38,-8,-12,-10,-11,-13,-14,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,38,-36,-93,-140,-76,-7,-88,-90,-80,-82,38,-59,-89,-91,-75,-85,-86,-87,-57,-58,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'WHILE':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,110,111,116,129,137,138,165,167,169,170,172,173,174,200,201,202,213,214,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,39,-6,-9,-140,39,-5,39,-8,-12,-10,-11,-13,-14,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,39,-36,-93,168,-140,-76,-7,-88,-90,-80,-82,39,-59,-89,-91,-75,-85,-86,-87,-57,-58,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'DO':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,111,116,129,137,138,165,167,169,170,172,173,174,200,201,202,213,214,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,40,-6,-9,-140,40,-5,40,-8,-12,-10,-11,-13,-14,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,40,-36,-93,-140,-76,-7,-88,-90,-80,-82,40,-59,-89,-91,-75,-85,-86,-87,-57,-58,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,42,43,44,51,67,72,73,74,78,79,83,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,126,127,128,129,132,133,137,138,139,165,167,168,169,170,172,173,174,195,196,198,199,200,201,202,205,207,211,213,214,215,219,220,221,223,225,231,232,234,237,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,21,-6,-9,66,-140,21,-5,21,-8,-12,-10,68,69,-11,-13,-14,70,81,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,81,81,113,114,81,81,21,81,81,81,81,81,-36,144,-93,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-140,81,-76,81,81,81,181,182,183,-7,191,191,-88,-90,81,-80,-82,81,21,-59,-89,-91,-75,238,239,238,239,-85,-86,-87,81,191,81,-57,-58,-92,81,81,81,81,-21,81,-17,-20,191,-78,-79,-81,-84,-71,-72,-73,81,-41,-45,-15,-19,-22,81,81,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'PLUSPLUS':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,21,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,111,116,129,137,138,165,167,169,170,172,173,174,200,201,202,213,214,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,42,-6,-9,-140,42,-5,42,-8,-12,-10,-11,-13,-14,75,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,42,-36,-93,-140,-76,-7,-88,-90,-80,-82,42,-59,-89,-91,-75,-85,-86,-87,-57,-58,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'MINUSMINUS':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,21,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,111,116,129,137,138,165,167,169,170,172,173,174,200,201,202,213,214,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,43,-6,-9,-140,43,-5,43,-8,-12,-10,-11,-13,-14,76,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,43,-36,-93,-140,-76,-7,-88,-90,-80,-82,43,-59,-89,-91,-75,-85,-86,-87,-57,-58,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'RETURN':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,111,116,129,137,138,165,167,169,170,172,173,174,200,201,202,213,214,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,44,-6,-9,-140,44,-5,44,-8,-12,-10,-11,-13,-14,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,44,-36,-93,-140,-76,-7,-88,-90,-80,-82,44,-59,-89,-91,-75,-85,-86,-87,-57,-58,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'PRINTINT':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,111,116,129,137,138,165,167,169,170,172,173,174,200,201,202,213,214,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,45,-6,-9,-140,45,-5,45,-8,-12,-10,-11,-13,-14,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,45,-36,-93,-140,-76,-7,-88,-90,-80,-82,45,-59,-89,-91,-75,-85,-86,-87,-57,-58,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'PRINTDOUBLE':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,111,116,129,137,138,165,167,169,170,172,173,174,200,201,202,213,214,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,46,-6,-9,-140,46,-5,46,-8,-12,-10,-11,-13,-14,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,46,-36,-93,-140,-76,-7,-88,-90,-80,-82,46,-59,-89,-91,-75,-85,-86,-87,-57,-58,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'PRINTSTRING':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,111,116,129,137,138,165,167,169,170,172,173,174,200,201,202,213,214,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,47,-6,-9,-140,47,-5,47,-8,-12,-10,-11,-13,-14,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,47,-36,-93,-140,-76,-7,-88,-90,-80,-82,47,-59,-89,-91,-75,-85,-86,-87,-57,-58,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'PRINTF':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,111,116,129,137,138,165,167,169,170,172,173,174,200,201,202,213,214,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,48,-6,-9,-140,48,-5,48,-8,-12,-10,-11,-13,-14,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,48,-36,-93,-140,-76,-7,-88,-90,-80,-82,48,-59,-89,-91,-75,-85,-86,-87,-57,-58,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'LPAREN':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,21,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,45,46,47,48,51,61,62,63,64,65,67,70,71,72,73,74,78,79,81,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,144,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,261,262,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,22,-6,-9,-140,22,-5,22,-8,-12,-10,-11,-13,-14,78,22,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,106,108,22,117,118,119,120,22,124,125,126,127,128,22,132,133,22,22,22,22,22,78,-36,-93,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-140,22,-76,22,22,22,-7,-88,-90,22,207,-80,-82,211,22,-59,-89,-91,-75,-85,-86,-87,22,22,-57,-58,-92,22,22,22,22,-21,22,-17,-20,-78,-79,-81,-84,-71,-72,-73,22,293,294,-41,-45,-15,-19,-22,22,22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'NOT':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,51,-6,-9,-140,51,-5,51,-8,-12,-10,-11,-13,-14,51,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,51,51,51,51,51,51,51,51,51,51,-36,-93,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,-140,51,-76,51,51,51,-7,-88,-90,51,-80,-82,51,51,-59,-89,-91,-75,-85,-86,-87,51,51,-57,-58,-92,51,51,51,51,-21,51,-17,-20,-78,-79,-81,-84,-71,-72,-73,51,-41,-45,-15,-19,-22,51,51,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'MINUS':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,21,22,24,25,26,27,28,29,30,31,32,33,34,35,37,38,39,41,44,49,51,52,53,54,55,56,57,58,59,60,67,72,73,74,77,78,79,80,81,82,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,111,112,115,116,117,118,119,121,122,123,129,134,135,136,137,138,139,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,179,180,200,201,202,203,204,205,206,208,210,211,212,213,214,215,219,220,221,222,223,225,231,232,234,243,244,246,247,248,249,250,251,252,253,255,256,257,260,268,273,278,283,285,286,287,288,289,293,294,298,299,307,309,311,312,313,317,318,319,320,321,328,329,],[-140,-140,-140,50,-6,-9,-140,50,-5,50,-8,-12,-10,-11,-13,-14,-128,50,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,88,50,50,-129,50,-134,50,-132,-133,-130,-131,-135,-136,-137,-138,-139,50,50,50,50,-100,50,50,88,-128,-129,-36,-93,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,88,50,88,-140,50,88,-76,50,50,50,-126,-127,-125,-7,88,88,88,-88,-90,50,88,88,-124,-105,-106,-107,-108,-109,88,88,88,88,88,88,-116,-117,-118,-119,88,-121,-122,-123,88,-80,88,-82,50,50,-59,88,-89,-91,-75,88,88,88,-95,-96,-85,-86,-87,88,-94,50,-102,-124,-124,50,88,-57,-58,-92,50,50,50,-99,50,-21,50,-17,-20,-101,88,-78,-79,-81,88,-84,-71,-72,-73,88,88,88,50,88,-41,-45,-124,-97,-98,-15,-19,-22,50,50,-16,-18,-47,-46,-77,-83,-74,88,88,-35,-40,-42,-43,-44,]),'BREAK':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,54,-6,-9,-140,54,-5,54,-8,-12,-10,-11,-13,-14,54,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,54,54,54,54,54,54,54,54,54,54,-36,-93,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-140,54,-76,54,54,54,-7,-88,-90,54,-80,-82,54,54,-59,-89,-91,-75,-85,-86,-87,54,54,-57,-58,-92,54,54,54,54,-21,54,-17,-20,-78,-79,-81,-84,-71,-72,-73,54,-41,-45,-15,-19,-22,54,54,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'CONTINUE':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,55,-6,-9,-140,55,-5,55,-8,-12,-10,-11,-13,-14,55,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,55,55,55,55,55,55,55,55,55,55,-36,-93,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,-140,55,-76,55,55,55,-7,-88,-90,55,-80,-82,55,55,-59,-89,-91,-75,-85,-86,-87,55,55,-57,-58,-92,55,55,55,55,-21,55,-17,-20,-78,-79,-81,-84,-71,-72,-73,55,-41,-45,-15,-19,-22,55,55,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'NUMBER':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,50,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,165,167,168,169,170,172,173,174,187,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,295,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,52,-6,-9,-140,52,-5,52,-8,-12,-10,-11,-13,-14,52,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,52,52,52,121,52,52,52,52,52,52,52,-36,-93,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-140,52,-76,52,52,52,-7,-88,-90,52,-80,-82,52,52,-59,-89,-91,-75,230,-85,-86,-87,52,52,-57,-58,-92,52,52,52,52,-21,52,-17,-20,-78,-79,-81,-84,-71,-72,-73,52,-41,-45,-15,-19,-22,52,52,230,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'FLOAT':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,50,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,53,-6,-9,-140,53,-5,53,-8,-12,-10,-11,-13,-14,53,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,53,53,53,122,53,53,53,53,53,53,53,-36,-93,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-140,53,-76,53,53,53,-7,-88,-90,53,-80,-82,53,53,-59,-89,-91,-75,-85,-86,-87,53,53,-57,-58,-92,53,53,53,53,-21,53,-17,-20,-78,-79,-81,-84,-71,-72,-73,53,-41,-45,-15,-19,-22,53,53,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'STRING':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,120,129,137,138,139,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,49,-6,-9,-140,49,-5,49,-8,-12,-10,-11,-13,-14,49,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,49,49,49,49,49,49,49,49,49,49,-36,-93,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-140,49,-76,49,49,49,178,-7,-88,-90,49,-80,-82,49,49,-59,-89,-91,-75,-85,-86,-87,49,49,-57,-58,-92,49,49,49,49,-21,49,-17,-20,-78,-79,-81,-84,-71,-72,-73,49,-41,-45,-15,-19,-22,49,49,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'TRUE':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,56,-6,-9,-140,56,-5,56,-8,-12,-10,-11,-13,-14,56,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,56,56,56,56,56,56,56,56,56,56,-36,-93,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-140,56,-76,56,56,56,-7,-88,-90,56,-80,-82,56,56,-59,-89,-91,-75,-85,-86,-87,56,56,-57,-58,-92,56,56,56,56,-21,56,-17,-20,-78,-79,-81,-84,-71,-72,-73,56,-41,-45,-15,-19,-22,56,56,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'FALSE':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,57,-6,-9,-140,57,-5,57,-8,-12,-10,-11,-13,-14,57,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,57,57,57,57,57,57,57,57,57,57,-36,-93,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-140,57,-76,57,57,57,-7,-88,-90,57,-80,-82,57,57,-59,-89,-91,-75,-85,-86,-87,57,57,-57,-58,-92,57,57,57,57,-21,57,-17,-20,-78,-79,-81,-84,-71,-72,-73,57,-41,-45,-15,-19,-22,57,57,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'READINT':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,61,-6,-9,-140,61,-5,61,-8,-12,-10,-11,-13,-14,61,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,61,61,61,61,61,61,61,61,61,61,-36,-93,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-140,61,-76,61,61,61,-7,-88,-90,61,-80,-82,61,61,-59,-89,-91,-75,-85,-86,-87,61,61,-57,-58,-92,61,61,61,61,-21,61,-17,-20,-78,-79,-81,-84,-71,-72,-73,61,-41,-45,-15,-19,-22,61,61,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'READDOUBLE':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,62,-6,-9,-140,62,-5,62,-8,-12,-10,-11,-13,-14,62,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,62,62,62,62,62,62,62,62,62,62,-36,-93,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-140,62,-76,62,62,62,-7,-88,-90,62,-80,-82,62,62,-59,-89,-91,-75,-85,-86,-87,62,62,-57,-58,-92,62,62,62,62,-21,62,-17,-20,-78,-79,-81,-84,-71,-72,-73,62,-41,-45,-15,-19,-22,62,62,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'READINTSINTO':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,63,-6,-9,-140,63,-5,63,-8,-12,-10,-11,-13,-14,63,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,63,63,63,63,63,63,63,63,63,63,-36,-93,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-140,63,-76,63,63,63,-7,-88,-90,63,-80,-82,63,63,-59,-89,-91,-75,-85,-86,-87,63,63,-57,-58,-92,63,63,63,63,-21,63,-17,-20,-78,-79,-81,-84,-71,-72,-73,63,-41,-45,-15,-19,-22,63,63,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'READDOUBLESINTO':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,64,-6,-9,-140,64,-5,64,-8,-12,-10,-11,-13,-14,64,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,64,64,64,64,64,64,64,64,64,64,-36,-93,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-140,64,-76,64,64,64,-7,-88,-90,64,-80,-82,64,64,-59,-89,-91,-75,-85,-86,-87,64,64,-57,-58,-92,64,64,64,64,-21,64,-17,-20,-78,-79,-81,-84,-71,-72,-73,64,-41,-45,-15,-19,-22,64,64,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'ARRAYLENGTH':([0,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,22,24,25,26,27,28,29,30,31,32,33,34,35,38,39,44,51,67,72,73,74,78,79,83,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,111,112,116,117,118,119,129,137,138,139,165,167,168,169,170,172,173,174,200,201,202,205,211,213,214,215,219,220,221,223,225,231,232,234,246,247,248,250,251,252,253,260,273,278,287,288,289,293,294,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,-140,-140,65,-6,-9,-140,65,-5,65,-8,-12,-10,-11,-13,-14,65,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,65,65,65,65,65,65,65,65,65,65,-36,-93,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-140,65,-76,65,65,65,-7,-88,-90,65,-80,-82,65,65,-59,-89,-91,-75,-85,-86,-87,65,65,-57,-58,-92,65,65,65,65,-21,65,-17,-20,-78,-79,-81,-84,-71,-72,-73,65,-41,-45,-15,-19,-22,65,65,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'$end':([0,1,2,3,4,5,6,8,9,10,11,12,13,14,17,18,19,24,25,26,27,28,29,30,31,32,33,34,35,67,83,86,116,129,137,138,165,167,172,173,174,200,201,202,213,215,225,232,234,246,247,248,250,251,252,253,273,278,287,288,289,298,299,307,309,311,312,313,319,320,321,328,329,],[-140,0,-140,-140,-4,-6,-9,-140,-2,-5,-3,-8,-12,-10,-11,-13,-14,-37,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-1,-36,-93,-76,-7,-88,-90,-80,-82,-89,-91,-75,-85,-86,-87,-57,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-41,-45,-15,-19,-22,-16,-18,-47,-46,-77,-83,-74,-35,-40,-42,-43,-44,]),'MAIN':([20,85,],[71,71,]),'ASSIGN':([21,41,77,184,185,188,189,206,243,263,264,265,266,],[72,112,-100,223,224,231,233,-102,-101,-23,-25,-26,-24,]),'INCREMENT':([21,],[73,]),'DECREMENT':([21,],[74,]),'SEMICOLON':([21,37,41,44,49,52,53,54,55,56,57,58,59,60,66,75,76,77,81,82,113,114,115,121,122,123,134,135,136,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,171,179,180,186,188,190,204,206,212,216,217,218,222,243,257,258,259,268,269,283,284,285,286,296,297,300,314,315,326,327,],[-128,86,-129,116,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,129,137,138,-100,-128,-129,172,173,174,-126,-127,-125,200,201,202,-124,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,215,-95,-96,225,232,234,-94,-102,250,251,252,253,-99,-101,287,288,289,298,299,312,313,-97,-98,-29,-30,319,-31,-32,-27,-28,]),'PLUS':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,87,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,87,-128,-129,87,87,87,-126,-127,-125,87,87,87,87,87,-124,-105,-106,-107,-108,-109,87,87,87,87,87,87,-116,-117,-118,-119,87,-121,-122,-123,87,87,87,87,87,87,-95,-96,87,-94,-102,-124,-124,87,-99,-101,87,87,87,87,87,87,-124,-97,-98,87,87,]),'TIMES':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,89,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,89,-128,-129,89,89,89,-126,-127,-125,89,89,89,89,89,-124,89,89,-107,-108,-109,89,89,89,89,89,89,-116,-117,-118,-119,89,-121,-122,-123,89,89,89,89,89,89,-95,-96,89,-94,-102,-124,-124,89,-99,-101,89,89,89,89,89,89,-124,-97,-98,89,89,]),'DIVIDE':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,90,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,90,-128,-129,90,90,90,-126,-127,-125,90,90,90,90,90,-124,90,90,-107,-108,-109,90,90,90,90,90,90,-116,-117,-118,-119,90,-121,-122,-123,90,90,90,90,90,90,-95,-96,90,-94,-102,-124,-124,90,-99,-101,90,90,90,90,90,90,-124,-97,-98,90,90,]),'MOD':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,91,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,91,-128,-129,91,91,91,-126,-127,-125,91,91,91,91,91,-124,91,91,-107,-108,-109,91,91,91,91,91,91,-116,-117,-118,-119,91,-121,-122,-123,91,91,91,91,91,91,-95,-96,91,-94,-102,-124,-124,91,-99,-101,91,91,91,91,91,91,-124,-97,-98,91,91,]),'GT':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,92,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,92,-128,-129,92,92,92,-126,-127,-125,92,92,92,92,92,-124,-105,-106,-107,-108,-109,None,None,None,None,None,None,-116,-117,-118,-119,92,-121,-122,-123,92,92,92,92,92,92,-95,-96,92,-94,-102,-124,-124,92,-99,-101,92,92,92,92,92,92,-124,-97,-98,92,92,]),'LT':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,93,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,93,-128,-129,93,93,93,-126,-127,-125,93,93,93,93,93,-124,-105,-106,-107,-108,-109,None,None,None,None,None,None,-116,-117,-118,-119,93,-121,-122,-123,93,93,93,93,93,93,-95,-96,93,-94,-102,-124,-124,93,-99,-101,93,93,93,93,93,93,-124,-97,-98,93,93,]),'GE':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,94,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,94,-128,-129,94,94,94,-126,-127,-125,94,94,94,94,94,-124,-105,-106,-107,-108,-109,None,None,None,None,None,None,-116,-117,-118,-119,94,-121,-122,-123,94,94,94,94,94,94,-95,-96,94,-94,-102,-124,-124,94,-99,-101,94,94,94,94,94,94,-124,-97,-98,94,94,]),'LE':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,95,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,95,-128,-129,95,95,95,-126,-127,-125,95,95,95,95,95,-124,-105,-106,-107,-108,-109,None,None,None,None,None,None,-116,-117,-118,-119,95,-121,-122,-123,95,95,95,95,95,95,-95,-96,95,-94,-102,-124,-124,95,-99,-101,95,95,95,95,95,95,-124,-97,-98,95,95,]),'EQUALS':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,96,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,96,-128,-129,96,96,96,-126,-127,-125,96,96,96,96,96,-124,-105,-106,-107,-108,-109,None,None,None,None,None,None,-116,-117,-118,-119,96,-121,-122,-123,96,96,96,96,96,96,-95,-96,96,-94,-102,-124,-124,96,-99,-101,96,96,96,96,96,96,-124,-97,-98,96,96,]),'NE':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,97,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,97,-128,-129,97,97,97,-126,-127,-125,97,97,97,97,97,-124,-105,-106,-107,-108,-109,None,None,None,None,None,None,-116,-117,-118,-119,97,-121,-122,-123,97,97,97,97,97,97,-95,-96,97,-94,-102,-124,-124,97,-99,-101,97,97,97,97,97,97,-124,-97,-98,97,97,]),'AND':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,98,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,98,-128,-129,98,98,98,-126,-127,-125,98,98,98,98,98,-124,98,98,98,98,98,98,98,98,98,98,98,-116,-117,-118,-119,98,-121,-122,-123,98,98,98,98,98,98,-95,-96,98,-94,-102,-124,-124,98,-99,-101,98,98,98,98,98,98,-124,-97,-98,98,98,]),'OR':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,99,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,99,-128,-129,99,99,99,-126,-127,-125,99,99,99,99,99,-124,99,99,99,99,99,99,99,99,99,99,99,-116,-117,-118,-119,99,-121,-122,-123,99,99,99,99,99,99,-95,-96,99,-94,-102,-124,-124,99,-99,-101,99,99,99,99,99,99,-124,-97,-98,99,99,]),'BITWISE_AND':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,100,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,100,-128,-129,100,100,100,-126,-127,100,100,100,100,100,100,-124,100,100,100,100,100,100,100,100,100,100,100,100,100,-118,-119,100,100,-122,-123,100,100,100,100,100,100,-95,-96,100,-94,-102,-124,-124,100,-99,-101,100,100,100,100,100,100,-124,-97,-98,100,100,]),'BITWISE_OR':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,101,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,101,-128,-129,101,101,101,-126,-127,101,101,101,101,101,101,-124,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-119,101,101,-122,-123,101,101,101,101,101,101,-95,-96,101,-94,-102,-124,-124,101,-99,-101,101,101,101,101,101,101,-124,-97,-98,101,101,]),'SQUARE':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,102,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,102,-128,-129,102,102,102,-126,-127,-125,102,102,102,102,102,-124,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,102,-121,-122,-123,102,102,102,102,102,102,-95,-96,102,-94,-102,-124,-124,102,-99,-101,102,102,102,102,102,102,-124,-97,-98,102,102,]),'BITWISE_NOT':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,103,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,103,-128,-129,103,103,103,-126,-127,103,103,103,103,103,103,-124,103,103,103,103,103,103,103,103,103,103,103,103,103,-118,-119,103,-121,-122,-123,103,103,103,103,103,103,-95,-96,103,-94,-102,-124,-124,103,-99,-101,103,103,103,103,103,103,-124,-97,-98,103,103,]),'BITWISE_LSHIFT':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,104,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,104,-128,-129,104,104,104,-126,-127,104,104,104,104,104,104,-124,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-122,-123,104,104,104,104,104,104,-95,-96,104,-94,-102,-124,-124,104,-99,-101,104,104,104,104,104,104,-124,-97,-98,104,104,]),'BITWISE_RSHIFT':([21,37,41,49,52,53,54,55,56,57,58,59,60,77,80,81,82,107,109,115,121,122,123,134,135,136,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,179,180,203,204,206,208,210,212,222,243,244,249,255,256,257,268,283,285,286,317,318,],[-128,105,-129,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,105,-128,-129,105,105,105,-126,-127,105,105,105,105,105,105,-124,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,-122,-123,105,105,105,105,105,105,-95,-96,105,-94,-102,-124,-124,105,-99,-101,105,105,105,105,105,105,-124,-97,-98,105,105,]),'LBRACKET':([21,77,81,130,131,187,206,224,226,228,233,235,243,260,267,275,276,316,],[79,139,79,187,187,226,-102,260,226,226,260,226,-101,260,295,226,226,260,]),'RBRACE':([25,26,27,28,29,30,31,32,33,34,35,86,111,116,137,138,165,167,169,170,172,173,174,200,201,202,213,214,215,225,232,234,246,247,248,250,251,252,253,287,288,289,298,299,311,312,313,],[-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-93,-140,-76,-88,-90,-80,-82,213,-59,-89,-91,-75,-85,-86,-87,-57,-58,-92,-21,-17,-20,-78,-79,-81,-84,-71,-72,-73,-15,-19,-22,-16,-18,-77,-83,-74,]),'LBRACE':([40,49,52,53,54,55,56,57,58,59,60,77,81,82,107,109,121,122,123,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,179,180,204,206,208,209,210,222,236,240,243,279,280,281,282,285,286,300,305,322,323,324,],[111,-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,-128,-129,111,111,-126,-127,-125,-124,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-95,-96,-94,-102,111,111,111,-99,111,111,-101,111,111,111,111,-97,-98,111,111,111,111,111,]),'RPAREN':([49,52,53,54,55,56,57,58,59,60,77,80,81,82,121,122,123,124,125,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,175,176,177,179,180,183,192,193,194,197,204,206,207,222,241,242,243,244,245,249,254,255,256,263,264,265,266,270,271,274,285,286,301,302,303,304,317,318,],[-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,143,-128,-129,-126,-127,-125,179,180,-140,-140,204,-104,-124,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,208,210,216,217,218,-95,-96,222,236,-49,-50,240,-94,-102,-140,-99,279,280,-101,-103,281,283,284,285,286,-23,-25,-26,-24,-51,-54,-48,-97,-98,-52,-55,-53,-56,326,327,]),'COMMA':([49,52,53,54,55,56,57,58,59,60,77,81,82,121,122,123,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,178,179,180,181,182,192,193,194,197,204,206,207,222,243,244,245,254,263,264,265,266,270,271,274,285,286,290,291,292,301,302,303,304,314,315,325,],[-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,-128,-129,-126,-127,-125,-140,-140,205,-104,-124,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,219,-95,-96,220,221,237,-49,-50,237,-94,-102,-140,-99,-101,-103,237,205,-23,-25,-26,-24,-51,-54,-48,-97,-98,205,316,-34,-52,-55,-53,-56,-31,-32,-33,]),'RBRACKET':([49,52,53,54,55,56,57,58,59,60,77,81,82,121,122,123,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,179,180,187,203,204,206,222,226,227,229,230,243,244,263,264,265,266,285,286,290,291,292,314,315,325,],[-134,-132,-133,-130,-131,-135,-136,-137,-138,-139,-100,-128,-129,-126,-127,-125,-104,206,-124,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-95,-96,228,243,-94,-102,-99,228,263,266,267,-101,-103,-23,-25,-26,-24,-97,-98,314,315,-34,-31,-32,-33,]),'COLON':([68,69,191,236,238,239,240,279,280,281,],[130,131,235,272,275,276,277,306,308,310,]),'TYPE':([130,131,187,226,228,235,267,272,275,276,277,306,308,310,],[184,188,227,227,265,270,297,300,301,303,305,322,323,324,]),'ELSE':([165,213,246,],[209,-57,282,]),'ARGSTRING':([198,199,],[241,242,]),'MMAPINTS':([224,],[261,]),'MMAPDOUBLES':([224,],[262,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'import_list':([0,],[2,]),'global_declaration_list':([0,2,],[3,8,]),'declaration_list':([0,2,3,8,],[4,9,11,58,]),'import_statement':([0,2,],[5,10,]),'empty':([0,2,3,8,99,115,116,],[6,6,13,13,152,171,171,]),'global_declaration':([3,8,],[12,12,]),'variable_declaration':([3,4,8,9,11,58,151,],[14,24,14,24,24,24,24,]),'declaration':([4,9,11,58,],[17,17,17,17,]),'function_declaration':([4,9,11,58,],[18,18,18,18,]),'statement':([4,9,11,58,151,],[19,19,19,19,190,]),'function_statement':([4,9,11,58,],[23,23,23,23,]),'if_statement':([4,9,11,58,151,],[25,25,25,25,25,]),'while_statement':([4,9,11,58,151,],[26,26,26,26,26,]),'do_while_statement':([4,9,11,58,151,],[27,27,27,27,27,]),'assignment_statement':([4,9,11,58,151,],[28,28,28,28,28,]),'array_assignment_statement':([4,9,11,58,151,],[29,29,29,29,29,]),'increment_statement':([4,9,11,58,151,],[30,30,30,30,30,]),'decrement_statement':([4,9,11,58,151,],[31,31,31,31,31,]),'expression_statement':([4,9,11,58,151,],[32,32,32,32,32,]),'return_statement':([4,9,11,58,151,],[33,33,33,33,33,]),'print_statement':([4,9,11,58,151,],[34,34,34,34,34,]),'expression':([4,9,11,22,36,37,42,49,58,63,64,65,69,70,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,105,106,107,122,150,151,182,187,195,196,204,229,],[35,35,35,71,95,97,103,111,35,117,118,119,124,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,153,157,158,159,180,188,35,217,221,124,227,235,124,]),'array_access':([4,9,11,22,36,37,42,49,58,63,64,65,69,70,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,105,106,107,122,150,151,182,187,195,196,204,229,],[39,39,39,73,73,73,73,73,39,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,39,73,73,73,73,73,73,]),'function_call':([4,9,11,22,36,37,42,49,58,63,64,65,69,70,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,105,106,107,122,150,151,182,187,195,196,204,229,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'array_access_list':([21,72,],[68,68,]),'statement_block':([38,95,97,184,185,186,209,213,245,246,247,260,263,277,278,],[98,147,149,218,219,220,239,244,265,267,268,275,276,280,281,]),'expression_list':([69,195,229,],[123,226,252,]),'statement_list':([99,],[151,]),'array_type':([113,114,164,199,201,],[162,166,202,202,231,]),'array_allocation_type':([113,114,234,],[163,167,256,]),'parameter_list':([115,116,],[169,174,]),'parameter':([115,116,210,],[170,170,240,]),'array_initializer':([197,206,229,273,],[228,236,254,279,]),'array_initializer_list':([229,],[253,]),}
+_lr_goto_items = {'program':([0,],[1,]),'import_list':([0,],[2,]),'global_declaration_list':([0,2,],[3,8,]),'declaration_list':([0,2,3,8,],[4,9,11,67,]),'import_statement':([0,2,],[5,10,]),'empty':([0,2,3,8,111,132,133,207,],[6,6,13,13,170,194,194,194,]),'global_declaration':([3,8,],[12,12,]),'variable_declaration':([3,4,8,9,11,67,169,],[14,25,14,25,25,25,25,]),'declaration':([4,9,11,67,],[17,17,17,17,]),'function_declaration':([4,9,11,67,],[18,18,18,18,]),'statement':([4,9,11,67,169,],[19,19,19,19,214,]),'annotation_list':([4,9,11,67,],[23,23,23,23,]),'function_statement':([4,9,11,23,67,],[24,24,24,83,24,]),'if_statement':([4,9,11,67,169,],[26,26,26,26,26,]),'while_statement':([4,9,11,67,169,],[27,27,27,27,27,]),'do_while_statement':([4,9,11,67,169,],[28,28,28,28,28,]),'assignment_statement':([4,9,11,67,169,],[29,29,29,29,29,]),'array_assignment_statement':([4,9,11,67,169,],[30,30,30,30,30,]),'increment_statement':([4,9,11,67,169,],[31,31,31,31,31,]),'decrement_statement':([4,9,11,67,169,],[32,32,32,32,32,]),'expression_statement':([4,9,11,67,169,],[33,33,33,33,33,]),'return_statement':([4,9,11,67,169,],[34,34,34,34,34,]),'print_statement':([4,9,11,67,169,],[35,35,35,35,35,]),'expression':([4,9,11,22,38,39,44,51,67,72,73,74,78,79,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,112,117,118,119,139,168,169,205,211,219,220,221,223,231,260,293,294,],[37,37,37,80,107,109,115,123,37,134,135,136,141,142,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,171,175,176,177,203,212,37,244,249,141,255,256,257,268,141,317,318,]),'array_access':([4,9,11,22,38,39,44,51,67,72,73,74,78,79,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,112,117,118,119,139,168,169,205,211,219,220,221,223,231,260,293,294,],[41,41,41,82,82,82,82,82,41,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,41,82,82,82,82,82,82,82,82,82,82,]),'function_call':([4,9,11,22,38,39,44,51,67,72,73,74,78,79,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,112,117,118,119,139,168,169,205,211,219,220,221,223,231,260,293,294,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'read_expression':([4,9,11,22,38,39,44,51,67,72,73,74,78,79,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,112,117,118,119,139,168,169,205,211,219,220,221,223,231,260,293,294,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'array_length':([4,9,11,22,38,39,44,51,67,72,73,74,78,79,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,112,117,118,119,139,168,169,205,211,219,220,221,223,231,260,293,294,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'array_access_list':([21,81,],[77,77,]),'statement_block':([40,107,109,208,209,210,236,240,279,280,281,282,300,305,322,323,324,],[110,165,167,246,247,248,273,278,307,309,273,311,320,321,328,329,320,]),'expression_list':([78,219,260,],[140,254,290,]),'statement_list':([111,],[169,]),'array_type':([130,131,187,226,228,235,275,276,],[185,189,229,229,264,271,302,304,]),'array_allocation_type':([130,131,267,],[186,190,296,]),'parameter_list':([132,133,207,],[192,197,245,]),'parameter':([132,133,207,237,],[193,193,193,274,]),'array_initializer':([224,233,260,316,],[258,269,292,325,]),'mapped_file':([224,],[259,]),'array_initializer_list':([260,],[291,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,128 +27,144 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> import_list global_declaration_list declaration_list','program',3,'p_program','grammar.py',27),
-  ('program -> import_list declaration_list','program',2,'p_program','grammar.py',28),
-  ('program -> global_declaration_list declaration_list','program',2,'p_program','grammar.py',29),
-  ('program -> declaration_list','program',1,'p_program','grammar.py',30),
-  ('import_list -> import_list import_statement','import_list',2,'p_import_list','grammar.py',47),
-  ('import_list -> import_statement','import_list',1,'p_import_list','grammar.py',48),
-  ('import_statement -> IMPORT IDENTIFIER SEMICOLON','import_statement',3,'p_import_statement','grammar.py',55),
-  ('global_declaration_list -> global_declaration_list global_declaration','global_declaration_list',2,'p_global_declaration_list','grammar.py',59),
-  ('global_declaration_list -> empty','global_declaration_list',1,'p_global_declaration_list','grammar.py',60),
-  ('global_declaration -> variable_declaration','global_declaration',1,'p_global_declaration','grammar.py',67),
-  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','grammar.py',71),
-  ('declaration_list -> empty','declaration_list',1,'p_declaration_list','grammar.py',72),
-  ('declaration -> function_declaration','declaration',1,'p_declaration','grammar.py',79),
-  ('declaration -> statement','declaration',1,'p_declaration','grammar.py',80),
-  ('variable_declaration -> VAL IDENTIFIER COLON TYPE ASSIGN expression SEMICOLON','variable_declaration',7,'p_variable_declaration','grammar.py',85),
-  ('variable_declaration -> VAR IDENTIFIER COLON TYPE ASSIGN expression SEMICOLON','variable_declaration',7,'p_variable_declaration','grammar.py',86),
-  ('variable_declaration -> VAR IDENTIFIER COLON TYPE SEMICOLON','variable_declaration',5,'p_variable_declaration','grammar.py',87),
-  ('variable_declaration -> VAR IDENTIFIER COLON array_type ASSIGN array_initializer SEMICOLON','variable_declaration',7,'p_variable_declaration','grammar.py',88),
-  ('variable_declaration -> VAL IDENTIFIER COLON array_type ASSIGN array_initializer SEMICOLON','variable_declaration',7,'p_variable_declaration','grammar.py',89),
-  ('variable_declaration -> VAR IDENTIFIER COLON array_allocation_type SEMICOLON','variable_declaration',5,'p_variable_declaration','grammar.py',90),
-  ('variable_declaration -> VAL IDENTIFIER COLON array_allocation_type SEMICOLON','variable_declaration',5,'p_variable_declaration','grammar.py',91),
-  ('array_type -> LBRACKET TYPE RBRACKET','array_type',3,'p_array_type','grammar.py',102),
-  ('array_type -> LBRACKET array_type RBRACKET','array_type',3,'p_array_type','grammar.py',103),
-  ('array_type -> LBRACKET RBRACKET array_type','array_type',3,'p_array_type','grammar.py',104),
-  ('array_type -> LBRACKET RBRACKET TYPE','array_type',3,'p_array_type','grammar.py',105),
-  ('array_allocation_type -> LBRACKET NUMBER RBRACKET array_allocation_type','array_allocation_type',4,'p_array_allocation_type','grammar.py',116),
-  ('array_allocation_type -> LBRACKET NUMBER RBRACKET TYPE','array_allocation_type',4,'p_array_allocation_type','grammar.py',117),
-  ('array_initializer -> LBRACKET expression_list RBRACKET','array_initializer',3,'p_array_initializer','grammar.py',124),
-  ('array_initializer -> LBRACKET array_initializer_list RBRACKET','array_initializer',3,'p_array_initializer','grammar.py',125),
-  ('array_initializer_list -> array_initializer_list COMMA array_initializer','array_initializer_list',3,'p_array_initializer_list','grammar.py',129),
-  ('array_initializer_list -> array_initializer','array_initializer_list',1,'p_array_initializer_list','grammar.py',130),
-  ('function_declaration -> FUNCTION IDENTIFIER LPAREN parameter_list RPAREN COLON TYPE SEMICOLON','function_declaration',8,'p_function_declaration','grammar.py',137),
-  ('function_declaration -> function_statement','function_declaration',1,'p_function_declaration','grammar.py',138),
-  ('function_statement -> FUNCTION IDENTIFIER LPAREN parameter_list RPAREN COLON TYPE statement_block','function_statement',8,'p_function_statement','grammar.py',145),
-  ('function_statement -> FUNCTION IDENTIFIER LPAREN parameter_list RPAREN statement_block','function_statement',6,'p_function_statement','grammar.py',146),
-  ('function_statement -> FUNCTION MAIN LPAREN parameter_list RPAREN COLON TYPE statement_block','function_statement',8,'p_function_statement','grammar.py',147),
-  ('function_statement -> FUNCTION MAIN LPAREN VAL ARGSTRING RPAREN COLON TYPE statement_block','function_statement',9,'p_function_statement','grammar.py',148),
-  ('function_statement -> FUNCTION MAIN LPAREN VAR ARGSTRING RPAREN COLON TYPE statement_block','function_statement',9,'p_function_statement','grammar.py',149),
-  ('function_statement -> FUNCTION MAIN LPAREN parameter_list RPAREN statement_block','function_statement',6,'p_function_statement','grammar.py',150),
-  ('function_statement -> FUNCTION MAIN LPAREN VAR ARGSTRING RPAREN statement_block','function_statement',7,'p_function_statement','grammar.py',151),
-  ('function_statement -> FUNCTION MAIN LPAREN VAL ARGSTRING RPAREN statement_block','function_statement',7,'p_function_statement','grammar.py',152),
-  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list','grammar.py',171),
-  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','grammar.py',172),
-  ('parameter_list -> empty','parameter_list',1,'p_parameter_list','grammar.py',173),
-  ('parameter -> IDENTIFIER COLON TYPE','parameter',3,'p_parameter','grammar.py',182),
-  ('parameter -> VAL IDENTIFIER COLON TYPE','parameter',4,'p_parameter','grammar.py',183),
-  ('parameter -> VAR IDENTIFIER COLON TYPE','parameter',4,'p_parameter','grammar.py',184),
-  ('statement_block -> LBRACE statement_list RBRACE','statement_block',3,'p_statement_block','grammar.py',191),
-  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','grammar.py',195),
-  ('statement_list -> empty','statement_list',1,'p_statement_list','grammar.py',196),
-  ('statement -> variable_declaration','statement',1,'p_statement','grammar.py',204),
-  ('statement -> if_statement','statement',1,'p_statement','grammar.py',205),
-  ('statement -> while_statement','statement',1,'p_statement','grammar.py',206),
-  ('statement -> do_while_statement','statement',1,'p_statement','grammar.py',207),
-  ('statement -> assignment_statement','statement',1,'p_statement','grammar.py',208),
-  ('statement -> array_assignment_statement','statement',1,'p_statement','grammar.py',209),
-  ('statement -> increment_statement','statement',1,'p_statement','grammar.py',210),
-  ('statement -> decrement_statement','statement',1,'p_statement','grammar.py',211),
-  ('statement -> expression_statement','statement',1,'p_statement','grammar.py',212),
-  ('statement -> return_statement','statement',1,'p_statement','grammar.py',213),
-  ('statement -> print_statement','statement',1,'p_statement','grammar.py',214),
-  ('print_statement -> PRINTINT LPAREN expression RPAREN SEMICOLON','print_statement',5,'p_print_statement','grammar.py',218),
-  ('print_statement -> PRINTDOUBLE LPAREN expression RPAREN SEMICOLON','print_statement',5,'p_print_statement','grammar.py',219),
-  ('print_statement -> PRINTSTRING LPAREN expression RPAREN SEMICOLON','print_statement',5,'p_print_statement','grammar.py',220),
-  ('print_statement -> PRINTF LPAREN STRING COMMA expression_list RPAREN SEMICOLON','print_statement',7,'p_print_statement','grammar.py',221),
-  ('return_statement -> RETURN expression SEMICOLON','return_statement',3,'p_return_statement','grammar.py',232),
-  ('return_statement -> RETURN SEMICOLON','return_statement',2,'p_return_statement','grammar.py',233),
-  ('if_statement -> IF LPAREN expression RPAREN statement_block ELSE statement_block','if_statement',7,'p_if_statement','grammar.py',240),
-  ('if_statement -> IF LPAREN expression RPAREN statement_block','if_statement',5,'p_if_statement','grammar.py',241),
-  ('if_statement -> IF expression statement_block ELSE statement_block','if_statement',5,'p_if_statement','grammar.py',242),
-  ('if_statement -> IF expression statement_block','if_statement',3,'p_if_statement','grammar.py',243),
-  ('while_statement -> WHILE LPAREN expression RPAREN statement_block','while_statement',5,'p_while_statement','grammar.py',257),
-  ('while_statement -> WHILE expression statement_block','while_statement',3,'p_while_statement','grammar.py',258),
-  ('do_while_statement -> DO statement_block WHILE LPAREN expression RPAREN SEMICOLON','do_while_statement',7,'p_do_while_statement','grammar.py',265),
-  ('do_while_statement -> DO statement_block WHILE expression SEMICOLON','do_while_statement',5,'p_do_while_statement','grammar.py',266),
-  ('assignment_statement -> IDENTIFIER ASSIGN expression SEMICOLON','assignment_statement',4,'p_assignment_statement','grammar.py',273),
-  ('assignment_statement -> IDENTIFIER INCREMENT expression SEMICOLON','assignment_statement',4,'p_assignment_statement','grammar.py',274),
-  ('assignment_statement -> IDENTIFIER DECREMENT expression SEMICOLON','assignment_statement',4,'p_assignment_statement','grammar.py',275),
-  ('increment_statement -> IDENTIFIER PLUSPLUS SEMICOLON','increment_statement',3,'p_increment_statement','grammar.py',284),
-  ('increment_statement -> PLUSPLUS IDENTIFIER SEMICOLON','increment_statement',3,'p_increment_statement','grammar.py',285),
-  ('decrement_statement -> IDENTIFIER MINUSMINUS SEMICOLON','decrement_statement',3,'p_decrement_statement','grammar.py',292),
-  ('decrement_statement -> MINUSMINUS IDENTIFIER SEMICOLON','decrement_statement',3,'p_decrement_statement','grammar.py',293),
-  ('array_assignment_statement -> array_access ASSIGN expression SEMICOLON','array_assignment_statement',4,'p_array_assignment_statement','grammar.py',300),
-  ('expression_statement -> expression SEMICOLON','expression_statement',2,'p_expression_statement','grammar.py',304),
-  ('function_call -> IDENTIFIER LPAREN expression_list RPAREN','function_call',4,'p_function_call','grammar.py',308),
-  ('array_access -> IDENTIFIER array_access_list','array_access',2,'p_array_access','grammar.py',312),
-  ('array_access_list -> array_access_list LBRACKET expression RBRACKET','array_access_list',4,'p_array_access_list','grammar.py',316),
-  ('array_access_list -> LBRACKET expression RBRACKET','array_access_list',3,'p_array_access_list','grammar.py',317),
-  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list','grammar.py',325),
-  ('expression_list -> expression','expression_list',1,'p_expression_list','grammar.py',326),
-  ('expression -> expression PLUS expression','expression',3,'p_expression','grammar.py',333),
-  ('expression -> expression MINUS expression','expression',3,'p_expression','grammar.py',334),
-  ('expression -> expression TIMES expression','expression',3,'p_expression','grammar.py',335),
-  ('expression -> expression DIVIDE expression','expression',3,'p_expression','grammar.py',336),
-  ('expression -> expression MOD expression','expression',3,'p_expression','grammar.py',337),
-  ('expression -> expression GT expression','expression',3,'p_expression','grammar.py',338),
-  ('expression -> expression LT expression','expression',3,'p_expression','grammar.py',339),
-  ('expression -> expression GE expression','expression',3,'p_expression','grammar.py',340),
-  ('expression -> expression LE expression','expression',3,'p_expression','grammar.py',341),
-  ('expression -> expression EQUALS expression','expression',3,'p_expression','grammar.py',342),
-  ('expression -> expression NE expression','expression',3,'p_expression','grammar.py',343),
-  ('expression -> expression AND expression','expression',3,'p_expression','grammar.py',344),
-  ('expression -> expression OR expression','expression',3,'p_expression','grammar.py',345),
-  ('expression -> expression BITWISE_AND expression','expression',3,'p_expression','grammar.py',346),
-  ('expression -> expression BITWISE_OR expression','expression',3,'p_expression','grammar.py',347),
-  ('expression -> expression SQUARE expression','expression',3,'p_expression','grammar.py',348),
-  ('expression -> expression BITWISE_NOT expression','expression',3,'p_expression','grammar.py',349),
-  ('expression -> expression BITWISE_LSHIFT expression','expression',3,'p_expression','grammar.py',350),
-  ('expression -> expression BITWISE_RSHIFT expression','expression',3,'p_expression','grammar.py',351),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression','grammar.py',352),
-  ('expression -> NOT expression','expression',2,'p_expression','grammar.py',353),
-  ('expression -> MINUS NUMBER','expression',2,'p_expression','grammar.py',354),
-  ('expression -> MINUS FLOAT','expression',2,'p_expression','grammar.py',355),
-  ('expression -> IDENTIFIER','expression',1,'p_expression','grammar.py',356),
-  ('expression -> array_access','expression',1,'p_expression','grammar.py',357),
-  ('expression -> BREAK','expression',1,'p_expression','grammar.py',358),
-  ('expression -> CONTINUE','expression',1,'p_expression','grammar.py',359),
-  ('expression -> NUMBER','expression',1,'p_expression','grammar.py',360),
-  ('expression -> FLOAT','expression',1,'p_expression','grammar.py',361),
-  ('expression -> STRING','expression',1,'p_expression','grammar.py',362),
-  ('expression -> TRUE','expression',1,'p_expression','grammar.py',363),
-  ('expression -> FALSE','expression',1,'p_expression','grammar.py',364),
-  ('expression -> function_call','expression',1,'p_expression','grammar.py',365),
-  ('empty -> <empty>','empty',0,'p_empty','grammar.py',398),
+  ('program -> import_list global_declaration_list declaration_list','program',3,'p_program','grammar.py',33),
+  ('program -> import_list declaration_list','program',2,'p_program','grammar.py',34),
+  ('program -> global_declaration_list declaration_list','program',2,'p_program','grammar.py',35),
+  ('program -> declaration_list','program',1,'p_program','grammar.py',36),
+  ('import_list -> import_list import_statement','import_list',2,'p_import_list','grammar.py',56),
+  ('import_list -> import_statement','import_list',1,'p_import_list','grammar.py',57),
+  ('import_statement -> IMPORT IDENTIFIER SEMICOLON','import_statement',3,'p_import_statement','grammar.py',65),
+  ('global_declaration_list -> global_declaration_list global_declaration','global_declaration_list',2,'p_global_declaration_list','grammar.py',69),
+  ('global_declaration_list -> empty','global_declaration_list',1,'p_global_declaration_list','grammar.py',70),
+  ('global_declaration -> variable_declaration','global_declaration',1,'p_global_declaration','grammar.py',78),
+  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','grammar.py',82),
+  ('declaration_list -> empty','declaration_list',1,'p_declaration_list','grammar.py',83),
+  ('declaration -> function_declaration','declaration',1,'p_declaration','grammar.py',91),
+  ('declaration -> statement','declaration',1,'p_declaration','grammar.py',92),
+  ('variable_declaration -> VAL IDENTIFIER COLON TYPE ASSIGN expression SEMICOLON','variable_declaration',7,'p_variable_declaration','grammar.py',97),
+  ('variable_declaration -> VAR IDENTIFIER COLON TYPE ASSIGN expression SEMICOLON','variable_declaration',7,'p_variable_declaration','grammar.py',98),
+  ('variable_declaration -> VAR IDENTIFIER COLON TYPE SEMICOLON','variable_declaration',5,'p_variable_declaration','grammar.py',99),
+  ('variable_declaration -> VAR IDENTIFIER COLON array_type ASSIGN array_initializer SEMICOLON','variable_declaration',7,'p_variable_declaration','grammar.py',100),
+  ('variable_declaration -> VAL IDENTIFIER COLON array_type ASSIGN array_initializer SEMICOLON','variable_declaration',7,'p_variable_declaration','grammar.py',101),
+  ('variable_declaration -> VAR IDENTIFIER COLON array_allocation_type SEMICOLON','variable_declaration',5,'p_variable_declaration','grammar.py',102),
+  ('variable_declaration -> VAL IDENTIFIER COLON array_allocation_type SEMICOLON','variable_declaration',5,'p_variable_declaration','grammar.py',103),
+  ('variable_declaration -> VAL IDENTIFIER COLON array_type ASSIGN mapped_file SEMICOLON','variable_declaration',7,'p_variable_declaration','grammar.py',104),
+  ('array_type -> LBRACKET TYPE RBRACKET','array_type',3,'p_array_type','grammar.py',118),
+  ('array_type -> LBRACKET array_type RBRACKET','array_type',3,'p_array_type','grammar.py',119),
+  ('array_type -> LBRACKET RBRACKET array_type','array_type',3,'p_array_type','grammar.py',120),
+  ('array_type -> LBRACKET RBRACKET TYPE','array_type',3,'p_array_type','grammar.py',121),
+  ('mapped_file -> MMAPINTS LPAREN expression RPAREN','mapped_file',4,'p_mapped_file','grammar.py',132),
+  ('mapped_file -> MMAPDOUBLES LPAREN expression RPAREN','mapped_file',4,'p_mapped_file','grammar.py',133),
+  ('array_allocation_type -> LBRACKET NUMBER RBRACKET array_allocation_type','array_allocation_type',4,'p_array_allocation_type','grammar.py',137),
+  ('array_allocation_type -> LBRACKET NUMBER RBRACKET TYPE','array_allocation_type',4,'p_array_allocation_type','grammar.py',138),
+  ('array_initializer -> LBRACKET expression_list RBRACKET','array_initializer',3,'p_array_initializer','grammar.py',145),
+  ('array_initializer -> LBRACKET array_initializer_list RBRACKET','array_initializer',3,'p_array_initializer','grammar.py',146),
+  ('array_initializer_list -> array_initializer_list COMMA array_initializer','array_initializer_list',3,'p_array_initializer_list','grammar.py',150),
+  ('array_initializer_list -> array_initializer','array_initializer_list',1,'p_array_initializer_list','grammar.py',151),
+  ('function_declaration -> FUNCTION IDENTIFIER LPAREN parameter_list RPAREN COLON TYPE SEMICOLON','function_declaration',8,'p_function_declaration','grammar.py',159),
+  ('function_declaration -> annotation_list function_statement','function_declaration',2,'p_function_declaration','grammar.py',160),
+  ('function_declaration -> function_statement','function_declaration',1,'p_function_declaration','grammar.py',161),
+  ('annotation_list -> annotation_list ANNOTATION','annotation_list',2,'p_annotation_list','grammar.py',174),
+  ('annotation_list -> ANNOTATION','annotation_list',1,'p_annotation_list','grammar.py',175),
+  ('function_statement -> FUNCTION IDENTIFIER LPAREN parameter_list RPAREN COLON TYPE statement_block','function_statement',8,'p_function_statement','grammar.py',199),
+  ('function_statement -> FUNCTION IDENTIFIER LPAREN parameter_list RPAREN statement_block','function_statement',6,'p_function_statement','grammar.py',200),
+  ('function_statement -> FUNCTION MAIN LPAREN parameter_list RPAREN COLON TYPE statement_block','function_statement',8,'p_function_statement','grammar.py',201),
+  ('function_statement -> FUNCTION MAIN LPAREN VAL ARGSTRING RPAREN COLON TYPE statement_block','function_statement',9,'p_function_statement','grammar.py',202),
+  ('function_statement -> FUNCTION MAIN LPAREN VAR ARGSTRING RPAREN COLON TYPE statement_block','function_statement',9,'p_function_statement','grammar.py',203),
+  ('function_statement -> FUNCTION MAIN LPAREN parameter_list RPAREN statement_block','function_statement',6,'p_function_statement','grammar.py',204),
+  ('function_statement -> FUNCTION MAIN LPAREN VAR ARGSTRING RPAREN statement_block','function_statement',7,'p_function_statement','grammar.py',205),
+  ('function_statement -> FUNCTION MAIN LPAREN VAL ARGSTRING RPAREN statement_block','function_statement',7,'p_function_statement','grammar.py',206),
+  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list','grammar.py',226),
+  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','grammar.py',227),
+  ('parameter_list -> empty','parameter_list',1,'p_parameter_list','grammar.py',228),
+  ('parameter -> IDENTIFIER COLON TYPE','parameter',3,'p_parameter','grammar.py',238),
+  ('parameter -> VAL IDENTIFIER COLON TYPE','parameter',4,'p_parameter','grammar.py',239),
+  ('parameter -> VAR IDENTIFIER COLON TYPE','parameter',4,'p_parameter','grammar.py',240),
+  ('parameter -> IDENTIFIER COLON array_type','parameter',3,'p_parameter','grammar.py',241),
+  ('parameter -> VAL IDENTIFIER COLON array_type','parameter',4,'p_parameter','grammar.py',242),
+  ('parameter -> VAR IDENTIFIER COLON array_type','parameter',4,'p_parameter','grammar.py',243),
+  ('statement_block -> LBRACE statement_list RBRACE','statement_block',3,'p_statement_block','grammar.py',251),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','grammar.py',255),
+  ('statement_list -> empty','statement_list',1,'p_statement_list','grammar.py',256),
+  ('statement -> variable_declaration','statement',1,'p_statement','grammar.py',265),
+  ('statement -> if_statement','statement',1,'p_statement','grammar.py',266),
+  ('statement -> while_statement','statement',1,'p_statement','grammar.py',267),
+  ('statement -> do_while_statement','statement',1,'p_statement','grammar.py',268),
+  ('statement -> assignment_statement','statement',1,'p_statement','grammar.py',269),
+  ('statement -> array_assignment_statement','statement',1,'p_statement','grammar.py',270),
+  ('statement -> increment_statement','statement',1,'p_statement','grammar.py',271),
+  ('statement -> decrement_statement','statement',1,'p_statement','grammar.py',272),
+  ('statement -> expression_statement','statement',1,'p_statement','grammar.py',273),
+  ('statement -> return_statement','statement',1,'p_statement','grammar.py',274),
+  ('statement -> print_statement','statement',1,'p_statement','grammar.py',275),
+  ('print_statement -> PRINTINT LPAREN expression RPAREN SEMICOLON','print_statement',5,'p_print_statement','grammar.py',279),
+  ('print_statement -> PRINTDOUBLE LPAREN expression RPAREN SEMICOLON','print_statement',5,'p_print_statement','grammar.py',280),
+  ('print_statement -> PRINTSTRING LPAREN expression RPAREN SEMICOLON','print_statement',5,'p_print_statement','grammar.py',281),
+  ('print_statement -> PRINTF LPAREN STRING COMMA expression_list RPAREN SEMICOLON','print_statement',7,'p_print_statement','grammar.py',282),
+  ('return_statement -> RETURN expression SEMICOLON','return_statement',3,'p_return_statement','grammar.py',294),
+  ('return_statement -> RETURN SEMICOLON','return_statement',2,'p_return_statement','grammar.py',295),
+  ('if_statement -> IF LPAREN expression RPAREN statement_block ELSE statement_block','if_statement',7,'p_if_statement','grammar.py',303),
+  ('if_statement -> IF LPAREN expression RPAREN statement_block','if_statement',5,'p_if_statement','grammar.py',304),
+  ('if_statement -> IF expression statement_block ELSE statement_block','if_statement',5,'p_if_statement','grammar.py',305),
+  ('if_statement -> IF expression statement_block','if_statement',3,'p_if_statement','grammar.py',306),
+  ('while_statement -> WHILE LPAREN expression RPAREN statement_block','while_statement',5,'p_while_statement','grammar.py',320),
+  ('while_statement -> WHILE expression statement_block','while_statement',3,'p_while_statement','grammar.py',321),
+  ('do_while_statement -> DO statement_block WHILE LPAREN expression RPAREN SEMICOLON','do_while_statement',7,'p_do_while_statement','grammar.py',328),
+  ('do_while_statement -> DO statement_block WHILE expression SEMICOLON','do_while_statement',5,'p_do_while_statement','grammar.py',329),
+  ('assignment_statement -> IDENTIFIER ASSIGN expression SEMICOLON','assignment_statement',4,'p_assignment_statement','grammar.py',336),
+  ('assignment_statement -> IDENTIFIER INCREMENT expression SEMICOLON','assignment_statement',4,'p_assignment_statement','grammar.py',337),
+  ('assignment_statement -> IDENTIFIER DECREMENT expression SEMICOLON','assignment_statement',4,'p_assignment_statement','grammar.py',338),
+  ('increment_statement -> IDENTIFIER PLUSPLUS SEMICOLON','increment_statement',3,'p_increment_statement','grammar.py',348),
+  ('increment_statement -> PLUSPLUS IDENTIFIER SEMICOLON','increment_statement',3,'p_increment_statement','grammar.py',349),
+  ('decrement_statement -> IDENTIFIER MINUSMINUS SEMICOLON','decrement_statement',3,'p_decrement_statement','grammar.py',353),
+  ('decrement_statement -> MINUSMINUS IDENTIFIER SEMICOLON','decrement_statement',3,'p_decrement_statement','grammar.py',354),
+  ('array_assignment_statement -> array_access ASSIGN expression SEMICOLON','array_assignment_statement',4,'p_array_assignment_statement','grammar.py',365),
+  ('expression_statement -> expression SEMICOLON','expression_statement',2,'p_expression_statement','grammar.py',369),
+  ('function_call -> IDENTIFIER LPAREN expression_list RPAREN','function_call',4,'p_function_call','grammar.py',373),
+  ('read_expression -> READINT LPAREN RPAREN','read_expression',3,'p_read_expression','grammar.py',377),
+  ('read_expression -> READDOUBLE LPAREN RPAREN','read_expression',3,'p_read_expression','grammar.py',378),
+  ('read_expression -> READINTSINTO LPAREN IDENTIFIER COMMA expression RPAREN','read_expression',6,'p_read_expression','grammar.py',379),
+  ('read_expression -> READDOUBLESINTO LPAREN IDENTIFIER COMMA expression RPAREN','read_expression',6,'p_read_expression','grammar.py',380),
+  ('array_length -> ARRAYLENGTH LPAREN IDENTIFIER RPAREN','array_length',4,'p_array_length','grammar.py',392),
+  ('array_access -> IDENTIFIER array_access_list','array_access',2,'p_array_access','grammar.py',396),
+  ('array_access_list -> array_access_list LBRACKET expression RBRACKET','array_access_list',4,'p_array_access_list','grammar.py',400),
+  ('array_access_list -> LBRACKET expression RBRACKET','array_access_list',3,'p_array_access_list','grammar.py',401),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list','grammar.py',410),
+  ('expression_list -> expression','expression_list',1,'p_expression_list','grammar.py',411),
+  ('expression -> expression PLUS expression','expression',3,'p_expression','grammar.py',419),
+  ('expression -> expression MINUS expression','expression',3,'p_expression','grammar.py',420),
+  ('expression -> expression TIMES expression','expression',3,'p_expression','grammar.py',421),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression','grammar.py',422),
+  ('expression -> expression MOD expression','expression',3,'p_expression','grammar.py',423),
+  ('expression -> expression GT expression','expression',3,'p_expression','grammar.py',424),
+  ('expression -> expression LT expression','expression',3,'p_expression','grammar.py',425),
+  ('expression -> expression GE expression','expression',3,'p_expression','grammar.py',426),
+  ('expression -> expression LE expression','expression',3,'p_expression','grammar.py',427),
+  ('expression -> expression EQUALS expression','expression',3,'p_expression','grammar.py',428),
+  ('expression -> expression NE expression','expression',3,'p_expression','grammar.py',429),
+  ('expression -> expression AND expression','expression',3,'p_expression','grammar.py',430),
+  ('expression -> expression OR expression','expression',3,'p_expression','grammar.py',431),
+  ('expression -> expression BITWISE_AND expression','expression',3,'p_expression','grammar.py',432),
+  ('expression -> expression BITWISE_OR expression','expression',3,'p_expression','grammar.py',433),
+  ('expression -> expression SQUARE expression','expression',3,'p_expression','grammar.py',434),
+  ('expression -> expression BITWISE_NOT expression','expression',3,'p_expression','grammar.py',435),
+  ('expression -> expression BITWISE_LSHIFT expression','expression',3,'p_expression','grammar.py',436),
+  ('expression -> expression BITWISE_RSHIFT expression','expression',3,'p_expression','grammar.py',437),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression','grammar.py',438),
+  ('expression -> NOT expression','expression',2,'p_expression','grammar.py',439),
+  ('expression -> MINUS NUMBER','expression',2,'p_expression','grammar.py',440),
+  ('expression -> MINUS FLOAT','expression',2,'p_expression','grammar.py',441),
+  ('expression -> IDENTIFIER','expression',1,'p_expression','grammar.py',442),
+  ('expression -> array_access','expression',1,'p_expression','grammar.py',443),
+  ('expression -> BREAK','expression',1,'p_expression','grammar.py',444),
+  ('expression -> CONTINUE','expression',1,'p_expression','grammar.py',445),
+  ('expression -> NUMBER','expression',1,'p_expression','grammar.py',446),
+  ('expression -> FLOAT','expression',1,'p_expression','grammar.py',447),
+  ('expression -> STRING','expression',1,'p_expression','grammar.py',448),
+  ('expression -> TRUE','expression',1,'p_expression','grammar.py',449),
+  ('expression -> FALSE','expression',1,'p_expression','grammar.py',450),
+  ('expression -> function_call','expression',1,'p_expression','grammar.py',451),
+  ('expression -> read_expression','expression',1,'p_expression','grammar.py',452),
+  ('expression -> array_length','expression',1,'p_expression','grammar.py',453),
+  ('empty -> <empty>','empty',0,'p_empty','grammar.py',486),
 ]
@@ -0,0 +1,64 @@
+"""
+Annotates PLush sources with the block counts of a --count-blocks run.
+
+Each line is shown with the count of the innermost block that covers it,
+so the body of a hot loop stands out from the code around it. The
+hottest blocks are listed first.
+
+Usage: python heat_report.py [plush_blocks.json] [--top N]
+"""
+import sys
+import json
+import argparse
+
+def line_counts(blocks, line_total):
+    """Count for each line of one file, taken from the narrowest block covering it."""
+    counts = [None] * (line_total + 1)
+    widths = [None] * (line_total + 1)
+    for block in blocks:
+        first, last = block["first_line"], block["last_line"]
+        if first <= 0:
+            continue
+        width = last - first
+        for line in range(first, min(last, line_total) + 1):
+            if widths[line] is None or width < widths[line]:
+                counts[line] = block["count"]
+                widths[line] = width
+            elif width == widths[line]:
+                # Blocks sharing lines, like a loop condition on the loop's
+                # first line, show the busier one
+                counts[line] = max(counts[line], block["count"])
+    return counts
+
+def print_report(data, top, out=sys.stdout):
+    blocks = data["blocks"]
+    ranked = sorted(blocks, key=lambda block: block["count"], reverse=True)
+    print(f"Hottest blocks (of {len(blocks)}):", file=out)
+    for block in ranked[:top]:
+        lines = f"{block['first_line']}-{block['last_line']}"
+        print(f"  {block['count']:>14}  {block['file']}:{lines:<9} {block['function']} {block['kind']}", file=out)
+
+    by_file = {}
+    for block in blocks:
+        by_file.setdefault(block["file"], []).append(block)
+    for source_file, file_blocks in by_file.items():
+        try:
+            with open(source_file) as f:
+                source_lines = f.read().splitlines()
+        except OSError as e:
+            print(f"\nCannot read {source_file}: {e}", file=out)
+            continue
+        counts = line_counts(file_blocks, len(source_lines))
+        print(f"\n{source_file}", file=out)
+        for number, text in enumerate(source_lines, start=1):
+            count = "" if counts[number] is None else counts[number]
+            print(f"{count:>14} {number:>5} | {text}", file=out)
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Annotate PLush sources with block execution counts.")
+    arg_parser.add_argument("counts", nargs="?", default="plush_blocks.json",
+                            help="counts written by a --count-blocks program (default %(default)s)")
+    arg_parser.add_argument("--top", type=int, default=10, help="hottest blocks to list (default %(default)s)")
+    args = arg_parser.parse_args()
+    with open(args.counts) as f:
+        print_report(json.load(f), args.top)
@@ -1,24 +1,84 @@
+import io
 import json
-from dataclasses import asdict, is_dataclass, fields
-from typing import Any
+from dataclasses import is_dataclass, fields
+from typing import Any, TextIO
 from tree.ast_nodes import *
 
 def dataclass_to_dict(obj: Any) -> Any:
-    if is_dataclass(obj):
-        result = {}
-        result[obj.__class__.__name__] = {}
-        for field in fields(obj):
-            value = getattr(obj, field.name)
-            result[obj.__class__.__name__][field.name] = dataclass_to_dict(value)
-        return result
-    elif isinstance(obj, list):
-        return [dataclass_to_dict(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {key: dataclass_to_dict(value) for key, value in obj.items()}
-    else:
-        return obj
-
-
-def convert_ast_to_json(ast: ASTNode) -> str:
-    return json.dumps(dataclass_to_dict(ast), indent=2)
+    # Containers are created first with their keys in field order, then
+    # filled from an explicit stack so deep trees do not hit the recursion limit
+    root = [None]
+    pending = [(obj, root, 0)]
+    while pending:
+        obj, parent, key = pending.pop()
+        if is_dataclass(obj):
+            result = {}
+            parent[key] = {obj.__class__.__name__: result}
+            for field in fields(obj):
+                result[field.name] = None
+                pending.append((getattr(obj, field.name), result, field.name))
+        elif isinstance(obj, list):
+            result = [None] * len(obj)
+            parent[key] = result
+            for index, item in enumerate(obj):
+                pending.append((item, result, index))
+        elif isinstance(obj, dict):
+            result = dict.fromkeys(obj)
+            parent[key] = result
+            for item_key, value in obj.items():
+                pending.append((value, result, item_key))
+        else:
+            parent[key] = obj
+    return root[0]
 
+
+class _Text:
+    """Output already formatted, waiting on the work stack for its turn."""
+    def __init__(self, text):
+        self.text = text
+
+
+def write_ast_json(ast: ASTNode, out: TextIO, compact: bool = False) -> None:
+    """
+    Writes the JSON form of `ast` to `out` as the tree is walked, without
+    building the intermediate dicts. The indented form is byte for byte the
+    output of json.dumps(dataclass_to_dict(ast), indent=2).
+    """
+    item_separator, key_separator = (",", ":") if compact else (",", ": ")
+
+    def newline(level):
+        return "" if compact else "\n" + "  " * level
+
+    # Work items are values to encode or text to write, in LIFO order
+    pending = [(ast, 0)]
+    while pending:
+        obj, level = pending.pop()
+        if isinstance(obj, _Text):
+            out.write(obj.text)
+        elif is_dataclass(obj):
+            out.write("{" + newline(level + 1) + json.dumps(obj.__class__.__name__) + key_separator)
+            pending.append((_Text(newline(level) + "}"), level))
+            pending.append(({field.name: getattr(obj, field.name) for field in fields(obj)}, level + 1))
+        elif isinstance(obj, (list, tuple, dict)):
+            opener, closer = "{}" if isinstance(obj, dict) else "[]"
+            if not obj:
+                out.write(opener + closer)
+                continue
+            out.write(opener)
+            pending.append((_Text(newline(level) + closer), level))
+            items = list(obj.items()) if isinstance(obj, dict) else [(None, item) for item in obj]
+            for index in reversed(range(len(items))):
+                key, value = items[index]
+                pending.append((value, level + 1))
+                prefix = newline(level + 1) if index == 0 else item_separator + newline(level + 1)
+                if isinstance(obj, dict):
+                    prefix += json.dumps(str(key)) + key_separator
+                pending.append((_Text(prefix), level))
+        else:
+            out.write(json.dumps(obj))
+
+
+def convert_ast_to_json(ast: ASTNode, compact: bool = False) -> str:
+    out = io.StringIO()
+    write_ast_json(ast, out, compact)
+    return out.getvalue()
@@ -75,6 +75,17 @@ tokens = [
     "PRINTDOUBLE",
     "PRINTSTRING",
     "PRINTF",
+    # Input
+    "READINT",
+    "READDOUBLE",
+    "READINTSINTO",
+    "READDOUBLESINTO",
+    # Mapped files
+    "MMAPINTS",
+    "MMAPDOUBLES",
+    "ARRAYLENGTH",
+    # Function annotations
+    "ANNOTATION",
 ]
 
 t_PLUS = r"\+"
@@ -127,6 +138,12 @@ def t_ARGSTRING(t):
     t.type = "ARGSTRING"
     return t
 
+# Function annotations such as @memo, the value is the name without '@'
+def t_ANNOTATION(t):
+    r"@[a-zA-Z_][a-zA-Z_0-9]*"
+    t.value = t.value[1:]
+    return t
+
 # Keywords
 reserved = {
     "val": "VAL",
@@ -153,6 +170,13 @@ reserved = {
     "print_double": "PRINTDOUBLE",
     "print_string": "PRINTSTRING",
     "printf": "PRINTF",
+    "read_int": "READINT",
+    "read_double": "READDOUBLE",
+    "read_ints_into": "READINTSINTO",
+    "read_doubles_into": "READDOUBLESINTO",
+    "mmap_ints": "MMAPINTS",
+    "mmap_doubles": "MMAPDOUBLES",
+    "array_length": "ARRAYLENGTH",
 }
 
 
@@ -1,25 +1,43 @@
+from dataclasses import fields, is_dataclass
 from tree import ast_nodes
 
+class _Text:
+    """A line already formatted, waiting on the work stack for its turn."""
+    def __init__(self, text, end="\n"):
+        self.text = text
+        self.end = end
+
 def pretty_print(node, indent=0):
     """
     Pretty prints the parsed AST node with proper indentation.
     """
-    if isinstance(node, ast_nodes.Program):
-        print("Program(")
-        print("  " * (indent + 1) + "global_variables =", end=" ")
-        pretty_print(node.global_variables, indent + 1)
-        print("  " * (indent + 1) + "Program declarations = [")
-        pretty_print(node.declarations, indent + 1)
-        print(")")
-    elif isinstance(node, list):
-        for item in node:
-            pretty_print(item, indent)
-    elif hasattr(node, "__dict__"):
-        node_name = type(node).__name__
-        print("  " * indent + node_name + "(")
-        for key, value in node.__dict__.items():
-            print("  " * (indent + 1) + f"{key} =", end=" ")
-            pretty_print(value, indent + 1)
-        print("  " * indent + ")")
-    else:
-        print("  " * indent + repr(node))
\ No newline at end of file
+    # Work items are printed in LIFO order, so children are pushed in reverse
+    pending = [(node, indent)]
+    while pending:
+        node, indent = pending.pop()
+        if isinstance(node, _Text):
+            print(node.text, end=node.end)
+        elif isinstance(node, ast_nodes.Program):
+            print("Program(")
+            print("  " * (indent + 1) + "global_variables =", end=" ")
+            pending.append((_Text(")"), indent))
+            pending.append((node.declarations, indent + 1))
+            pending.append((_Text("  " * (indent + 1) + "Program declarations = ["), indent))
+            pending.append((node.global_variables, indent + 1))
+        elif isinstance(node, list):
+            for item in reversed(node):
+                pending.append((item, indent))
+        elif hasattr(node, "__dict__"):
+            node_name = type(node).__name__
+            print("  " * indent + node_name + "(")
+            pending.append((_Text("  " * indent + ")"), indent))
+            # Source lines are plain attributes rather than fields, leave them out
+            if is_dataclass(node):
+                items = [(field.name, getattr(node, field.name)) for field in fields(node)]
+            else:
+                items = list(node.__dict__.items())
+            for key, value in reversed(items):
+                pending.append((value, indent + 1))
+                pending.append((_Text("  " * (indent + 1) + f"{key} =", end=" "), indent))
+        else:
+            print("  " * indent + repr(node))
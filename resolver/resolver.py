@@ -0,0 +1,247 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dataclasses import dataclass
+from typing import Any, Optional
+from tree.ast_nodes import *
+from tree.traversal import trampoline
+
+@dataclass(eq=False)
+class Symbol:
+    name: str
+    data_type: Any  # PLush type name, or the type list of an array
+    storage: str  # 'global', 'local', 'param' or 'function'
+    slot: int = 0  # Declaration index inside the owning frame
+    var_kind: str = 'var'  # 'val' or 'var'
+    immutable: bool = False
+    mutated: bool = False
+    declaration: Optional[Any] = None
+
+class Resolver:
+    """
+    Binds every name use in the AST to a Symbol, once, so the checker and the
+    code generator can look the record up by node instead of searching scopes.
+    """
+    def __init__(self):
+        self.scopes = [{}]  # Innermost scope last, global scope first
+        self.visible = {}  # Name to the stack of symbols it names, innermost last
+        self.functions = {}  # Function name to function symbol
+        self.bindings = {}  # id(node) to the Symbol the node refers to
+        self.declarations = {}  # id(declaration node) to the Symbol it declares
+        self.parameters = {}  # id(function node) to its parameter symbols
+        self.errors = []
+        self.slot_count = 0
+
+    def resolve_program(self, program):
+        # Functions may be called before they are defined
+        for declaration in program.declarations:
+            if isinstance(declaration, (FunctionStatement, FunctionDeclaration)):
+                self.declare_function(declaration.name, declaration.return_type, declaration)
+            elif isinstance(declaration, MainFunctionStatement):
+                self.declare_function("main", declaration.return_type, declaration)
+
+        # The walk runs on an explicit stack, deep nesting cannot overflow it
+        if program.global_variables:
+            for var_decl in program.global_variables.declarations:
+                trampoline(self.resolve_statement(var_decl))
+        for declaration in program.declarations:
+            trampoline(self.resolve_declaration(declaration))
+        return self
+
+    def symbol_for(self, node):
+        return self.bindings.get(id(node))
+
+    def declare_function(self, name, return_type, node):
+        if name not in self.functions:
+            self.functions[name] = Symbol(name, return_type, 'function', declaration=node)
+
+    def declare(self, node, name, data_type, var_kind='var'):
+        scope = self.scopes[-1]
+        if name in scope:
+            if len(self.scopes) == 1:
+                self.errors.append(f"Variable '{name}' already declared in global scope")
+            else:
+                self.errors.append(f"Variable '{name}' already declared in current scope")
+            return None
+        if len(self.scopes) > 1 and name in self.scopes[0]:
+            self.errors.append(f"Variable '{name}' already declared in global scope")
+
+        storage = 'global' if len(self.scopes) == 1 else 'local'
+        symbol = Symbol(name, data_type, storage, self.slot_count, var_kind, declaration=node)
+        symbol.immutable = var_kind == 'val' and isinstance(node, VariableDeclaration) and node.value is not None
+        self.slot_count += 1
+        self.add_to_scope(name, symbol)
+        self.declarations[id(node)] = symbol
+        return symbol
+
+    def push_scope(self):
+        self.scopes.append({})
+
+    def pop_scope(self):
+        for name in self.scopes.pop():
+            shadowed = self.visible[name]
+            shadowed.pop()
+            if not shadowed:
+                del self.visible[name]
+
+    def add_to_scope(self, name, symbol):
+        shadowed = self.visible.setdefault(name, [])
+        if name in self.scopes[-1]:
+            shadowed[-1] = symbol
+        else:
+            shadowed.append(symbol)
+        self.scopes[-1][name] = symbol
+
+    def lookup(self, name):
+        # Kept per name rather than searched scope by scope, so lookups stay
+        # constant time however deeply blocks are nested
+        shadowed = self.visible.get(name)
+        return shadowed[-1] if shadowed else None
+
+    def bind(self, node, name):
+        symbol = self.lookup(name)
+        if symbol is not None:
+            self.bindings[id(node)] = symbol
+        return symbol
+
+    def resolve_declaration(self, declaration):
+        if isinstance(declaration, (FunctionStatement, MainFunctionStatement)):
+            yield self.resolve_function(declaration)
+        elif isinstance(declaration, FunctionDeclaration):
+            pass
+        else:
+            yield self.resolve_statement(declaration)
+
+    def resolve_function(self, function_node):
+        global_slot_count = self.slot_count
+        self.slot_count = 0
+        self.push_scope()
+        params = []
+        if function_node.parameters and any(function_node.parameters):
+            for param_name, param_type in function_node.parameters:
+                symbol = Symbol(param_name, param_type, 'param', self.slot_count)
+                self.slot_count += 1
+                self.add_to_scope(param_name, symbol)
+                params.append(symbol)
+        self.parameters[id(function_node)] = params
+
+        yield self.resolve_block(function_node.body, new_scope=False)
+        self.pop_scope()
+        self.slot_count = global_slot_count
+
+    def resolve_block(self, statements, new_scope=True):
+        if statements is None:
+            return
+        if new_scope:
+            self.push_scope()
+        for statement in statements:
+            yield self.resolve_statement(statement)
+        if new_scope:
+            self.pop_scope()
+
+    def resolve_statement(self, statement):
+        if isinstance(statement, VariableDeclaration):
+            # The initializer cannot see the variable it initializes
+            if statement.value is not None:
+                yield self.resolve_expression(statement.value)
+            self.declare(statement, statement.name, statement.data_type, statement.var_kind)
+        elif isinstance(statement, ArrayDeclaration):
+            for value in statement.value:
+                yield self.resolve_expression(value)
+            self.declare(statement, statement.name, statement.data_type, statement.var_kind)
+        elif isinstance(statement, MappedArrayDeclaration):
+            yield self.resolve_expression(statement.path)
+            self.declare(statement, statement.name, statement.data_type, statement.var_kind)
+        elif isinstance(statement, ArrayAllocation):
+            self.declare(statement, statement.name, statement.data_type, statement.var_kind)
+        elif isinstance(statement, IfStatement):
+            yield self.resolve_expression(statement.condition)
+            yield self.resolve_block(statement.then_block)
+            yield self.resolve_block(statement.else_block)
+        elif isinstance(statement, WhileStatement):
+            self.push_scope()
+            yield self.resolve_expression(statement.condition)
+            yield self.resolve_block(statement.body, new_scope=False)
+            self.pop_scope()
+        elif isinstance(statement, DoWhileStatement):
+            # The condition sees the declarations of the body
+            self.push_scope()
+            yield self.resolve_block(statement.body, new_scope=False)
+            yield self.resolve_expression(statement.condition)
+            self.pop_scope()
+        elif isinstance(statement, AssignmentStatement):
+            yield self.resolve_expression(statement.value)
+            symbol = self.bind(statement, statement.target)
+            if symbol is not None:
+                symbol.mutated = True
+        elif isinstance(statement, ArrayAssignmentStatement):
+            for index in statement.index:
+                yield self.resolve_expression(index)
+            yield self.resolve_expression(statement.value)
+            symbol = self.bind(statement, statement.target)
+            if symbol is not None:
+                symbol.mutated = True
+        elif isinstance(statement, ReturnStatement):
+            if statement.value is not None:
+                yield self.resolve_expression(statement.value)
+        elif isinstance(statement, ExpressionStatement):
+            yield self.resolve_expression(statement.expression)
+        elif isinstance(statement, PrintStatement):
+            yield self.resolve_expression(statement.expression)
+        elif isinstance(statement, PrintfStatement):
+            for argument in statement.arguments:
+                yield self.resolve_expression(argument)
+
+    def resolve_expression(self, expression):
+        if isinstance(expression, BinaryExpression):
+            yield self.resolve_expression(expression.left)
+            yield self.resolve_expression(expression.right)
+        elif isinstance(expression, UnaryExpression):
+            yield self.resolve_expression(expression.operand)
+        elif isinstance(expression, VariableReference):
+            self.bind(expression, expression.name)
+        elif isinstance(expression, ArrayAccess):
+            for index in expression.index:
+                yield self.resolve_expression(index)
+            self.bind(expression, expression.name)
+        elif isinstance(expression, ArrayLength):
+            self.bind(expression, expression.name)
+        elif isinstance(expression, ReadIntoExpression):
+            yield self.resolve_expression(expression.count)
+            symbol = self.bind(expression, expression.target)
+            if symbol is not None:
+                symbol.mutated = True
+        elif isinstance(expression, FunctionCall):
+            for argument in expression.arguments:
+                yield self.resolve_expression(argument)
+                # Arrays are passed by reference, the callee may write to them
+                symbol = self.symbol_for(argument)
+                if isinstance(argument, VariableReference) and symbol is not None and isinstance(symbol.data_type, list):
+                    symbol.mutated = True
+            symbol = self.functions.get(expression.name)
+            if symbol is not None:
+                self.bindings[id(expression)] = symbol
+
+if __name__ == "__main__":
+    from grammar.grammar import parser
+
+    s = """
+    val limit : int := 10;
+    function count(val n : int) : int {
+        var i : int := 0;
+        while i < n {
+            i := i + 1;
+        }
+        count := i;
+    }
+    function main(val args:[string]) {
+        print_int(count(limit));
+    }
+    """
+    result = parser.parse(s)
+    resolver = Resolver().resolve_program(result)
+    for symbol in resolver.declarations.values():
+        print(symbol.name, symbol.storage, symbol.slot, symbol.data_type, symbol.mutated)
+    print("Errors:", resolver.errors)
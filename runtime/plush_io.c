@@ -0,0 +1,528 @@
+/*
+ * Input and output runtime of PLush programs.
+ *
+ * Programs compiled with --buffered-io print through it:
+ * print_int, print_double, print_string and printf append to one large
+ * buffer instead of going through stdio per call. The buffer is written
+ * out with write(2) when it fills, at exit, and whenever plush_flush is
+ * called. When stdout is a terminal it is flushed after every line
+ * instead, like stdio does, so interactive programs still show their
+ * output as it is printed.
+ *
+ * Integers are formatted by hand, and so are doubles below 2^53 in
+ * magnitude, rounded to six decimals exactly like printf's %f. Larger
+ * doubles, infinities and NaNs go through snprintf.
+ *
+ * read_int, read_double, read_ints_into and read_doubles_into always
+ * read through it. stdin is read with read(2) into a large buffer and
+ * numbers are parsed straight out of it. Anything that cannot start a
+ * number is skipped, a sign or decimal point included when no digit
+ * follows it, and at the end of the input read_int and read_double
+ * return 0. Doubles with at most 19 significant digits and a small
+ * exponent are converted exactly with one multiplication or division,
+ * the others go through strtod with their full text.
+ *
+ * mmap_ints and mmap_doubles map a file of raw native-endian values
+ * read-only with plush_map. Nothing is copied: the pages are read in by
+ * the kernel as the program touches them and can be dropped again under
+ * memory pressure, so files larger than RAM stream through the page
+ * cache. The generated code calls plush_unmap when the function that
+ * mapped the file returns.
+ *
+ * Arrays too large for the stack are allocated with calloc by the
+ * generated code, which calls plush_alloc_failed when that fails.
+ */
+#include <errno.h>
+#include <fcntl.h>
+#include <math.h>
+#include <stdarg.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#define PLUSH_OUT_SIZE (1 << 16)
+
+static char out[PLUSH_OUT_SIZE];
+static size_t out_used = 0;
+static int line_buffered = 0;
+
+static void write_all(const char *data, size_t size) {
+    while (size > 0) {
+        ssize_t written = write(STDOUT_FILENO, data, size);
+        if (written < 0) {
+            if (errno == EINTR)
+                continue;
+            return; /* Like printf, output errors are not reported */
+        }
+        data += written;
+        size -= (size_t)written;
+    }
+}
+
+void plush_flush(void) {
+    /* Anything the program printed through stdio goes first */
+    fflush(stdout);
+    write_all(out, out_used);
+    out_used = 0;
+}
+
+__attribute__((constructor)) static void plush_io_init(void) {
+    line_buffered = isatty(STDOUT_FILENO);
+    atexit(plush_flush);
+}
+
+static void append(const char *data, size_t size) {
+    if (size > PLUSH_OUT_SIZE - out_used) {
+        plush_flush();
+        if (size > PLUSH_OUT_SIZE) {
+            write_all(data, size);
+            return;
+        }
+    }
+    memcpy(out + out_used, data, size);
+    out_used += size;
+}
+
+static void end_line(void) {
+    if (out_used == PLUSH_OUT_SIZE)
+        plush_flush();
+    out[out_used++] = '\n';
+    if (line_buffered)
+        plush_flush();
+}
+
+static char *format_digits(char *end, uint64_t value, int min_digits) {
+    /* Written backwards, returns where the digits start */
+    do {
+        *--end = (char)('0' + value % 10);
+        value /= 10;
+        min_digits--;
+    } while (value != 0 || min_digits > 0);
+    return end;
+}
+
+void plush_print_int(int32_t value) {
+    char text[12];
+    char *end = text + sizeof text;
+    char *start = format_digits(end, value < 0 ? 0u - (uint32_t)value : (uint32_t)value, 1);
+    if (value < 0)
+        *--start = '-';
+    append(start, (size_t)(end - start));
+    end_line();
+}
+
+void plush_print_double(double value) {
+    char text[512]; /* %f of the largest double is 316 characters */
+    double magnitude = fabs(value);
+    if (!(magnitude < 9007199254740992.0)) {
+        int size = snprintf(text, sizeof text, "%f", value);
+        append(text, (size_t)size);
+        end_line();
+        return;
+    }
+    uint64_t whole = (uint64_t)magnitude;
+    double fraction = magnitude - (double)whole; /* Exact */
+    /* fraction * 10^6 is product + error exactly, the error decides
+       which way the product rounds when it looks like a tie */
+    double product = fraction * 1e6;
+    double error = fma(fraction, 1e6, -product);
+    double below = floor(product);
+    double above_half = (product - below - 0.5) + error;
+    uint64_t micros = (uint64_t)below;
+    if (above_half > 0 || (above_half == 0 && micros % 2 == 1))
+        micros++;
+    if (micros == 1000000) {
+        whole++;
+        micros = 0;
+    }
+    char *end = text + sizeof text;
+    char *start = format_digits(end, micros, 6);
+    *--start = '.';
+    start = format_digits(start, whole, 1);
+    if (signbit(value))
+        *--start = '-';
+    append(start, (size_t)(end - start));
+    end_line();
+}
+
+void plush_print_string(const char *text) {
+    append(text, strlen(text));
+    end_line();
+}
+
+void plush_printf(const char *format, ...) {
+    va_list args;
+    va_start(args, format);
+    size_t room = PLUSH_OUT_SIZE - out_used;
+    int size = vsnprintf(out + out_used, room, format, args);
+    va_end(args);
+    if (size < 0)
+        return;
+    if ((size_t)size >= room) {
+        /* Did not fit: flush what came before and format it again */
+        plush_flush();
+        va_start(args, format);
+        if ((size_t)size < PLUSH_OUT_SIZE) {
+            vsnprintf(out, PLUSH_OUT_SIZE, format, args);
+        } else {
+            char *text = malloc((size_t)size + 1);
+            if (text != NULL) {
+                vsnprintf(text, (size_t)size + 1, format, args);
+                write_all(text, (size_t)size);
+                free(text);
+            }
+            size = 0;
+        }
+        va_end(args);
+    }
+    out_used += (size_t)size;
+    if (line_buffered && memchr(out + out_used - size, '\n', (size_t)size) != NULL)
+        plush_flush();
+}
+
+#define PLUSH_IN_SIZE (1 << 16)
+
+/* Input is followed by a NUL, so scans stop at the end without a bounds check */
+static char in[PLUSH_IN_SIZE + 1];
+static size_t in_pos = 0;
+static size_t in_len = 0;
+
+/*
+ * Makes at least `count` characters available from in_pos, reading more
+ * input after the ones left when needed. Returns how many there are,
+ * fewer only at the end of the input.
+ */
+static size_t fill(size_t count) {
+    size_t available = in_len - in_pos;
+    if (available >= count)
+        return available;
+    /* A prompt printed without a newline shows before the program waits */
+    if (line_buffered)
+        plush_flush();
+    memmove(in, in + in_pos, available);
+    in_pos = 0;
+    in_len = available;
+    while (in_len < count) {
+        ssize_t read_count = read(STDIN_FILENO, in + in_len, PLUSH_IN_SIZE - in_len);
+        if (read_count < 0 && errno == EINTR)
+            continue;
+        if (read_count <= 0)
+            break;
+        in_len += (size_t)read_count;
+    }
+    in[in_len] = '\0';
+    return in_len;
+}
+
+/* The next input character without consuming it, -1 at the end of the input */
+static int peek(void) {
+    if (in_pos < in_len)
+        return (unsigned char)in[in_pos];
+    return fill(1) > 0 ? (unsigned char)in[in_pos] : -1;
+}
+
+static int is_digit(int c) {
+    return c >= '0' && c <= '9';
+}
+
+/* The character `offset` past in_pos, -1 past the end of the input */
+static int peek_at(size_t offset) {
+    return fill(offset + 1) > offset ? (unsigned char)in[in_pos + offset] : -1;
+}
+
+/*
+ * Whether the input at in_pos starts a number: a digit, or a sign or
+ * decimal point with a digit after it, so a lone '-' or '.' is skipped
+ * like any other text. allow_point admits '.5' and '-.5'.
+ */
+static int starts_number(int allow_point) {
+    size_t offset = 0;
+    int c = peek();
+    if (c == '-' || c == '+')
+        c = peek_at(++offset);
+    if (allow_point && c == '.')
+        c = peek_at(++offset);
+    return c != -1 && is_digit(c);
+}
+
+static int may_start_number(int c, int allow_point) {
+    return is_digit(c) || c == '-' || c == '+' || (allow_point && c == '.');
+}
+
+/* Skips to the next number, returns its first character, -1 at the end of the input */
+static int skip_to_number(int allow_point) {
+    for (;;) {
+        /* Stops at the NUL after the input, or at one in it */
+        while (in[in_pos] != '\0' && !may_start_number((unsigned char)in[in_pos], allow_point))
+            in_pos++;
+        /* Looks past a sign or point within the buffer first, it ends
+           at the NUL after the input */
+        const char *p = in + in_pos;
+        if (*p == '-' || *p == '+')
+            p++;
+        if (allow_point && *p == '.')
+            p++;
+        if (is_digit((unsigned char)*p))
+            return (unsigned char)in[in_pos];
+        if (p != in + in_len) {
+            in_pos++;
+            continue;
+        }
+        int c = peek();
+        if (c == -1 || is_digit(c) || (may_start_number(c, allow_point) && starts_number(allow_point)))
+            return c;
+        in_pos++;
+    }
+}
+
+/*
+ * The fast paths below parse a number that ends before the end of the
+ * buffer, without checking for a refill at every character. They return
+ * 0 and consume nothing when the number may go on in the next read.
+ */
+static int int_in_buffer(int32_t *result) {
+    const char *p = in + in_pos;
+    const char *end = in + in_len;
+    int negative = *p == '-';
+    if (*p == '-' || *p == '+')
+        p++;
+    uint32_t value = 0;
+    while (is_digit((unsigned char)*p))
+        value = value * 10 + (uint32_t)(*p++ - '0');
+    if (p == end)
+        return 0;
+    in_pos = (size_t)(p - in);
+    *result = (int32_t)(negative ? 0u - value : value);
+    return 1;
+}
+
+int32_t plush_read_int(void) {
+    int32_t result;
+    int c = skip_to_number(0);
+    if (c != -1 && int_in_buffer(&result))
+        return result;
+    int negative = c == '-';
+    if (c == '-' || c == '+') {
+        in_pos++;
+        c = peek();
+    }
+    /* Overflow wraps around, like the ints of PLush arithmetic */
+    uint32_t value = 0;
+    while (is_digit(c)) {
+        /* Digits within the buffer without a call per character */
+        while (in_pos < in_len && is_digit((unsigned char)in[in_pos]))
+            value = value * 10 + (uint32_t)(in[in_pos++] - '0');
+        c = peek();
+    }
+    return (int32_t)(negative ? 0u - value : value);
+}
+
+static const double powers_of_ten[] = {
+    1e0, 1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9, 1e10, 1e11,
+    1e12, 1e13, 1e14, 1e15, 1e16, 1e17, 1e18, 1e19, 1e20, 1e21, 1e22,
+};
+
+static int double_in_buffer(double *result) {
+    const char *p = in + in_pos;
+    const char *end = in + in_len;
+    uint64_t mantissa = 0;
+    int digits = 0;
+    int exponent = 0;
+    int negative = *p == '-';
+    if (*p == '-' || *p == '+')
+        p++;
+    for (int after_point = 0;; p++) {
+        if (is_digit((unsigned char)*p)) {
+            if (++digits > 19)
+                return 0;
+            mantissa = mantissa * 10 + (uint64_t)(*p - '0');
+            exponent -= after_point;
+        } else if (*p == '.' && !after_point) {
+            after_point = 1;
+        } else {
+            break;
+        }
+    }
+    /* Exponents, and numbers the buffer may cut off, take the general path */
+    if (p == end || *p == 'e' || *p == 'E' || mantissa > (1ull << 53) || exponent < -22)
+        return 0;
+    double value = (double)mantissa / powers_of_ten[-exponent];
+    in_pos = (size_t)(p - in);
+    *result = negative ? -value : value;
+    return 1;
+}
+
+/* Doubles the capacity of the text of a number, it starts out on the stack */
+static char *grow_text(char *text, const char *stack_text, size_t *capacity) {
+    char *larger = text == stack_text ? malloc(*capacity * 2) : realloc(text, *capacity * 2);
+    if (larger == NULL) {
+        plush_flush();
+        fprintf(stderr, "plush: out of memory reading a number\n");
+        exit(1);
+    }
+    if (text == stack_text)
+        memcpy(larger, text, *capacity);
+    *capacity *= 2;
+    return larger;
+}
+
+/* Whether the input at in_pos, an 'e' or 'E', starts the exponent of a number */
+static int exponent_follows(void) {
+    int c = peek_at(1);
+    if (c == '-' || c == '+')
+        c = peek_at(2);
+    return c != -1 && is_digit(c);
+}
+
+double plush_read_double(void) {
+    /* The text of the number is kept for strtod when the fast path cannot be exact */
+    char stack_text[128];
+    char *text = stack_text;
+    size_t capacity = sizeof stack_text;
+    size_t length = 0;
+    uint64_t mantissa = 0;
+    int digits = 0; /* Significant digits in the mantissa */
+    int exponent = 0;
+    int exact = 1;
+    double result;
+    int c = skip_to_number(1);
+    if (c == -1)
+        return 0.0;
+    if (double_in_buffer(&result))
+        return result;
+#define TAKE()                                                  \
+    do {                                                        \
+        if (length + 1 == capacity)                             \
+            text = grow_text(text, stack_text, &capacity);      \
+        text[length++] = (char)c;                               \
+        in_pos++;                                               \
+        c = peek();                                             \
+    } while (0)
+    int negative = c == '-';
+    if (c == '-' || c == '+')
+        TAKE();
+    for (int after_point = 0;; ) {
+        if (is_digit(c)) {
+            if (digits < 19) {
+                mantissa = mantissa * 10 + (uint64_t)(c - '0');
+                if (mantissa != 0)
+                    digits++;
+                exponent -= after_point;
+            } else {
+                exact = 0; /* Past the 19th digit, left to strtod */
+            }
+            TAKE();
+        } else if (c == '.' && !after_point) {
+            after_point = 1;
+            TAKE();
+        } else {
+            break;
+        }
+    }
+    if ((c == 'e' || c == 'E') && exponent_follows()) {
+        TAKE();
+        int exponent_negative = c == '-';
+        if (c == '-' || c == '+')
+            TAKE();
+        int written = 0;
+        while (is_digit(c)) {
+            if (written < 10000)
+                written = written * 10 + (c - '0');
+            TAKE();
+        }
+        exponent += exponent_negative ? -written : written;
+    }
+#undef TAKE
+    if (!exact || mantissa > (1ull << 53) || exponent > 22 || exponent < -22) {
+        text[length] = '\0';
+        double value = strtod(text, NULL);
+        if (text != stack_text)
+            free(text);
+        return value;
+    }
+    if (text != stack_text)
+        free(text);
+    /* Both the mantissa and the power of ten are exact doubles, so the
+       one rounding of the multiplication or division is the correct one */
+    double value = (double)mantissa;
+    value = exponent < 0 ? value / powers_of_ten[-exponent] : value * powers_of_ten[exponent];
+    return negative ? -value : value;
+}
+
+int32_t plush_read_ints(int32_t *values, int32_t count, int32_t capacity) {
+    if (count > capacity)
+        count = capacity;
+    int32_t read = 0;
+    while (read < count && skip_to_number(0) != -1) {
+        if (!int_in_buffer(&values[read]))
+            values[read] = plush_read_int();
+        read++;
+    }
+    return read;
+}
+
+int32_t plush_read_doubles(double *values, int32_t count, int32_t capacity) {
+    if (count > capacity)
+        count = capacity;
+    int32_t read = 0;
+    while (read < count && skip_to_number(1) != -1) {
+        if (!double_in_buffer(&values[read]))
+            values[read] = plush_read_double();
+        read++;
+    }
+    return read;
+}
+
+void plush_alloc_failed(int64_t count, int64_t element_size) {
+    plush_flush();
+    fprintf(stderr, "plush: cannot allocate an array of %lld elements of %lld bytes\n",
+            (long long)count, (long long)element_size);
+    exit(1);
+}
+
+/* What empty files map to, any non-null pointer would do */
+static double empty_map[1];
+
+static void map_failed(const char *path, const char *reason) {
+    plush_flush();
+    fprintf(stderr, "plush: cannot map '%s': %s\n", path, reason);
+    exit(1);
+}
+
+void *plush_map(const char *path, int64_t element_size, int32_t *length) {
+    int fd = open(path, O_RDONLY);
+    if (fd < 0)
+        map_failed(path, strerror(errno));
+    struct stat info;
+    if (fstat(fd, &info) < 0)
+        map_failed(path, strerror(errno));
+    /* A trailing partial element is left out */
+    uint64_t count = (uint64_t)info.st_size / (uint64_t)element_size;
+    if (count > INT32_MAX)
+        map_failed(path, "more elements than an array length can hold");
+    *length = (int32_t)count;
+    if (count == 0) {
+        close(fd);
+        return empty_map;
+    }
+    size_t size = (size_t)count * (size_t)element_size;
+    void *data = mmap(NULL, size, PROT_READ, MAP_PRIVATE, fd, 0);
+    int map_errno = errno;
+    close(fd); /* The mapping keeps the file open */
+    if (data == MAP_FAILED)
+        map_failed(path, strerror(map_errno));
+    /* Loops over the array read it front to back: read ahead further,
+       and let pages already read go first */
+    madvise(data, size, MADV_SEQUENTIAL);
+    return data;
+}
+
+void plush_unmap(void *data, int32_t length, int64_t element_size) {
+    if (data == NULL || data == (void *)empty_map)
+        return;
+    munmap(data, (size_t)length * (size_t)element_size);
+}
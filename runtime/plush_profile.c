@@ -0,0 +1,190 @@
+/*
+ * Runtime for programs compiled with --instrument.
+ *
+ * Every instrumented module registers a table of per-function counters
+ * from a global constructor. Functions call plush_profile_enter on entry
+ * and plush_profile_exit before each return. At exit the counters of all
+ * modules are written out, hottest function first.
+ *
+ * PLUSH_PROFILE names the report file (stderr by default) and
+ * PLUSH_PROFILE_FORMAT=json switches from the text table to JSON.
+ *
+ * Modules compiled with --count-blocks register their block counters the
+ * same way. At exit those are written as JSON to PLUSH_BLOCKS
+ * (plush_blocks.json by default), for heat_report.py to read.
+ */
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+typedef struct {
+    const char *name;
+    uint64_t calls;
+    uint64_t nanoseconds; /* Inclusive time of the outermost active calls */
+    uint64_t depth;       /* Active calls, recursive ones are not timed twice */
+} plush_profile_entry;
+
+typedef struct {
+    plush_profile_entry **entries;
+    int32_t count;
+} plush_profile_table;
+
+typedef struct {
+    uint64_t count;
+    const char *file;
+    const char *function;
+    const char *kind; /* then, else, cond, body, or the side of a && or || */
+    int32_t first_line;
+    int32_t last_line;
+} plush_block;
+
+typedef struct {
+    plush_block **blocks;
+    int32_t count;
+} plush_block_table;
+
+static plush_profile_table *tables = NULL;
+static int table_count = 0;
+static plush_block_table *block_tables = NULL;
+static int block_table_count = 0;
+
+static uint64_t now_ns(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (uint64_t)ts.tv_sec * 1000000000u + (uint64_t)ts.tv_nsec;
+}
+
+uint64_t plush_profile_enter(plush_profile_entry *entry) {
+    entry->depth++;
+    return now_ns();
+}
+
+void plush_profile_exit(plush_profile_entry *entry, uint64_t start) {
+    entry->calls++;
+    if (--entry->depth == 0) {
+        entry->nanoseconds += now_ns() - start;
+    }
+}
+
+static int by_time(const void *a, const void *b) {
+    const plush_profile_entry *x = *(plush_profile_entry *const *)a;
+    const plush_profile_entry *y = *(plush_profile_entry *const *)b;
+    if (x->nanoseconds != y->nanoseconds) {
+        return x->nanoseconds < y->nanoseconds ? 1 : -1;
+    }
+    if (x->calls != y->calls) {
+        return x->calls < y->calls ? 1 : -1;
+    }
+    return strcmp(x->name, y->name);
+}
+
+static void write_json_string(FILE *out, const char *text) {
+    fputc('"', out);
+    for (; *text; text++) {
+        if (*text == '"' || *text == '\\') {
+            fputc('\\', out);
+        }
+        fputc(*text, out);
+    }
+    fputc('"', out);
+}
+
+static void plush_profile_report(void) {
+    int total = 0;
+    for (int t = 0; t < table_count; t++) {
+        total += tables[t].count;
+    }
+    plush_profile_entry **entries = malloc(sizeof(*entries) * (total ? total : 1));
+    if (entries == NULL) {
+        return;
+    }
+    int n = 0;
+    for (int t = 0; t < table_count; t++) {
+        for (int i = 0; i < tables[t].count; i++) {
+            entries[n++] = tables[t].entries[i];
+        }
+    }
+    qsort(entries, n, sizeof(*entries), by_time);
+
+    const char *path = getenv("PLUSH_PROFILE");
+    FILE *out = path && *path ? fopen(path, "w") : stderr;
+    if (out == NULL) {
+        out = stderr;
+    }
+    const char *format = getenv("PLUSH_PROFILE_FORMAT");
+    if (format && strcmp(format, "json") == 0) {
+        fprintf(out, "{\"functions\": [");
+        for (int i = 0; i < n; i++) {
+            fprintf(out, "%s\n  {\"name\": ", i ? "," : "");
+            write_json_string(out, entries[i]->name);
+            fprintf(out, ", \"calls\": %llu, \"ns\": %llu}",
+                    (unsigned long long)entries[i]->calls, (unsigned long long)entries[i]->nanoseconds);
+        }
+        fprintf(out, "\n]}\n");
+    } else {
+        fprintf(out, "%-24s %12s %14s %12s\n", "function", "calls", "total ms", "avg us");
+        for (int i = 0; i < n; i++) {
+            double total_ms = entries[i]->nanoseconds / 1e6;
+            double average_us = entries[i]->calls ? entries[i]->nanoseconds / 1e3 / entries[i]->calls : 0.0;
+            fprintf(out, "%-24s %12llu %14.3f %12.3f\n", entries[i]->name,
+                    (unsigned long long)entries[i]->calls, total_ms, average_us);
+        }
+    }
+    if (out != stderr) {
+        fclose(out);
+    }
+    free(entries);
+}
+
+void plush_profile_register(plush_profile_entry **entries, int32_t count) {
+    plush_profile_table *grown = realloc(tables, sizeof(*tables) * (table_count + 1));
+    if (grown == NULL) {
+        return;
+    }
+    tables = grown;
+    tables[table_count].entries = entries;
+    tables[table_count].count = count;
+    if (table_count++ == 0) {
+        atexit(plush_profile_report);
+    }
+}
+
+static void plush_blocks_report(void) {
+    const char *path = getenv("PLUSH_BLOCKS");
+    FILE *out = fopen(path && *path ? path : "plush_blocks.json", "w");
+    if (out == NULL) {
+        return;
+    }
+    fprintf(out, "{\"blocks\": [");
+    int n = 0;
+    for (int t = 0; t < block_table_count; t++) {
+        for (int i = 0; i < block_tables[t].count; i++) {
+            plush_block *block = block_tables[t].blocks[i];
+            fprintf(out, "%s\n  {\"file\": ", n++ ? "," : "");
+            write_json_string(out, block->file);
+            fprintf(out, ", \"function\": ");
+            write_json_string(out, block->function);
+            fprintf(out, ", \"kind\": ");
+            write_json_string(out, block->kind);
+            fprintf(out, ", \"first_line\": %d, \"last_line\": %d, \"count\": %llu}",
+                    block->first_line, block->last_line, (unsigned long long)block->count);
+        }
+    }
+    fprintf(out, "\n]}\n");
+    fclose(out);
+}
+
+void plush_blocks_register(plush_block **blocks, int32_t count) {
+    plush_block_table *grown = realloc(block_tables, sizeof(*block_tables) * (block_table_count + 1));
+    if (grown == NULL) {
+        return;
+    }
+    block_tables = grown;
+    block_tables[block_table_count].blocks = blocks;
+    block_tables[block_table_count].count = count;
+    if (block_table_count++ == 0) {
+        atexit(plush_blocks_report);
+    }
+}
@@ -0,0 +1,21 @@
+# Misplaced and unknown annotations, and @memo on an impure function, are
+# rejected by the checker, run with
+# python3 compiler.py --typecheck_print scripts/invalid/annotations.pl
+
+var counter : int := 0;
+
+@memo
+function impure(val x : int) : int {
+    counter := counter + x;
+    impure := counter;
+}
+
+@cache
+function unknown(val x : int) : int {
+    unknown := x;
+}
+
+@memo
+function main(val args:[string]) {
+    print_int(impure(1) + unknown(2));
+}
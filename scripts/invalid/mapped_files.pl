@@ -0,0 +1,19 @@
+# Writes to mapped files and misused mapping builtins are rejected by the
+# checker, run with
+# python3 compiler.py --typecheck_print scripts/invalid/mapped_files.pl
+val global_values : [int] := mmap_ints("scripts/valid/test13.bin");
+
+function fill(val values : [int]) : int {
+    values[0] := 1;
+    fill := 0;
+}
+
+function main(val args:[string]) {
+    val values : [int] := mmap_ints("scripts/valid/test13.bin");
+    val doubles : [double] := mmap_ints("scripts/valid/test13.bin");
+    values[0] := 2;
+    var got : int := read_ints_into(values, 3);
+    got := fill(values);
+    var n : int := 4;
+    got := array_length(n);
+}
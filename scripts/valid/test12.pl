@@ -0,0 +1,53 @@
+# Reads numbers from test12.in, run as: ./plush scripts/valid/test12.pl --exec < scripts/valid/test12.in
+function print_ints(val values : [int], val count : int) {
+    var i : int := 0;
+    while i < count {
+        print_int(values[i]);
+        i := i + 1;
+    }
+}
+
+function main(val args:[string]) {
+    # One number at a time, a sign with no digit after it is skipped
+    print_string("read_int:");
+    var i : int := 0;
+    while i < 4 {
+        print_int(read_int());
+        i := i + 1;
+    }
+
+    # Stray points and an exponent with no digits are skipped too
+    print_string("read_double:");
+    i := 0;
+    while i < 4 {
+        print_double(read_double());
+        i := i + 1;
+    }
+
+    # Asking for more numbers than the array holds fills it and stops
+    print_string("read_ints_into:");
+    var chunk : [4]int;
+    var got : int := read_ints_into(chunk, 10);
+    print_int(got);
+    print_ints(chunk, got);
+    got := read_ints_into(chunk, 3);
+    print_int(got);
+    print_ints(chunk, got);
+
+    # The input ends in a truncated number, fewer than asked for are read
+    print_string("read_doubles_into:");
+    var values : [6]double;
+    got := read_doubles_into(values, 6);
+    print_int(got);
+    i := 0;
+    while i < got {
+        print_double(values[i]);
+        i := i + 1;
+    }
+
+    # At the end of the input
+    print_string("end of input:");
+    print_int(read_int());
+    print_double(read_double());
+    print_int(read_ints_into(chunk, 4));
+}
@@ -0,0 +1,50 @@
+# Maps test13.bin, ten ints, and test13_doubles.bin, four doubles, as
+# arrays. Paths are relative to the repository root, run it from there.
+function sum(val values : [int]) : int {
+    var total : int := 0;
+    var i : int := 0;
+    while i < array_length(values) {
+        total := total + values[i];
+        i := i + 1;
+    }
+    sum := total;
+}
+
+# Returns from two places, the file is unmapped at both
+function count_above(val limit : int) : int {
+    val values : [int] := mmap_ints("scripts/valid/test13.bin");
+    var count : int := 0;
+    var i : int := 0;
+    while i < array_length(values) {
+        if values[i] > limit {
+            count := count + 1;
+        }
+        i := i + 1;
+    }
+    if count == 0 {
+        return 0;
+    }
+    count_above := count;
+}
+
+function main(val args:[string]) {
+    val values : [int] := mmap_ints("scripts/valid/test13.bin");
+    print_int(array_length(values));
+    print_int(values[5]);
+    # A mapped array can go to a function that only reads it
+    print_int(sum(values));
+
+    # Each iteration unmaps the previous mapping before mapping again
+    var k : int := 0;
+    while k < 3 {
+        val doubles : [double] := mmap_doubles("scripts/valid/test13_doubles.bin");
+        print_double(doubles[k] + doubles[array_length(doubles) - 1]);
+        k := k + 1;
+    }
+
+    print_int(count_above(2));
+    print_int(count_above(100));
+
+    var fixed : [5]int;
+    print_int(array_length(fixed));
+}
@@ -0,0 +1,95 @@
+# Arrays passed to functions: a pointer and the length of each dimension
+var global_values : [int] := [5, 6, 7];
+var global_grid : [2][3]int;
+
+function sum(val values : [int], val count : int) : int {
+    var total : int := 0;
+    var i : int := 0;
+    while i < count {
+        total := total + values[i];
+        i := i + 1;
+    }
+    sum := total;
+}
+
+# Forwards its parameter to another function
+function sum_twice(val values : [int], val count : int) : int {
+    sum_twice := sum(values, count) * 2;
+}
+
+# Writes through the parameter are seen by the caller
+function fill(val values : [int], val count : int, val start : int) {
+    var i : int := 0;
+    while i < count {
+        values[i] := start + i;
+        i := i + 1;
+    }
+}
+
+# Row-major indexing with the column count passed along with the pointer
+function fill_grid(val grid : [[int]], val rows : int, val cols : int) {
+    var i : int := 0;
+    while i < rows {
+        var j : int := 0;
+        while j < cols {
+            grid[i][j] := i * 10 + j;
+            j := j + 1;
+        }
+        i := i + 1;
+    }
+}
+
+function grid_sum(val grid : [[int]], val rows : int, val cols : int) : int {
+    var total : int := 0;
+    var i : int := 0;
+    while i < rows {
+        var j : int := 0;
+        while j < cols {
+            total := total + grid[i][j] * (j + 1);
+            j := j + 1;
+        }
+        i := i + 1;
+    }
+    grid_sum := total;
+}
+
+function scale(val values : [double], val count : int, val factor : double) : double {
+    var i : int := 0;
+    var total : double := 0.0;
+    while i < count {
+        values[i] := values[i] * factor;
+        total := total + values[i];
+        i := i + 1;
+    }
+    scale := total;
+}
+
+function main(val args:[string]) {
+    # A literal array on the stack
+    var local_values : [int] := [1, 2, 3, 4];
+    print_int(sum(local_values, 4));
+    print_int(sum_twice(local_values, 4));
+
+    # Above the stack array limit, so allocated on the heap
+    var heap_values : [20000]int;
+    fill(heap_values, 20000, 1);
+    print_int(heap_values[19999]);
+    print_int(sum(heap_values, 20000));
+
+    # Globals
+    print_int(sum(global_values, 3));
+    fill(global_values, 3, 100);
+    print_int(global_values[2]);
+    fill_grid(global_grid, 2, 3);
+    print_int(global_grid[1][2]);
+
+    # Two dimensions through a parameter
+    var grid : [3][4]int;
+    fill_grid(grid, 3, 4);
+    print_int(grid[2][3]);
+    print_int(grid_sum(grid, 3, 4));
+
+    var doubles : [double] := [0.5, 1.5, 2.5];
+    print_double(scale(doubles, 3, 2.0));
+    print_double(doubles[1]);
+}
@@ -0,0 +1,49 @@
+# Memoized functions. fib and paths are marked @memo; tribonacci is
+# only cached when compiled with --auto-memo. The results do not depend
+# on the memo table size or policy.
+@memo
+function fib(val n : int) : int {
+    if n < 2 {
+        fib := n;
+    } else {
+        fib := fib(n - 1) + fib(n - 2);
+    }
+}
+
+# Lattice paths to (x, y), with diagonal steps too when diagonal is
+# true. The double and bool arguments are part of the cache key.
+@memo
+function paths(val x : double, val y : double, val diagonal : bool) : double {
+    val one : double := 1.0;
+    if x < 0.5 {
+        paths := one;
+    } else {
+        if y < 0.5 {
+            paths := one;
+        } else {
+            var total : double := paths(x - 1.0, y, diagonal) + paths(x, y - 1.0, diagonal);
+            if diagonal {
+                total := total + paths(x - 1.0, y - 1.0, diagonal);
+            }
+            paths := total;
+        }
+    }
+}
+
+function tribonacci(val n : int) : int {
+    if n < 3 {
+        tribonacci := 1;
+    } else {
+        tribonacci := tribonacci(n - 1) + tribonacci(n - 2) + tribonacci(n - 3);
+    }
+}
+
+function main(val args:[string]) {
+    print_int(fib(40));
+    print_int(fib(10));
+    print_double(paths(16.0, 16.0, false));
+    print_double(paths(12.0, 12.0, true));
+    # Same numbers, other flag: a separate cache entry
+    print_double(paths(12.0, 12.0, false));
+    print_int(tribonacci(24));
+}
@@ -0,0 +1,116 @@
+"""
+Timed spans in the Chrome trace-event format, to open in Perfetto
+(https://ui.perfetto.dev) or chrome://tracing.
+
+compiler.py --trace-out records its stages and declarations with a Tracer.
+The plush driver records its own subprocess spans as one JSON event per
+line and merges everything into a single trace with:
+
+Usage: python tracing.py OUT.json TRACE.json|EVENTS...
+"""
+import os
+import sys
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+def now_us():
+    # Wall clock microseconds, the same clock the driver reads
+    return time.time_ns() // 1000
+
+class Tracer:
+    """Collects nested timed spans of one process. A disabled tracer records nothing."""
+    def __init__(self, enabled=True, process_name="compiler.py"):
+        self.enabled = enabled
+        self.process_name = process_name
+        self.pid = os.getpid()
+        self.events = []
+
+    @contextmanager
+    def span(self, name, category="compiler", **args):
+        if not self.enabled:
+            yield
+            return
+        start = now_us()
+        try:
+            yield
+        finally:
+            # Complete events nest by time, children may come before their parent
+            event = {"name": name, "cat": category, "ph": "X", "ts": start, "dur": now_us() - start,
+                     "pid": self.pid, "tid": self.pid}
+            if args:
+                event["args"] = args
+            self.events.append(event)
+
+    def trace(self):
+        process = {"name": "process_name", "ph": "M", "pid": self.pid, "tid": self.pid,
+                   "args": {"name": self.process_name}}
+        return {"traceEvents": [process] + self.events, "displayTimeUnit": "ms"}
+
+    def write(self, path):
+        with open(path, "w") as f:
+            json.dump(self.trace(), f)
+
+class AllocationTracer(Tracer):
+    """
+    A tracer that also follows memory with tracemalloc, which must be
+    tracing. Each compiler stage, an outermost "compiler" span, records how
+    much it left allocated, its peak above that, and the source lines whose
+    allocations grew the most.
+    """
+    def __init__(self, top=10, enabled=True, process_name="compiler.py"):
+        super().__init__(enabled, process_name)
+        self.top = top
+        self.phases = []  # (name, bytes left allocated, peak bytes, top StatisticDiffs)
+        self.in_phase = False
+        # tracemalloc's own snapshots are not the compiler's allocations
+        self.filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+
+    @contextmanager
+    def span(self, name, category="compiler", **args):
+        if self.in_phase or category != "compiler" or not tracemalloc.is_tracing():
+            with super().span(name, category, **args):
+                yield
+            return
+        self.in_phase = True
+        before = tracemalloc.take_snapshot().filter_traces(self.filters)
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        try:
+            with super().span(name, category, **args):
+                yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(self.filters)
+            sites = [stat for stat in after.compare_to(before, "lineno") if stat.size_diff > 0][:self.top]
+            self.phases.append((name, current - start, peak - start, sites))
+            self.in_phase = False
+
+    def report(self):
+        """Lines describing each phase and its top allocation sites."""
+        lines = []
+        for name, net, peak, sites in self.phases:
+            lines.append(f"{name}: {net / 1024:+.1f} KiB left allocated, peak {peak / 1024:.1f} KiB")
+            for stat in sites:
+                frame = stat.traceback[0]
+                lines.append(f"  {stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8d} blocks  {frame.filename}:{frame.lineno}")
+        return lines
+
+def merge(out_path, paths):
+    """Write one trace with the events of traces (.json) and event-per-line files."""
+    events = []
+    for path in paths:
+        with open(path) as f:
+            if path.endswith(".json"):
+                events.extend(json.load(f)["traceEvents"])
+            else:
+                events.extend(json.loads(line) for line in f if line.strip())
+    with open(out_path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(1)
+    merge(sys.argv[1], sys.argv[2:])
@@ -26,6 +26,7 @@ class FunctionStatement(ASTNode):
     parameters: List['Parameter']
     return_type: str
     body: Union['StatementBlock', List[Statement]]
+    annotations: List[str] = field(default_factory=list)  # e.g. ['memo'] for @memo
 
     def __post_init__(self):
         self.add_self_return()
@@ -53,6 +54,7 @@ class MainFunctionStatement(ASTNode):
     parameters: List['Parameter']
     return_type: str
     body: 'StatementBlock'
+    annotations: List[str] = field(default_factory=list)  # Reported by the checker, main takes none
 
 @dataclass
 class FunctionDeclaration(ASTNode):
@@ -178,6 +180,32 @@ class PrintfStatement:
     format_string: str
     arguments: List['Expression']
     
+# Reads the next number from stdin, read_int() or read_double()
+@dataclass
+class ReadExpression(ASTNode):
+    read_type: str  # 'int' or 'double'
+
+# Reads up to `count` numbers from stdin into an array, yields how many were read
+@dataclass
+class ReadIntoExpression(ASTNode):
+    read_type: str  # 'int' or 'double', the element type of the array
+    target: str
+    count: 'Expression'
+
+# A file mapped read-only as an array, `val data : [int] := mmap_ints("data.bin");`
+@dataclass
+class MappedArrayDeclaration(ASTNode):
+    var_kind: str  # 'val'
+    name: str
+    data_type: List[str]
+    map_type: str  # 'int' or 'double', from mmap_ints or mmap_doubles
+    path: 'Expression'
+
+# The number of elements in the first dimension of an array, array_length(a)
+@dataclass
+class ArrayLength(ASTNode):
+    name: str
+
 @dataclass
 class ExpressionStatement(ASTNode):
     expression: 'Expression'
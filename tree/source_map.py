@@ -0,0 +1,84 @@
+from array import array
+from bisect import bisect_right
+
+class SourceMap:
+    """
+    Source spans of AST nodes, kept out of the nodes themselves.
+
+    Each parsed node gets a single `span` attribute, an index into three
+    parallel arrays: the file it came from and its start and end offsets
+    (the end is one past its last character). Lines and columns are only
+    computed on lookup, from the offsets of each file's line starts.
+    Lines and columns count from 1.
+    """
+    def __init__(self):
+        self.filenames = []
+        self.line_starts = []  # Per file, the offset of each line's first character
+        self.files = array('H')
+        self.starts = array('I')
+        self.ends = array('I')
+
+    def add_file(self, filename, source):
+        """Register a source file, returns its file index."""
+        line_starts = array('I', [0])
+        offset = source.find("\n")
+        while offset != -1:
+            line_starts.append(offset + 1)
+            offset = source.find("\n", offset + 1)
+        self.filenames.append(filename)
+        self.line_starts.append(line_starts)
+        return len(self.filenames) - 1
+
+    def add(self, node, file, start, end):
+        """Record the span of `node`, returns the node."""
+        node.span = len(self.starts)
+        self.files.append(file)
+        self.starts.append(start)
+        self.ends.append(end)
+        return node
+
+    def add_span(self, file, start, end):
+        """Record a span that has no node of its own, like a block, returns its index."""
+        self.files.append(file)
+        self.starts.append(start)
+        self.ends.append(end)
+        return len(self.starts) - 1
+
+    def span_of(self, node):
+        return getattr(node, "span", None)
+
+    def line_column(self, file, offset):
+        line_starts = self.line_starts[file]
+        line = bisect_right(line_starts, offset)
+        return line, offset - line_starts[line - 1] + 1
+
+    def location(self, span):
+        """(filename, line, column) where the span starts."""
+        file = self.files[span]
+        return (self.filenames[file],) + self.line_column(file, self.starts[span])
+
+    def lines(self, span):
+        """First and last line of the span."""
+        file = self.files[span]
+        first, _ = self.line_column(file, self.starts[span])
+        last, _ = self.line_column(file, max(self.ends[span] - 1, self.starts[span]))
+        return first, last
+
+    def node_lines(self, node, default=(0, 0)):
+        span = self.span_of(node)
+        return default if span is None else self.lines(span)
+
+    def describe(self, node):
+        """`file:line:column` of a node, None for nodes built outside the parser."""
+        span = self.span_of(node)
+        if span is None:
+            return None
+        filename, line, column = self.location(span)
+        return f"{filename}:{line}:{column}"
+
+if __name__ == "__main__":
+    source_map = SourceMap()
+    file = source_map.add_file("example.pl", "var x : int := 1;\nx := x +\n  2;\n")
+    statement = source_map.add_span(file, 18, 30)
+    print(source_map.location(statement))  # ('example.pl', 2, 1)
+    print(source_map.lines(statement))  # (2, 3)
@@ -0,0 +1,37 @@
+from types import GeneratorType
+
+def trampoline(root, dispatch=None):
+    """
+    Runs a recursive tree walker on an explicit stack.
+
+    Walker steps are generators. A step yields either another generator,
+    which is run to completion first, or a node, which is passed to
+    `dispatch` (a plain value or a generator). The child's return value is
+    sent back into the step that yielded it, so `value = yield child` reads
+    like a recursive call without growing the Python call stack.
+    """
+    current = _enter(root, dispatch)
+    if not isinstance(current, GeneratorType):
+        return current
+
+    stack = [current]
+    value = None
+    while stack:
+        try:
+            child = stack[-1].send(value)
+        except StopIteration as stop:
+            stack.pop()
+            value = stop.value
+            continue
+        child = _enter(child, dispatch)
+        if isinstance(child, GeneratorType):
+            stack.append(child)
+            value = None
+        else:
+            value = child
+    return value
+
+def _enter(item, dispatch):
+    if isinstance(item, GeneratorType) or dispatch is None:
+        return item
+    return dispatch(item)